@@ -2,7 +2,7 @@
 
 import typer
 
-from aether.commands import init, coordinate, config, run, agent, lock
+from aether.commands import init, coordinate, config, run, agent, lock, collect, sessions, serve
 
 app = typer.Typer(
     name="aether",
@@ -18,6 +18,9 @@ app.command()(agent.agent)
 app.command(name="lock")(lock.lock)
 app.command(name="unlock")(lock.unlock)
 app.command(name="locks")(lock.locks)
+app.command()(collect.collect)
+app.command()(serve.serve)
+app.add_typer(sessions.app, name="sessions")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""Thin client for ``aether serve``.
+
+    from aether.client import AetherClient
+
+    with AetherClient() as client:          # .aether/aether.sock
+        if client.lock("src/app.py", role="analyst")["acquired"]:
+            ...
+            client.unlock("src/app.py")
+        code, output = client.command("coordinate", "add caching")
+
+The connection is kept alive between calls, so each request costs one
+round trip rather than a process start.  Over TCP the client sends the
+server's token, read from ``.aether/serve-<port>.token`` unless given.
+"""
+
+import http.client
+import json
+import socket
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from aether.server import DEFAULT_SOCKET, token_path
+
+
+class ServerError(Exception):
+    """The server rejected a request or could not be reached."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(f"{status}: {message}")
+        self.status = status
+
+
+class _UnixConnection(http.client.HTTPConnection):
+    def __init__(self, path: str, timeout: float):
+        super().__init__("localhost", timeout=timeout)
+        self._path = path
+
+    def connect(self) -> None:
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self._path)
+
+
+class AetherClient:
+    """Keep-alive connection to a running ``aether serve``."""
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        port: Optional[int] = None,
+        host: str = "127.0.0.1",
+        timeout: float = 300.0,
+        token: Optional[str] = None,
+    ):
+        self._token = token
+        if port is not None:
+            self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+            if token is None:
+                try:
+                    self._token = token_path(port).read_text().strip()
+                except FileNotFoundError:
+                    pass  # The server will answer 401
+        else:
+            self._conn = _UnixConnection(str(socket_path or DEFAULT_SOCKET), timeout)
+
+    def request(self, path: str, payload: Optional[dict] = None) -> dict:
+        method = "GET" if payload is None else "POST"
+        body = None if payload is None else json.dumps(payload)
+        headers = {"Content-Type": "application/json"} if body else {}
+        if self._token:
+            headers["Authorization"] = f"Bearer {self._token}"
+        for attempt in (1, 2):
+            try:
+                self._conn.request(method, path, body=body, headers=headers)
+                response = self._conn.getresponse()
+                data = json.loads(response.read() or b"{}")
+                break
+            except (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                self._conn.close()  # Server dropped an idle keep-alive; reconnect once
+                if attempt == 2:
+                    raise
+            except (FileNotFoundError, ConnectionRefusedError) as exc:
+                raise ServerError(0, f"aether serve is not running ({exc})") from None
+        if response.status != 200:
+            raise ServerError(response.status, data.get("error", response.reason))
+        return data
+
+    def health(self) -> dict:
+        return self.request("/health")
+
+    def lock(self, filepath: str, role: str, cli_tool: Optional[str] = None, force: bool = False) -> dict:
+        """Return ``{"acquired": bool, "holder": lock info}``."""
+        return self.request("/lock", {"file": filepath, "role": role, "cli": cli_tool, "force": force})
+
+    def unlock(self, filepath: str, token: Optional[int] = None) -> Optional[dict]:
+        return self.request("/unlock", {"file": filepath, "token": token})["released"]
+
+    def is_locked(self, filepath: str) -> Optional[dict]:
+        return self.request("/is-locked", {"file": filepath})["lock"]
+
+    def list_locks(self) -> List[dict]:
+        return self.request("/locks", {})["locks"]
+
+    def run(
+        self,
+        filepath: Optional[str] = None,
+        args: Optional[List[str]] = None,
+        memo: bool = False,
+    ) -> Tuple[int, str]:
+        result = self.request("/run", {"file": filepath, "args": args or [], "memo": memo})
+        return result["exit_code"], result["output"]
+
+    def command(self, *argv: str) -> Tuple[int, str]:
+        """Run ``aether <argv>`` on the server; return (exit code, output)."""
+        result = self.request("/command", {"argv": list(argv)})
+        return result["exit_code"], result["output"]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "AetherClient":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
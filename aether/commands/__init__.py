@@ -1,3 +1,3 @@
 """Aether CLI commands."""
 
-from aether.commands import init as init, coordinate as coordinate, config as config, run as run, agent as agent, lock as lock
+from aether.commands import init as init, coordinate as coordinate, config as config, run as run, agent as agent, lock as lock, collect as collect, sessions as sessions, serve as serve
@@ -0,0 +1,46 @@
+"""Collect command - gather role outcomes from a launched coordinator session."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+from aether.utils import sessions as _sessions
+from aether.utils.outcomes import OutcomeCollector
+
+_PANES_DIR = Path(".aether") / "panes"
+
+
+def collect(
+    session: Optional[str] = typer.Option(
+        None, "--session", "-s", help="Session to collect from (default: most recent)"
+    ),
+    fmt: str = typer.Option(
+        "summary", "--format", "-f", help="Output: summary, json or markdown"
+    ),
+):
+    """Gather completed role outcomes from captured pane output"""
+    session = session or _sessions.latest() or "dana-dev"
+    log_dir = _PANES_DIR / session
+    if not log_dir.exists():
+        typer.echo(f"✗ No captured output for session '{session}' in {log_dir}")
+        typer.echo("  Launch with `aether coordinate '<task>' --launch` first.")
+        raise typer.Exit(1)
+
+    collector = OutcomeCollector(log_dir, session)
+    new = collector.collect()
+    collector.save()
+
+    if fmt == "json":
+        typer.echo(json.dumps(collector.doc, indent=2))
+    elif fmt == "markdown":
+        typer.echo(collector.to_markdown())
+    else:
+        if new:
+            roles = ", ".join(sorted({o["role"] for o in new}))
+            typer.echo(f"✓ {len(new)} new outcome(s): {roles}")
+        else:
+            typer.echo("No new outcomes since the last collect.")
+        total = sum(len(v) for v in collector.doc["roles"].values())
+        typer.echo(f"  {total} outcome(s) in {collector.doc_path}")
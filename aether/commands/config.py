@@ -1,38 +1,45 @@
 """Config command - manage API keys."""
 
 import os
-from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
-from aether.utils import load_env
+from aether.utils import child_env, load_env, set_env_key
 
 PROVIDER_INFO = {
     "openrouter": {
         "env": "OPENROUTER_API_KEY",
         "url": "https://openrouter.ai/keys",
         "models": ["openrouter:gpt-4o-mini", "openrouter:gpt-4o"],
+        "api_base": "https://openrouter.ai/api/v1",
+        "api_models": {"openrouter:gpt-4o-mini": "openai/gpt-4o-mini", "openrouter:gpt-4o": "openai/gpt-4o"},
     },
     "openai": {
         "env": "OPENAI_API_KEY",
         "url": "https://platform.openai.com/api-keys",
         "models": ["openai:gpt-4o", "openai:gpt-4o-mini"],
+        "api_base": "https://api.openai.com/v1",
     },
     "anthropic": {
         "env": "ANTHROPIC_API_KEY",
         "url": "https://console.anthropic.com/settings/keys",
         "models": ["anthropic:claude-3-5-sonnet"],
+        "api_base": "https://api.anthropic.com/v1",
+        "api_models": {"anthropic:claude-3-5-sonnet": "claude-3-5-sonnet-latest"},
     },
     "groq": {
         "env": "GROQ_API_KEY",
         "url": "https://console.groq.com/keys",
         "models": ["groq:llama3-70b"],
+        "api_base": "https://api.groq.com/openai/v1",
+        "api_models": {"groq:llama3-70b": "llama3-70b-8192"},
     },
     "google": {
         "env": "GOOGLE_API_KEY",
         "url": "https://aistudio.google.com/app/apikey",
         "models": ["google:gemini-1.5-pro"],
+        "api_base": "https://generativelanguage.googleapis.com/v1beta/openai",
     },
 }
 
@@ -49,8 +56,37 @@ def config(
     env_file: Optional[str] = typer.Option(
         None, "--env", "-e", help="Path to .env file to load"
     ),
+    probe: bool = typer.Option(
+        False, "--probe", help="Check keys and measure latency of every configured provider's models"
+    ),
+    timeout: Optional[float] = typer.Option(
+        None, "--timeout", help="Seconds to wait for each probe (default: 20)"
+    ),
+    concurrency: Optional[int] = typer.Option(
+        None, "--concurrency", help="Maximum probes in flight (default: 4)"
+    ),
+    rate: Optional[float] = typer.Option(
+        None, "--rate", help="Maximum probes started per second, per provider (default: 2)"
+    ),
+    base_url: Optional[str] = typer.Option(
+        None, "--base-url", help="Send every probe to this OpenAI-compatible endpoint (e.g. a local mock)"
+    ),
+    refresh: bool = typer.Option(
+        False, "--refresh", help="Ignore cached probe results"
+    ),
 ):
     """Configure LLM API keys for Dana"""
+    if probe:
+        if provider and provider not in PROVIDER_INFO:
+            typer.echo(f"Unknown provider: {provider}")
+            typer.echo(f"Available: {', '.join(PROVIDER_INFO.keys())}")
+            raise typer.Exit(1)
+        _run_probe(
+            [provider] if provider else list(PROVIDER_INFO),
+            timeout, concurrency, rate, base_url, refresh,
+        )
+        return
+
     if env_file:
         if os.path.exists(env_file):
             load_env(env_file)
@@ -77,17 +113,12 @@ def config(
             return
         info = PROVIDER_INFO[provider]
         if api_key:
-            os.environ[info["env"]] = api_key
-
-            env_path = Path(".env")
-            if env_path.exists():
-                with open(env_path, "a") as f:
-                    f.write(f"\n{info['env']}={api_key}\n")
-                typer.echo(f"✓ Set {info['env']} and appended to .env")
-            else:
-                with open(env_path, "w") as f:
-                    f.write(f"{info['env']}={api_key}\n")
+            # Only the file: this may run inside a long-lived `aether serve`,
+            # whose environment would otherwise shadow later .env edits
+            if set_env_key(info["env"], api_key, ".env"):
                 typer.echo(f"✓ Created .env with {info['env']}")
+            else:
+                typer.echo(f"✓ Set {info['env']} in .env")
 
             typer.echo("\nRun Dana with: aether run <file.na>")
         else:
@@ -124,3 +155,73 @@ Example with OpenRouter (recommended - cheap, many models):
   aether config -p openrouter -k 'sk-or-v1-...'
 """
     )
+
+
+def _probe_targets(providers: List[str], env: dict, base_url: Optional[str]) -> tuple:
+    """Split *providers* into probe targets and the names skipped for lack of a key."""
+    targets, skipped = [], []
+    for name in providers:
+        info = PROVIDER_INFO[name]
+        key = env.get(info["env"])
+        if not key:
+            skipped.append(name)
+            continue
+        for model in info["models"]:
+            targets.append({
+                "provider": name,
+                "model": model,
+                "api_model": info.get("api_models", {}).get(model, model.split(":", 1)[-1]),
+                "api_base": base_url or info["api_base"],
+                "api_key": key,
+            })
+    return targets, skipped
+
+
+def _run_probe(
+    providers: List[str],
+    timeout: Optional[float],
+    concurrency: Optional[int],
+    rate: Optional[float],
+    base_url: Optional[str],
+    refresh: bool,
+) -> None:
+    # Imported here: asyncio and ssl would add ~30ms to every aether start-up
+    from aether.utils import probe as _probe
+
+    timeout = _probe.DEFAULT_TIMEOUT if timeout is None else timeout
+    concurrency = _probe.DEFAULT_CONCURRENCY if concurrency is None else concurrency
+    rate = _probe.DEFAULT_RATE if rate is None else rate
+    ttl = 0 if refresh else _probe.DEFAULT_TTL_SECONDS
+
+    targets, skipped = _probe_targets(providers, child_env(".env"), base_url)
+    if not targets:
+        typer.echo("✗ No API keys set — nothing to probe")
+        typer.echo("  Set one with: aether config -p <provider> -k 'YOUR-KEY'")
+        raise typer.Exit(1)
+
+    typer.echo(f"ℹ Probing {len(targets)} model(s) (timeout {timeout:g}s)...")
+    results = _probe.probe(targets, timeout=timeout, concurrency=concurrency, rate=rate, ttl=ttl)
+
+    def ms(value):
+        return f"{value:.0f}ms" if value is not None else "-"
+
+    typer.echo(f"\n{'PROVIDER':<12} {'MODEL':<30} {'STATUS':<13} {'TTFT':>7} {'TOK/S':>7} {'TOTAL':>7}")
+    for r in results:
+        status = {"ok": "✓ ok", "auth": "✗ invalid key", "timeout": "⚠ timeout"}.get(r["status"], "✗ error")
+        tps = f"{r['tokens_per_s']:.0f}" if r["tokens_per_s"] else "-"
+        note = " (cached)" if r.get("cached") else ""
+        typer.echo(
+            f"{r['provider']:<12} {r['model']:<30} {status:<13} "
+            f"{ms(r['ttft_ms']):>7} {tps:>7} {ms(r['total_ms']):>7}{note}"
+        )
+        if r["status"] != "ok" and r.get("error"):
+            typer.echo(f"{'':<12}   {r['error']}")
+    for name in skipped:
+        typer.echo(f"{name:<12} {'-':<30} - no key")
+
+    best = _probe.fastest(results)
+    if best is None:
+        typer.echo("\n✗ No provider answered successfully")
+        raise typer.Exit(1)
+    typer.echo(f"\n✓ Fastest: {best['model']} (TTFT {ms(best['ttft_ms'])})")
+    typer.echo(f"  Use it with: DANA_MODEL={best['model']}")
@@ -1,39 +1,44 @@
 """Coordinate command - task splitting and tmux orchestration for multi-CLI teams."""
 
-import json
 import re
+import threading
 from pathlib import Path
 from typing import Optional
 
 import typer
 
+from aether.utils import sessions as _sessions
 from aether.utils import tmux as _tmux
+from aether.utils.briefs import RoleSet, load_role_set
+from aether.utils.scheduler import CliPool, Job, Scheduler, load_limits, role_candidates
 
 
 _DEFAULT_ROLES_PATH = Path(".aether") / "roles.json"
+_PANES_DIR = Path(".aether") / "panes"
 
+_DEFAULT_ROLES = {
+    "researcher": {"description": "Gathers domain knowledge.", "cli": "gemini"},
+    "analyst": {"description": "Finds patterns and insights.", "cli": "claude"},
+    "critic": {"description": "Reviews outputs for gaps.", "cli": "claude"},
+    "integrator": {"description": "Merges outputs into final deliverable.", "cli": "opencode"},
+}
 
-def _load_roles(roles_path: Path) -> dict:
-    if not roles_path.exists():
+
+def _load_roles(roles_path: Path) -> RoleSet:
+    try:
+        role_set = load_role_set(roles_path)
+    except ValueError as exc:
+        typer.echo(f"✗ {exc}")
+        raise typer.Exit(1)
+    if role_set is None:
         typer.echo(f"⚠ roles.json not found at {roles_path}  (using built-in defaults)")
-        return {
-            "researcher": {"description": "Gathers domain knowledge.", "cli": "gemini"},
-            "analyst": {"description": "Finds patterns and insights.", "cli": "claude"},
-            "critic": {"description": "Reviews outputs for gaps.", "cli": "claude"},
-            "integrator": {"description": "Merges outputs into final deliverable.", "cli": "opencode"},
-        }
-    return json.loads(roles_path.read_text())
+        return RoleSet(_DEFAULT_ROLES)
+    return role_set
 
 
 def _outcome_brief(role: str, description: str, task: str) -> str:
     """Generate an outcome-focused brief for a role — never prescriptive."""
-    return (
-        f"[{role.upper()}] Task: {task}\n\n"
-        f"Your role: {description}\n\n"
-        f"Deliver a clear, concrete outcome relevant to your expertise. "
-        f"Do not wait for instructions on *how* — you are the expert. "
-        f"Return your findings when ready."
-    )
+    return RoleSet({role: {"description": description}}).brief(role, task)
 
 
 def coordinate(
@@ -47,13 +52,37 @@ def coordinate(
     dana_intent: bool = typer.Option(
         False, "--dana-intent", help="Output a ready-to-use Dana intent block"
     ),
+    capture: bool = typer.Option(
+        True,
+        "--capture/--no-capture",
+        help="With --launch, stream pane output to .aether/panes/ for `aether collect`",
+    ),
+    session: Optional[str] = typer.Option(
+        None, "--session", "-s", help="tmux session name (default: derived from the task)"
+    ),
+    attach: bool = typer.Option(
+        True,
+        "--attach/--no-attach",
+        help="With --launch, attach to the session (--no-attach waits for all briefs instead)",
+    ),
+    wait: bool = typer.Option(
+        True,
+        "--wait/--no-wait",
+        hidden=True,
+        help="With --no-attach, return once briefs are dispatched (for long-lived callers such as aether serve)",
+    ),
+    max_panes: int = typer.Option(
+        _sessions.max_panes(),
+        "--max-panes",
+        help="Refuse to launch if live aether sessions would exceed this many panes",
+    ),
 ):
     """Coordinate a task across multi-CLI agent teams"""
     roles_path = roles or _DEFAULT_ROLES_PATH
-    all_roles = _load_roles(roles_path)
+    role_set = _load_roles(roles_path)
 
     # Strip coordinator from worker roles
-    worker_roles = {k: v for k, v in all_roles.items() if k != "coordinator"}
+    worker_roles = {k: v for k, v in role_set.roles.items() if k != "coordinator"}
 
     if dana_intent:
         typer.echo("\nDana intent block (paste into .na file):")
@@ -66,17 +95,21 @@ def coordinate(
 
     typer.echo(f"\nCoordinating: {task}\n")
 
-    briefs: dict[str, str] = {}
+    # Print mode only shows each brief's first line, so render full briefs
+    # only when they will actually be dispatched
+    available_clis = _tmux.detect_cli_tools()
+    scheduler = Scheduler(CliPool(available_clis, load_limits()))
     for role, meta in worker_roles.items():
-        brief = _outcome_brief(role, meta.get("description", ""), task)
-        briefs[role] = brief
+        brief = role_set.brief(role, task) if launch else ""
+        scheduler.submit(role, brief, role_candidates(meta, available_clis))
 
     if not launch:
-        # Print mode — just show what would be dispatched
+        # Print mode — just show what would be dispatched, and where
+        plan = scheduler.plan()
         for role, meta in worker_roles.items():
-            cli = meta.get("cli") or "(no CLI configured)"
-            typer.echo(f"── {role} [{cli}]")
-            typer.echo(f"   {briefs[role].splitlines()[0]}")
+            label = _plan_label(meta.get("cli"), role, plan, available_clis)
+            typer.echo(f"── {role} [{label}]")
+            typer.echo(f"   {role_set.first_line(role, task)}")
         typer.echo(
             "\nTip: add --launch to open a tmux session with one pane per role."
         )
@@ -89,26 +122,111 @@ def coordinate(
         typer.echo("✗ tmux not found in $PATH — cannot use --launch")
         raise typer.Exit(1)
 
-    available_clis = _tmux.detect_cli_tools()
-    session = "dana-dev"
+    session = session or _sessions.session_name(task)
+    if _tmux.session_exists(session):
+        typer.echo(f"✗ Session '{session}' is already running for this task")
+        typer.echo(f"  Attach with `tmux attach -t {session}` or stop it with `aether sessions kill {session}`")
+        raise typer.Exit(1)
+
+    needed = len(worker_roles) + 1  # + coordinator pane
+    in_use = _sessions.panes_in_use()
+    if in_use + needed > max_panes:
+        typer.echo(
+            f"✗ Launching would use {in_use + needed} panes (limit {max_panes}, "
+            f"{in_use} already in use)"
+        )
+        typer.echo("  Free some with `aether sessions kill <name>` or raise --max-panes.")
+        raise typer.Exit(1)
+
+    run_dir = _PANES_DIR / session
+    run_dir.mkdir(parents=True, exist_ok=True)
 
     typer.echo(f"Launching tmux session '{session}' …")
     _tmux.create_session(session)
 
+    panes: dict[str, str] = {}
     for i, (role, meta) in enumerate(worker_roles.items()):
         cli = meta.get("cli")
-        pane = _tmux.create_named_pane(session, role, first=(i == 0))
+        panes[role] = _tmux.create_named_pane(session, role, first=(i == 0))
+        if capture:
+            _tmux.pipe_pane_to_log(panes[role], run_dir, role)
 
-        if cli and cli in available_clis:
-            _tmux.send_prompt(pane, cli, briefs[role])
-        elif cli:
-            typer.echo(f"  ⚠ CLI '{cli}' not found for role '{role}' — pane opened but idle")
-        else:
+        if not cli:
             typer.echo(f"  ℹ Role '{role}' has no CLI configured — pane opened but idle")
+        elif not role_candidates(meta, available_clis):
+            typer.echo(f"  ⚠ No CLI available for role '{role}' (wanted '{cli}') — pane opened but idle")
+        elif cli not in available_clis:
+            typer.echo(f"  ⚠ CLI '{cli}' not found for role '{role}' — will use an alternate")
+
+    def dispatch(job: Job, cli: str) -> bool:
+        channel = f"aether-{session}-{job.role}-{len(job.tried)}"
+        status = run_dir / f"{job.role}.status"
+        status.unlink(missing_ok=True)
+        # Full path: the pane's shell may not share our $PATH
+        _tmux.send_prompt_and_signal(
+            panes[job.role], available_clis[cli], job.brief, channel, status
+        )
+        _tmux.wait_for(channel)
+        return status.read_text().strip() == "0"
+
+    dispatcher = threading.Thread(target=scheduler.run, args=(dispatch,), daemon=True)
+    dispatcher.start()
 
     # Open coordinator pane last so the user lands there
     _tmux.create_named_pane(session, "coordinator")
+    _sessions.register(session, task)
     typer.echo(f"\n✓ Session '{session}' ready — {len(worker_roles)} worker panes launched")
-    typer.echo("  Attaching to coordinator pane …")
+    if capture:
+        typer.echo(f"  Gather results with: aether collect --session {session}")
+    if not attach:
+        typer.echo(f"  Attach with: tmux attach -t {session}")
+        if wait:
+            dispatcher.join()
+        else:
+            # Our process outlives this call, so the dispatcher keeps retrying
+            scheduler.wait_dispatched()
+        _print_schedule(scheduler.jobs)
+        return
 
+    typer.echo("  Attaching to coordinator pane …")
     _tmux.attach_session(session)
+
+    # Running jobs matter too: one that fails is retried on an alternate
+    queued, running = scheduler.pending(), scheduler.active()
+    if dispatcher.is_alive() and (queued or running):
+        typer.echo(
+            f"\n… {queued} brief(s) queued and {running} running — keep this terminal "
+            "open so failed roles are retried on an alternate (Ctrl-C to stop dispatching)"
+        )
+        try:
+            dispatcher.join()
+        except KeyboardInterrupt:
+            pass
+    _print_schedule(scheduler.jobs)
+
+
+def _plan_label(cli: Optional[str], role: str, plan: dict, available: dict) -> str:
+    if not cli:
+        return "(no CLI configured)"
+    if role not in plan:
+        return f"{cli} — not installed"
+    assigned = plan[role]
+    if assigned is None:
+        if cli not in available:
+            return f"{cli} not installed — queued for an alternate"
+        return f"{cli} — queued"
+    if assigned != cli:
+        return f"{assigned} — instead of {cli}"
+    return cli
+
+
+def _print_schedule(jobs: list) -> None:
+    typer.echo(f"\n{'ROLE':<14}  {'CLI':<10}  {'STATUS':<8}  {'QUEUE WAIT':>10}  TRIED")
+    for job in jobs:
+        wait = "-" if job.wait_seconds is None else f"{job.wait_seconds:.1f}s"
+        typer.echo(
+            f"{job.role:<14}  {job.cli or '-':<10}  {job.status:<8}  {wait:>10}  "
+            f"{', '.join(job.tried) or '-'}"
+        )
+        if job.status == "failed" and job.error:
+            typer.echo(f"  ⚠ {job.error}")
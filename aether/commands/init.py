@@ -1,11 +1,12 @@
 """Initialize command - scaffold a new Dana project."""
 
-import shutil
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 import typer
 
+from aether.utils import manifest as _manifest
+
 # Directory containing the shipped templates (sibling of this package)
 _TEMPLATES_DIR = Path(__file__).parent.parent.parent / "templates"
 
@@ -29,13 +30,33 @@ def _slug(name: str) -> str:
     return name.strip().lower().replace(" ", "_").replace("-", "_")
 
 
+def _generated_files(agent_name: str, with_env: bool) -> List[Tuple[str, str]]:
+    """Return ``(template, destination)`` paths, relative to templates/ and the project."""
+    files = [
+        ("project.dana", "project.dana"),
+        ("agents/example.na", f"agents/{agent_name}.na"),
+        (".aether/roles.json", ".aether/roles.json"),
+    ]
+    if with_env:
+        files.append((".env.example", ".env.example"))
+    return files
+
+
 def init(
     name: str,
     team: List[str] = typer.Option(DEFAULT_TEAM, "--team", help="Team members"),
     with_env: bool = typer.Option(False, "--env", help="Copy .env.example"),
+    update: bool = typer.Option(
+        False, "--update", help="Sync template changes into an existing project, keeping local edits"
+    ),
 ):
     """Initialize a new Dana project from templates"""
     project_dir = Path(name)
+
+    if update:
+        _update(project_dir, with_env)
+        return
+
     project_dir.mkdir(exist_ok=True)
 
     agent_name = _slug(name)
@@ -48,35 +69,66 @@ def init(
         (project_dir / folder).mkdir(exist_ok=True)
 
     # ------------------------------------------------------------------
-    # project.dana — copy template, substitute placeholders
-    # ------------------------------------------------------------------
-    src_project = _TEMPLATES_DIR / "project.dana"
-    dst_project = project_dir / "project.dana"
-    raw = src_project.read_text()
-    dst_project.write_text(_apply_placeholders(raw, project_name, agent_name))
-
-    # ------------------------------------------------------------------
-    # agents/<slug>.na — copy example.na template
+    # project.dana, agents/<slug>.na, .aether/roles.json, .env.example —
+    # rendered from templates and recorded in .aether/manifest.json
     # ------------------------------------------------------------------
-    src_agent = _TEMPLATES_DIR / "agents" / "example.na"
-    dst_agent = project_dir / "agents" / f"{agent_name}.na"
-    raw = src_agent.read_text()
-    dst_agent.write_text(_apply_placeholders(raw, project_name, agent_name))
-
-    # ------------------------------------------------------------------
-    # .aether/ — roles config
-    # ------------------------------------------------------------------
-    aether_dir = project_dir / ".aether"
-    aether_dir.mkdir(exist_ok=True)
-    shutil.copy2(_TEMPLATES_DIR / ".aether" / "roles.json", aether_dir / "roles.json")
-
-    # ------------------------------------------------------------------
-    # .env.example (optional)
-    # ------------------------------------------------------------------
-    if with_env:
-        src_env = _TEMPLATES_DIR / ".env.example"
-        shutil.copy2(src_env, project_dir / ".env.example")
-        typer.echo("✓ Created .env.example")
+    manifest = _manifest.load(project_dir) or _manifest.new_manifest(project_name, agent_name)
+    for template, dest in _generated_files(agent_name, with_env):
+        src = _TEMPLATES_DIR / template
+        rendered = _apply_placeholders(src.read_text(), project_name, agent_name)
+        dst = project_dir / dest
+        entry = manifest["files"].get(dest)
+        if dst.exists():
+            current = dst.read_text()
+            if current != rendered and (entry is None or _manifest.digest(current) != entry["sha"]):
+                typer.echo(f"⚠ {dest} has local changes — kept (use --update to merge template changes)")
+                continue
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        dst.write_text(rendered)
+        _manifest.record(project_dir, manifest, dest, template, _manifest.template_digest(src), rendered)
+        if dest == ".env.example":
+            typer.echo("✓ Created .env.example")
+    _manifest.save(project_dir, manifest)
 
     typer.echo(f"✓ Project '{name}' initialized in {project_dir}/")
     typer.echo(f"  cd {name} && aether run")
+
+
+def _update(project_dir: Path, with_env: bool) -> None:
+    if not project_dir.is_dir():
+        typer.echo(f"✗ No project at {project_dir}/ — run `aether init {project_dir}` first")
+        raise typer.Exit(1)
+
+    manifest = _manifest.load(project_dir)
+    if manifest is None:
+        typer.echo("ℹ No .aether/manifest.json — recording the current templates as the baseline")
+        manifest = _manifest.new_manifest(project_dir.resolve().name, _slug(project_dir.resolve().name))
+    project_name, agent_name = manifest["project_name"], manifest["agent_name"]
+    with_env = with_env or ".env.example" in manifest["files"]
+
+    counts: dict = {}
+    for template, dest in _generated_files(agent_name, with_env):
+        src = _TEMPLATES_DIR / template
+        template_sha = _manifest.template_digest(src)
+        entry = manifest["files"].get(dest)
+        if entry and entry["template_sha"] == template_sha:
+            counts["unchanged"] = counts.get("unchanged", 0) + 1
+            continue  # Fast path: template unchanged, don't touch the file
+
+        rendered = _apply_placeholders(src.read_text(), project_name, agent_name)
+        status = _manifest.sync_file(project_dir, manifest, dest, template, template_sha, rendered)
+        counts[status] = counts.get(status, 0) + 1
+        if status in ("created", "updated"):
+            typer.echo(f"✓ {status.capitalize()} {dest}")
+        elif status == "merged":
+            typer.echo(f"✓ Merged template changes into {dest} (local edits kept)")
+        elif status == "conflict":
+            typer.echo(f"⚠ Conflicts in {dest} — resolve the <<<<<<< / >>>>>>> markers")
+        elif status == "deleted":
+            typer.echo(f"ℹ {dest} was removed locally — not recreated")
+    _manifest.save(project_dir, manifest)
+
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))
+    typer.echo(f"{'⚠' if 'conflict' in counts else '✓'} {project_dir}/ synced with templates: {summary}")
+    if "conflict" in counts:
+        raise typer.Exit(1)
@@ -1,21 +1,42 @@
 """Lock commands - file locking for multi-agent coordination."""
 
+import json
+import os
+import time
+from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
 import typer
 
-from aether.utils import lockfile
+from aether.utils import deadlock, lockevents, lockfile
+from aether.utils.lockmetrics import LockMetrics, hist_mean, hist_quantile
 
 
 def lock(
     file: str,
     role: str = typer.Option(..., "--role", "-r", help="Role acquiring the lock"),
     cli: Optional[str] = typer.Option(None, "--cli", help="CLI tool used by this role"),
+    force: bool = typer.Option(
+        False, "--force", help="Take over the lock even if another role holds it"
+    ),
+    wait: float = typer.Option(
+        0, "--wait", "-w", help="Seconds to wait for the lock (with deadlock detection)"
+    ),
+    policy: str = typer.Option(
+        os.getenv("AETHER_DEADLOCK_POLICY", deadlock.DEFAULT_POLICY),
+        "--deadlock-policy",
+        help="Which lock to break on deadlock: youngest | priority",
+    ),
 ):
     """Acquire a file lock for a role"""
-    acquired = lockfile.acquire(file, role=role, cli_tool=cli)
+    acquired = lockfile.acquire(file, role=role, cli_tool=cli, force=force)
+    if not acquired and wait > 0:
+        acquired = _wait_for_lock(file, role, cli, wait, policy)
     if acquired:
-        typer.echo(f"✓ Lock acquired: {file}  [{role}]")
+        token = acquired.get("token")
+        suffix = f"  token={token}" if token is not None else ""
+        typer.echo(f"✓ Lock acquired: {file}  [{role}]{suffix}")
     else:
         info = lockfile.is_locked(file)
         if info:
@@ -29,17 +50,168 @@ def lock(
         raise typer.Exit(1)
 
 
-def unlock(file: str):
+def _wait_for_lock(file: str, role: str, cli: Optional[str], wait: float, policy: str) -> Optional[dict]:
+    """Retry until *wait* seconds pass, registering the wait for deadlock checks."""
+    if policy not in deadlock.POLICIES:
+        typer.echo(f"Unknown deadlock policy: {policy}  (use {' or '.join(deadlock.POLICIES)})")
+        raise typer.Exit(2)
+
+    deadline = time.monotonic() + wait
+    typer.echo(f"… Waiting up to {wait:g}s for {file}")
+    try:
+        while True:
+            report = deadlock.register_wait(file, role, policy=policy, timeout=wait)
+            if report:
+                typer.echo(
+                    f"⚠ Deadlock: {' → '.join(report['cycle'] + report['cycle'][:1])}  "
+                    f"— released {report['released']} held by {report['victim']}"
+                )
+            acquired = lockfile.acquire(file, role=role, cli_tool=cli)
+            if acquired:
+                return acquired
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                lockevents.EventLog(Path.cwd()).emit("abandon", {"file": file, "role": role}, waited=wait)
+                return None
+            # Wake on the next lock event; re-check at least once a second
+            # so stale locks that expire silently are noticed too
+            for _ in lockevents.follow(idle_timeout=min(remaining, 1.0)):
+                break
+    finally:
+        deadlock.clear_wait(role)
+
+
+def unlock(
+    file: str,
+    token: Optional[int] = typer.Option(
+        None, "--token", "-t", help="Only release if the lock is still held under this fencing token"
+    ),
+):
     """Release a file lock"""
-    info = lockfile.release(file)
+    info = lockfile.release(file, token=token)
     if info:
         typer.echo(f"✓ Lock released: {file}  [was held by {info['role']}]")
-    else:
-        typer.echo(f"⚠ No lock found for: {file}")
+        return
+    holder = lockfile.is_locked(file) if token is not None else None
+    if holder:
+        typer.echo(
+            f"✗ Not released: {file} is held by {holder['role']} "
+            f"under token {holder.get('token')}, not {token}"
+        )
+        raise typer.Exit(1)
+    typer.echo(f"⚠ No lock found for: {file}")
+
+
+def _format_event(event: dict) -> str:
+    when = datetime.fromtimestamp(event["ts"]).strftime("%H:%M:%S")
+    line = f"{when}  {event['event']:<8}  {event.get('file') or '-':<40}  [{event.get('role')}]"
+    if event.get("previous_role"):
+        line += f"  (from {event['previous_role']})"
+    return line
+
+
+def _secs(value: Optional[float]) -> str:
+    if value is None:
+        return "-"
+    if value == float("inf"):
+        return ">1h"
+    return f"{value:.1f}s" if value < 60 else f"{value / 60:.1f}m"
+
+
+def _stats_rows(title: str, rows: list) -> None:
+    typer.echo(
+        f"{title:<40}  {'ACQ':>5}  {'CONFL':>5}  {'STEAL':>5}  "
+        f"{'WAIT avg':>8}  {'WAIT p95':>8}  {'HOLD avg':>8}  {'HOLD p95':>8}"
+    )
+    typer.echo("-" * 100)
+    for key, entry in rows:
+        wait, hold = entry["wait"], entry["hold"]
+        typer.echo(
+            f"{key:<40}  {entry['acquisitions']:>5}  {entry['conflicts']:>5}  "
+            f"{entry['steals']:>5}  {_secs(hist_mean(wait)):>8}  "
+            f"{_secs(hist_quantile(wait, 0.95)):>8}  {_secs(hist_mean(hold)):>8}  "
+            f"{_secs(hist_quantile(hold, 0.95)):>8}"
+        )
+
 
+def _show_stats(top: int, prom_file: Optional[Path]) -> None:
+    metrics = LockMetrics.load()
+    metrics.update()
+    metrics.save()
 
-def locks():
+    if prom_file:
+        metrics.write_prometheus(prom_file)
+
+    if metrics.gaps:
+        typer.echo(
+            f"⚠ The event log rotated past unread events {metrics.gaps} time(s); "
+            "counts below are incomplete. Run `aether locks --stats` more often to keep up.\n"
+        )
+    if not metrics.files:
+        typer.echo("No lock activity recorded yet.")
+        return
+
+    _stats_rows("FILE", metrics.top_files(top))
+    typer.echo("")
+    roles = sorted(
+        metrics.roles.items(),
+        key=lambda kv: (kv[1]["wait"]["sum"], kv[1]["conflicts"]),
+        reverse=True,
+    )
+    _stats_rows("ROLE", roles[:top])
+    if prom_file:
+        typer.echo(f"\n✓ Wrote Prometheus metrics to {prom_file}")
+
+
+def _show_graph() -> None:
+    g = deadlock.wait_for_graph()
+    if not g["edges"]:
+        typer.echo("No roles are waiting on locks.")
+        return
+
+    typer.echo("Wait-for graph (waiter ──file──▶ holder):")
+    for edge in g["edges"]:
+        typer.echo(f"  {edge['waiter']} ──{edge['file']}──▶ {edge['holder']}")
+    for cycle in g["cycles"]:
+        typer.echo(f"⚠ Deadlock: {' → '.join(cycle + cycle[:1])}")
+
+
+def locks(
+    follow: bool = typer.Option(
+        False, "--follow", "-f", help="Stream lock events as they happen"
+    ),
+    as_json: bool = typer.Option(
+        False, "--json", help="With --follow, print raw JSON events"
+    ),
+    stats: bool = typer.Option(
+        False, "--stats", help="Show contention metrics for the most contended files"
+    ),
+    top: int = typer.Option(10, "--top", "-n", help="With --stats, rows to show"),
+    prom_file: Optional[Path] = typer.Option(
+        None, "--prom-file", help="With --stats, also write Prometheus text metrics here"
+    ),
+    graph: bool = typer.Option(
+        False, "--graph", help="Show which roles wait on which, and any deadlocks"
+    ),
+):
     """Show all active file locks"""
+    if graph:
+        _show_graph()
+        return
+
+    if stats:
+        _show_stats(top, prom_file)
+        return
+
+    if follow:
+        typer.echo("Following lock events (Ctrl-C to stop) …")
+        try:
+            for event in lockevents.follow():
+                typer.echo(json.dumps(event) if as_json else _format_event(event))
+        except KeyboardInterrupt:
+            pass
+        return
+
     active = lockfile.list_locks()
     if not active:
         typer.echo("No active locks.")
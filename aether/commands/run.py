@@ -1,22 +1,33 @@
 """Run command - execute Dana files with .env loaded."""
 
-import os
 import subprocess
+import sys
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 
 import typer
 
-from aether.utils import load_env
+from aether.utils import child_env
+from aether.utils import runcache as _runcache
 
 
 def run(
     file: Optional[str] = typer.Argument(
         None, help="Dana file to run (default: project.dana)"
     ),
+    args: Optional[List[str]] = typer.Argument(
+        None, help="Arguments passed through to dana (after --)"
+    ),
+    memo: bool = typer.Option(
+        False,
+        "--memo",
+        help="Replay the last successful output if the file, its imports, model settings and args are unchanged",
+    ),
 ):
     """Run a Dana .na or .dana file with .env loaded"""
     target = file or "project.dana"
+    args = args or []
 
     if not Path(target).exists():
         typer.echo(f"✗ File not found: {target}")
@@ -26,10 +37,37 @@ def run(
 
     env_path = Path(".env")
     if env_path.exists():
-        load_env(".env")
         typer.echo("✓ Loaded .env")
     else:
         typer.echo("⚠ No .env file found")
 
-    result = subprocess.run(["dana", target], env=os.environ)
-    raise typer.Exit(code=result.returncode)
+    env = child_env(".env")
+    if not memo:
+        result = subprocess.run(["dana", target, *args], env=env)
+        raise typer.Exit(code=result.returncode)
+
+    fp = _runcache.fingerprint(Path(target), args, env)
+    cached = _runcache.lookup(fp)
+    if cached is not None:
+        when = datetime.fromtimestamp(cached["created"]).strftime("%Y-%m-%d %H:%M")
+        typer.echo(f"ℹ Unchanged since {when} — replaying cached output (drop --memo to re-run)")
+        sys.stdout.flush()
+        sys.stdout.buffer.write(cached["stdout"])
+        sys.stdout.flush()
+        raise typer.Exit(code=cached["exit_code"])
+
+    code, output = _tee(["dana", target, *args], env)
+    if code == 0:
+        _runcache.store(fp, code, output)
+    raise typer.Exit(code=code)
+
+
+def _tee(argv: List[str], env: dict) -> tuple:
+    """Run *argv*, streaming its stdout through while keeping a copy."""
+    chunks = []
+    with subprocess.Popen(argv, env=env, stdout=subprocess.PIPE) as proc:
+        for chunk in iter(lambda: proc.stdout.read1(65536), b""):
+            sys.stdout.buffer.write(chunk)
+            sys.stdout.flush()
+            chunks.append(chunk)
+    return proc.returncode, b"".join(chunks)
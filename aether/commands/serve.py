@@ -0,0 +1,35 @@
+"""Serve command - keep a warm aether process answering requests over HTTP/JSON."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+
+def serve(
+    socket: Optional[Path] = typer.Option(
+        None, "--socket", help="Unix socket to listen on (default: .aether/aether.sock)"
+    ),
+    port: Optional[int] = typer.Option(
+        None, "--port", "-p", help="Listen on TCP instead of a Unix socket"
+    ),
+    host: str = typer.Option(
+        "127.0.0.1", "--host", help="Loopback interface for --port (there is no auth, so others are refused)"
+    ),
+):
+    """Serve lock, run, coordinate and other commands over a local HTTP/JSON API"""
+    # Imported here so other commands don't pay for asyncio at start-up
+    from aether import server as _server
+
+    if socket and port is not None:
+        typer.echo("✗ Use either --socket or --port, not both")
+        raise typer.Exit(1)
+
+    def ready(address: str) -> None:
+        typer.echo(f"✓ aether serving on {address}  (Ctrl-C to stop)")
+
+    try:
+        _server.serve(socket_path=socket, host=host, port=port, ready=ready)
+    except (RuntimeError, OSError) as exc:
+        typer.echo(f"✗ {exc}")
+        raise typer.Exit(1)
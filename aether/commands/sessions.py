@@ -0,0 +1,63 @@
+"""Sessions commands - list, kill and clean up coordinator tmux sessions."""
+
+import time
+from typing import Optional
+
+import typer
+
+from aether.utils import sessions as _sessions
+
+app = typer.Typer(help="Manage coordinator tmux sessions", no_args_is_help=True)
+
+
+@app.command(name="list")
+def list_():
+    """Show recorded coordinator sessions"""
+    records = _sessions.list_sessions()
+    if not records:
+        typer.echo("No coordinator sessions recorded.")
+        return
+
+    typer.echo(f"{'SESSION':<36}  {'STATUS':<6}  {'PANES':>5}  {'AGE':>6}  TASK")
+    typer.echo("-" * 80)
+    now = time.time()
+    for r in records:
+        age_min = int(now - r.get("created", now)) // 60
+        status = "alive" if r["alive"] else "dead"
+        typer.echo(
+            f"{r['name']:<36}  {status:<6}  {len(r.get('panes', [])):>5}  "
+            f"{age_min:>5}m  {r.get('task', '')}"
+        )
+    typer.echo(
+        f"\n{_sessions.panes_in_use()} of {_sessions.max_panes()} panes in use"
+    )
+
+
+@app.command()
+def kill(
+    name: Optional[str] = typer.Argument(None, help="Session to kill"),
+    all_: bool = typer.Option(False, "--all", help="Kill every recorded session"),
+):
+    """Kill a coordinator session and its processes"""
+    if all_:
+        names = [r["name"] for r in _sessions.list_sessions()]
+    elif name:
+        names = [name]
+    else:
+        typer.echo("Pass a session name or --all.")
+        raise typer.Exit(1)
+
+    for n in names:
+        _sessions.kill(n)
+        typer.echo(f"✓ Killed {n}")
+
+
+@app.command()
+def gc():
+    """Forget sessions whose tmux session has exited"""
+    dead = _sessions.gc()
+    if dead:
+        for name in dead:
+            typer.echo(f"✓ Removed {name}")
+    else:
+        typer.echo("Nothing to clean up.")
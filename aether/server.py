@@ -0,0 +1,462 @@
+"""Local HTTP/JSON server for ``aether serve``.
+
+Keeps one warm process per project so orchestration layers don't pay
+interpreter start-up and a typer parse for every call.  The lock
+backend, the compiled ``roles.json`` and the ``.env`` snapshot are
+loaded once and reused across requests.
+
+Endpoints (JSON bodies, JSON responses)::
+
+    GET  /health                      {"ok", "pid", "root", "uptime"}
+    POST /lock      {file, role, cli?, force?}   {"acquired", "holder"}
+    POST /unlock    {file, token?}               {"released"}
+    POST /is-locked {file}                       {"lock"}
+    POST /locks     {}                           {"locks"}
+    POST /run       {file?, args?, memo?}        {"exit_code", "output", "cached"}
+    POST /command   {argv: [...]}                {"exit_code", "output"}
+
+``/command`` runs any other subcommand (``init``, ``agent``,
+``coordinate`` …) in-process with its output captured per request.
+Requests are served concurrently on an asyncio loop.  Lock calls run on
+their own worker threads, so a few slow commands (``lock --wait``,
+``coordinate --launch``) queued on the bounded command pool never delay
+them; ``coordinate --launch`` returns once the briefs are dispatched and
+keeps dispatching in the background.
+
+The Unix socket is created ``0600``.  TCP listeners are limited to
+loopback addresses and, because any web page in a local browser can
+reach those, every request must carry the per-server token written to
+``.aether/serve-<port>.token`` (``0600``) as ``Authorization: Bearer``,
+name the listener in its ``Host`` header (no DNS rebinding) and carry no
+``Origin``.  POST bodies must be sent as ``application/json``, which a
+page can't do cross-origin without a preflight.
+"""
+
+import asyncio
+import concurrent.futures
+import hmac
+import io
+import ipaddress
+import json
+import os
+import secrets
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from aether.utils import child_env, lockfile
+from aether.utils import runcache as _runcache
+
+DEFAULT_SOCKET = Path(".aether") / "aether.sock"
+TOKEN_NAME = "serve-{port}.token"
+
+MAX_BODY_BYTES = 1024 * 1024
+
+# Worker threads for lock calls, and for /command (which may block for minutes)
+LOCK_WORKERS = 8
+COMMAND_WORKERS = 4
+
+_REASONS = {200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden",
+            404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+            415: "Unsupported Media Type", 500: "Internal Server Error"}
+
+
+class _ThreadStdout(io.TextIOBase):
+    """``sys.stdout`` stand-in that sends each capturing thread's writes to its own buffer."""
+
+    encoding = "utf-8"
+    errors = "strict"
+
+    def __init__(self, fallback):
+        self._fallback = fallback
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def release(self) -> None:
+        self._local.buf = None
+
+    def _target(self):
+        return getattr(self._local, "buf", None) or self._fallback
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def isatty(self) -> bool:
+        return False if getattr(self._local, "buf", None) else self._fallback.isatty()
+
+    def writable(self) -> bool:
+        return True
+
+
+class AetherServer:
+    """Request handlers plus warm per-project state."""
+
+    def __init__(self, project_root: Optional[Path] = None):
+        self.root = (project_root or Path.cwd()).resolve()
+        self.backend = lockfile.get_backend(self.root)
+        self.started = time.time()
+        self._command = None
+        self._lock_pool = concurrent.futures.ThreadPoolExecutor(LOCK_WORKERS, "aether-lock")
+        self._command_pool = concurrent.futures.ThreadPoolExecutor(COMMAND_WORKERS, "aether-command")
+        self._stdout: Optional[_ThreadStdout] = None
+        # Set for TCP listeners only: accepted Host headers and the bearer token
+        self._hosts: Optional[set] = None
+        self._token: Optional[str] = None
+        self.token_path: Optional[Path] = None
+        self._routes = {
+            "/lock": self._lock,
+            "/unlock": self._unlock,
+            "/is-locked": self._is_locked,
+            "/locks": self._locks,
+            "/run": self._run,
+            "/command": self._run_command,
+        }
+
+    # ── lifecycle ─────────────────────────────────────────────────────────────
+
+    async def start(
+        self,
+        socket_path: Optional[Path] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+    ) -> asyncio.AbstractServer:
+        """Start listening on *port* (TCP) or *socket_path* (Unix socket)."""
+        if port is not None and not _is_loopback(host):
+            raise RuntimeError(
+                f"refusing to listen on {host}: the API is unauthenticated, "
+                "so only loopback addresses are allowed"
+            )
+        if self._stdout is None:
+            self._stdout = _ThreadStdout(sys.stdout)
+            sys.stdout = self._stdout
+        if port is not None:
+            listener = await asyncio.start_server(self._handle, host, port)
+            bound = listener.sockets[0].getsockname()[1]
+            self._hosts = _host_headers(host, bound)
+            self._token = secrets.token_urlsafe(32)
+            self.token_path = token_path(bound, self.root)
+            _write_private(self.token_path, self._token)
+            return listener
+
+        path = Path(socket_path or self.root / DEFAULT_SOCKET)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            if await _socket_alive(path):
+                raise RuntimeError(f"another server is already listening on {path}")
+            path.unlink()
+        server = await asyncio.start_unix_server(self._handle, str(path))
+        os.chmod(path, 0o600)
+        return server
+
+    def close(self) -> None:
+        if self._stdout is not None and sys.stdout is self._stdout:
+            sys.stdout = self._stdout._fallback
+        self._stdout = None
+        if self.token_path is not None:
+            self.token_path.unlink(missing_ok=True)
+        self._lock_pool.shutdown(wait=False, cancel_futures=True)
+        self._command_pool.shutdown(wait=False, cancel_futures=True)
+        self.backend.close()
+
+    # ── HTTP ──────────────────────────────────────────────────────────────────
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                except ValueError:
+                    await _respond(writer, 400, {"error": "malformed request line"}, close=True)
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close"
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    await _respond(writer, 413, {"error": "request body too large"}, close=True)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                refused = self._refuse(method, headers)
+                if refused is not None:
+                    await _respond(writer, *refused, close=True)
+                    break
+                status, payload = await self._dispatch(method, target.split("?", 1)[0], body)
+                await _respond(writer, status, payload, close=not keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    def _refuse(self, method: str, headers: dict) -> Optional[Tuple[int, dict]]:
+        """Return an error response for requests that may come from a browser page."""
+        if "origin" in headers:
+            return 403, {"error": "cross-origin requests are not accepted"}
+        if self._hosts is not None and headers.get("host", "").lower() not in self._hosts:
+            return 403, {"error": f"unexpected Host header: {headers.get('host', '')!r}"}
+        if self._token is not None and not hmac.compare_digest(
+            headers.get("authorization", "").encode(), f"Bearer {self._token}".encode()
+        ):
+            return 401, {"error": f"missing or wrong token (see {self.token_path})"}
+        content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        if method == "POST" and content_type != "application/json":
+            return 415, {"error": "request bodies must be sent as application/json"}
+        return None
+
+    async def _dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, dict]:
+        if path == "/health":
+            return 200, {
+                "ok": True,
+                "pid": os.getpid(),
+                "root": str(self.root),
+                "uptime": time.time() - self.started,
+            }
+        handler = self._routes.get(path)
+        if handler is None:
+            return 404, {"error": f"no such endpoint: {path}"}
+        if method != "POST":
+            return 405, {"error": f"{path} only accepts POST"}
+        try:
+            params = json.loads(body or b"{}")
+            if not isinstance(params, dict):
+                raise ValueError("request body must be a JSON object")
+        except ValueError as exc:
+            return 400, {"error": f"invalid JSON body: {exc}"}
+        try:
+            return 200, await handler(params)
+        except (KeyError, ValueError, TypeError) as exc:
+            return 400, {"error": f"bad request: {exc}"}
+        except Exception as exc:  # Report handler failures instead of dropping the connection
+            return 500, {"error": f"{type(exc).__name__}: {exc}"}
+
+    # ── handlers ──────────────────────────────────────────────────────────────
+
+    def _locking(self, fn, *args) -> asyncio.Future:
+        return asyncio.get_running_loop().run_in_executor(self._lock_pool, fn, *args)
+
+    async def _lock(self, p: dict) -> dict:
+        def acquire():
+            info = self.backend.acquire(p["file"], p["role"], p.get("cli"), bool(p.get("force")))
+            return info or self.backend.is_locked(p["file"]), info is not None
+
+        holder, acquired = await self._locking(acquire)
+        return {"acquired": acquired, "holder": holder}
+
+    async def _unlock(self, p: dict) -> dict:
+        return {"released": await self._locking(self.backend.release, p["file"], p.get("token"))}
+
+    async def _is_locked(self, p: dict) -> dict:
+        return {"lock": await self._locking(self.backend.is_locked, p["file"])}
+
+    async def _locks(self, p: dict) -> dict:
+        return {"locks": await self._locking(self.backend.list_locks)}
+
+    async def _run(self, p: dict) -> dict:
+        target = p.get("file") or "project.dana"
+        args = [str(a) for a in p.get("args") or []]
+        if not (self.root / target).exists():
+            return {"exit_code": 1, "output": f"✗ File not found: {target}\n"}
+        env = child_env(str(self.root / ".env"))
+
+        fp = None
+        if p.get("memo"):
+            fp = await asyncio.to_thread(_runcache.fingerprint, self.root / target, args, env, self.root)
+            cached = await asyncio.to_thread(_runcache.lookup, fp, self.root)
+            if cached is not None:
+                return {
+                    "exit_code": cached["exit_code"],
+                    "output": cached["stdout"].decode("utf-8", "replace"),
+                    "cached": True,
+                }
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                "dana", target, *args,
+                cwd=self.root,
+                env=env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            return {"exit_code": 127, "output": "✗ dana not found in $PATH\n"}
+        stdout, stderr = await proc.communicate()
+        if fp and proc.returncode == 0:
+            await asyncio.to_thread(_runcache.store, fp, 0, stdout, self.root)
+        return {
+            "exit_code": proc.returncode,
+            "output": (stdout + stderr).decode("utf-8", "replace"),
+            "cached": False,
+        }
+
+    async def _run_command(self, p: dict) -> dict:
+        argv = [str(a) for a in p["argv"]]
+        if not argv:
+            raise ValueError("argv is empty")
+        if argv[0] == "serve":
+            raise ValueError("cannot start a server from a server")
+        if argv[0] == "run":
+            return await self._run(_parse_run_argv(argv[1:]))
+        if argv[0] == "coordinate" and "--launch" in argv:
+            # No terminal to attach to, and this process outlives the request
+            argv += [a for a in ("--no-attach", "--no-wait") if a not in argv]
+        return await asyncio.get_running_loop().run_in_executor(self._command_pool, self._invoke, argv)
+
+    def _invoke(self, argv: list) -> dict:
+        """Run ``aether <argv>`` in this process, capturing its output."""
+        if self._command is None:
+            import typer
+
+            from aether.cli import app
+
+            self._command = typer.main.get_command(app)
+
+        buf = self._stdout.capture() if self._stdout else io.StringIO()
+        environ = dict(os.environ)
+        try:
+            try:
+                result = self._command.main(args=argv, prog_name="aether", standalone_mode=False)
+                code = result if isinstance(result, int) else 0
+            except SystemExit as exc:
+                code = exc.code if isinstance(exc.code, int) else 1
+            except Exception as exc:
+                format_message = getattr(exc, "format_message", None)
+                if format_message is None:
+                    raise
+                buf.write(f"Error: {format_message()}\n")
+                code = getattr(exc, "exit_code", 2)
+            return {"exit_code": code, "output": buf.getvalue()}
+        finally:
+            _restore_environ(environ)
+            if self._stdout:
+                self._stdout.release()
+
+
+def _restore_environ(saved: dict) -> None:
+    """Undo a command's ``os.environ`` changes so they don't outlive it (e.g. ``config --env``)."""
+    for key in os.environ.keys() - saved.keys():
+        os.environ.pop(key, None)
+    for key, value in saved.items():
+        if os.environ.get(key) != value:
+            os.environ[key] = value
+
+
+def _is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def _host_headers(host: str, port: int) -> set:
+    """Return the ``Host`` header values that name a listener on *host*:*port*."""
+    names = {"localhost", f"[{host}]" if ":" in host else host}
+    return names | {f"{name}:{port}" for name in names}
+
+
+def token_path(port: int, project_root: Optional[Path] = None) -> Path:
+    """Return where a TCP server on *port* keeps its bearer token."""
+    return (project_root or Path.cwd()) / ".aether" / TOKEN_NAME.format(port=port)
+
+
+def _write_private(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.unlink(missing_ok=True)  # A stale file may have looser permissions
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(text)
+
+
+def _parse_run_argv(argv: list) -> dict:
+    """Turn ``run [--memo] [file] [--] [args…]`` into a /run request.
+
+    Everything after ``--`` is passed through to dana untouched, ``--memo``
+    included.
+    """
+    head, tail = argv, []
+    if "--" in argv:
+        split = argv.index("--")
+        head, tail = argv[:split], argv[split + 1:]
+    memo = "--memo" in head
+    positional = [a for a in head if a != "--memo"]
+    return {"file": positional[0] if positional else None, "args": positional[1:] + tail, "memo": memo}
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, payload: dict, close: bool = False) -> None:
+    body = json.dumps(payload).encode()
+    head = (
+        f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'close' if close else 'keep-alive'}\r\n\r\n"
+    )
+    writer.write(head.encode() + body)
+    await writer.drain()
+
+
+async def _socket_alive(path: Path) -> bool:
+    try:
+        _, writer = await asyncio.open_unix_connection(str(path))
+    except (ConnectionError, FileNotFoundError, OSError):
+        return False
+    writer.close()
+    return True
+
+
+def serve(
+    socket_path: Optional[Path] = None,
+    host: str = "127.0.0.1",
+    port: Optional[int] = None,
+    ready=None,
+) -> None:
+    """Run the server until SIGINT/SIGTERM.  *ready(address)* is called once listening."""
+
+    async def main() -> None:
+        stop = asyncio.Event()
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+        server = AetherServer()
+        listener = await server.start(socket_path, host, port)
+        address = (
+            f"http://{host}:{listener.sockets[0].getsockname()[1]}"
+            if port is not None
+            else str(socket_path or server.root / DEFAULT_SOCKET)
+        )
+        if ready:
+            ready(address)
+        try:
+            async with listener:
+                await stop.wait()
+        finally:
+            server.close()
+            if port is None:
+                Path(address).unlink(missing_ok=True)
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -1,30 +1,145 @@
 """Utility functions for Aether CLI."""
 
 import os
-from typing import Optional
+import tempfile
+from typing import Dict, Optional, Tuple
 
 try:
-    from dotenv import load_dotenv
+    from dotenv import dotenv_values
 
-    def load_env(path: str = ".env") -> bool:
-        """Load environment variables from .env file."""
-        if os.path.exists(path):
-            load_dotenv(path)
-            return True
-        return False
+    def _parse_env(path: str) -> Dict[str, str]:
+        """Parse *path* into a dict (python-dotenv)."""
+        return {k: v for k, v in dotenv_values(path).items() if v is not None}
 except ImportError:
 
-    def load_env(path: str = ".env") -> bool:
-        """Load environment variables from .env file (fallback)."""
-        if os.path.exists(path):
-            with open(path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, val = line.split("=", 1)
-                        os.environ[key.strip()] = val.strip().strip("'\"")
-            return True
+    def _parse_env(path: str) -> Dict[str, str]:
+        """Parse *path* into a dict (fallback)."""
+        values: Dict[str, str] = {}
+        with open(path) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#") and "=" in line:
+                    key, val = line.split("=", 1)
+                    values[key.strip()] = val.strip().strip("'\"")
+        return values
+
+
+# Parsed .env snapshots keyed by absolute path -> ((mtime_ns, size), values)
+_ENV_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, str]]] = {}
+
+
+def read_env(path: str = ".env") -> Dict[str, str]:
+    """Return the parsed contents of *path*, or {} if it does not exist.
+
+    The parsed snapshot is cached and only re-read when the file's mtime
+    or size changes, so repeated calls in one process are cheap.
+    """
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _ENV_CACHE.pop(key, None)
+        return {}
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _ENV_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    values = _parse_env(key)
+    _ENV_CACHE[key] = (stamp, values)
+    return values
+
+
+def load_env(path: str = ".env") -> bool:
+    """Load environment variables from .env file.
+
+    Like python-dotenv, variables already set in the environment win.
+    """
+    if not os.path.exists(path):
         return False
+    values = read_env(path)
+    os.environ.update({k: v for k, v in values.items() if k not in os.environ})
+    return True
+
+
+def child_env(path: str = ".env") -> Dict[str, str]:
+    """Return an environment dict for a child process with *path* applied.
+
+    The parent's ``os.environ`` is left untouched; pass the result as
+    ``env=`` to ``subprocess.run``.
+    """
+    return {**read_env(path), **os.environ}
+
+
+def _env_key(line: str) -> Optional[str]:
+    """Return the variable assigned on a .env *line*, or None."""
+    stripped = line.strip()
+    if not stripped or stripped.startswith("#") or "=" not in stripped:
+        return None
+    name = stripped.split("=", 1)[0].strip()
+    if name.startswith("export "):
+        name = name[len("export "):].strip()
+    return name
+
+
+def set_env_key(key: str, value: str, path: str = ".env") -> bool:
+    """Set *key* to *value* in the .env file at *path*, compacting it.
+
+    Every variable keeps the position of its first assignment and the
+    value of its last one (python-dotenv's precedence), so duplicates left
+    by older appends are folded away rather than growing the file.
+    The file holds API keys: a new one is created ``0600`` and an
+    existing one keeps its permissions.  Returns True if it was created.
+    """
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()
+        mode = os.stat(path).st_mode & 0o777
+        created = False
+    except FileNotFoundError:
+        lines, mode, created = [], 0o600, True
+
+    # Last assignment of each variable wins
+    final: Dict[str, str] = {}
+    for line in lines:
+        name = _env_key(line)
+        if name is not None:
+            final[name] = line
+    final[key] = f"{key}={value}"
+
+    out = []
+    seen = set()
+    for line in lines:
+        name = _env_key(line)
+        if name is None:
+            out.append(line)
+        elif name not in seen:
+            seen.add(name)
+            out.append(final[name])
+
+    if key not in seen:
+        # Drop trailing blank lines left behind by older appends
+        while out and not out[-1].strip():
+            out.pop()
+        out.append(final[key])
+
+    # mkstemp creates the file 0600 under a unique name; widen it only to
+    # the original's mode, before any secret is written
+    fd, tmp = tempfile.mkstemp(prefix=".env.", suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, "w") as f:
+            f.write("\n".join(out) + "\n")
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+    _ENV_CACHE.pop(os.path.abspath(path), None)
+    return created
 
 
 def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
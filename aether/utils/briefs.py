@@ -0,0 +1,221 @@
+"""Compiled role brief templates.
+
+A role in ``roles.json`` may carry its own ``brief`` template (a string,
+or a list of lines) and per-role ``vars``::
+
+    "critic": {
+      "description": "Reviews outputs for gaps.",
+      "cli": "claude",
+      "brief": ["[{ROLE}] Review: {task}", "", "Focus on {focus}."],
+      "vars": {"focus": "security"}
+    }
+
+Templates use ``str.format`` field syntax.  Available fields are
+``task``, ``role``, ``ROLE``, ``description``, ``outcome_start``,
+``outcome_end`` and the role's ``vars``; roles without a ``brief`` use
+:data:`DEFAULT_BRIEF`.
+
+Each template is parsed once into literal and field segments, then bound
+to its role so only ``{task}`` remains to fill per render.  Parsed role
+sets are cached by path and mtime, so repeated loads in one process do
+not re-read or re-compile ``roles.json``.
+"""
+
+import json
+import os
+from pathlib import Path
+from string import Formatter
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from aether.utils.outcomes import OUTCOME_END, OUTCOME_START
+
+DEFAULT_BRIEF = (
+    "[{ROLE}] Task: {task}\n\n"
+    "Your role: {description}\n\n"
+    "Deliver a clear, concrete outcome relevant to your expertise. "
+    "Do not wait for instructions on *how* — you are the expert. "
+    "Return your findings when ready.\n\n"
+    "When done, print your final outcome between a line reading "
+    "{outcome_start} and a line reading {outcome_end}."
+)
+
+# A segment is either literal text or a (field, conversion, format_spec) triple
+Segment = Union[str, Tuple[str, Optional[str], str]]
+
+_FORMATTER = Formatter()
+
+
+class BriefTemplate:
+    """A brief template parsed into segments, renderable many times."""
+
+    def __init__(self, segments: List[Segment]):
+        merged: List[Segment] = []
+        for seg in segments:
+            if isinstance(seg, str):
+                if not seg:
+                    continue
+                if merged and isinstance(merged[-1], str):
+                    merged[-1] += seg
+                    continue
+            merged.append(seg)
+        self.segments = merged
+        self.fields = {seg[0] for seg in merged if not isinstance(seg, str)}
+
+        # Fast path: when every field is a bare {task}, rendering is one join
+        self._task_parts: Optional[List[str]] = None
+        if all(isinstance(s, str) or s == ("task", None, "") for s in merged):
+            parts, current = [], ""
+            for seg in merged:
+                if isinstance(seg, str):
+                    current += seg
+                else:
+                    parts.append(current)
+                    current = ""
+            parts.append(current)
+            self._task_parts = parts
+
+    @classmethod
+    def compile(cls, text: str) -> "BriefTemplate":
+        """Parse *text*; raise ValueError on malformed or non-simple fields."""
+        segments: List[Segment] = []
+        for literal, field, spec, conversion in _FORMATTER.parse(text):
+            segments.append(literal)
+            if field is None:
+                continue
+            if not field.isidentifier():
+                raise ValueError(f"unsupported field '{{{field}}}' (use plain names)")
+            segments.append((field, conversion, spec or ""))
+        return cls(segments)
+
+    def bind(self, **values: object) -> "BriefTemplate":
+        """Return a template with the given fields substituted as literals."""
+        segments: List[Segment] = []
+        for seg in self.segments:
+            if isinstance(seg, str) or seg[0] not in values:
+                segments.append(seg)
+            else:
+                segments.append(_format_field(seg, values[seg[0]]))
+        return BriefTemplate(segments)
+
+    def render(self, **values: object) -> str:
+        if self._task_parts is not None and "task" in values:
+            return str(values["task"]).join(self._task_parts)
+        out = []
+        for seg in self.segments:
+            if isinstance(seg, str):
+                out.append(seg)
+            else:
+                out.append(_format_field(seg, _lookup(values, seg[0])))
+        return "".join(out)
+
+    def first_line(self, **values: object) -> str:
+        """Render only up to the first newline of the result."""
+        out = []
+        for seg in self.segments:
+            if isinstance(seg, str):
+                head, nl, _ = seg.partition("\n")
+                out.append(head)
+                if nl:
+                    break
+            else:
+                text = _format_field(seg, _lookup(values, seg[0]))
+                head, nl, _ = text.partition("\n")
+                out.append(head)
+                if nl:
+                    break
+        return "".join(out)
+
+
+def _lookup(values: dict, field: str) -> object:
+    try:
+        return values[field]
+    except KeyError:
+        raise ValueError(f"no value for brief field '{{{field}}}'") from None
+
+
+def _format_field(seg: Tuple[str, Optional[str], str], value: object) -> str:
+    _, conversion, spec = seg
+    if conversion:
+        value = _FORMATTER.convert_field(value, conversion)
+    return format(value, spec)
+
+
+def _role_template(role: str, meta: dict) -> BriefTemplate:
+    text = meta.get("brief") or DEFAULT_BRIEF
+    if isinstance(text, list):
+        text = "\n".join(text)
+    try:
+        template = BriefTemplate.compile(text)
+    except ValueError as exc:
+        raise ValueError(f"role '{role}': bad brief template: {exc}") from None
+
+    values = {
+        "outcome_start": OUTCOME_START,
+        "outcome_end": OUTCOME_END,
+        **meta.get("vars", {}),
+        "role": role,
+        "ROLE": role.upper(),
+        "description": meta.get("description", ""),
+    }
+    bound = template.bind(**values)
+    unknown = bound.fields - {"task"}
+    if unknown:
+        names = ", ".join(sorted(unknown))
+        raise ValueError(f"role '{role}': brief uses undefined field(s): {names}")
+    return bound
+
+
+class RoleSet:
+    """Roles from ``roles.json`` with their brief templates compiled once."""
+
+    def __init__(self, roles: Dict[str, dict]):
+        self.roles = roles
+        self._templates = {role: _role_template(role, meta or {}) for role, meta in roles.items()}
+
+    def brief(self, role: str, task: str) -> str:
+        return self._templates[role].render(task=task)
+
+    def first_line(self, role: str, task: str) -> str:
+        return self._templates[role].first_line(task=task)
+
+    def render_many(
+        self,
+        tasks: Iterable[str],
+        roles: Optional[Iterable[str]] = None,
+    ) -> Iterator[Tuple[str, str, str]]:
+        """Yield ``(task, role, brief)`` for every task × role, lazily."""
+        selected = [(r, self._templates[r]) for r in (roles if roles is not None else self.roles)]
+        for task in tasks:
+            for role, template in selected:
+                yield task, role, template.render(task=task)
+
+
+# Compiled role sets keyed by absolute path -> ((mtime_ns, size), RoleSet)
+_ROLES_CACHE: Dict[str, Tuple[Tuple[int, int], RoleSet]] = {}
+
+
+def load_role_set(path: Path) -> Optional[RoleSet]:
+    """Return the compiled roles in *path*, or None if it does not exist.
+
+    Cached per path until the file's mtime or size changes.  Raises
+    ValueError for invalid JSON or brief templates.
+    """
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _ROLES_CACHE.pop(key, None)
+        return None
+
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _ROLES_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+
+    try:
+        roles = json.loads(Path(key).read_text())
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{path} is not valid JSON: {exc}") from None
+    role_set = RoleSet(roles)
+    _ROLES_CACHE[key] = (stamp, role_set)
+    return role_set
@@ -0,0 +1,260 @@
+"""Deadlock detection for roles waiting on each other's locks.
+
+A role that cannot get a lock registers a *wait* on that file in
+``.aether/waits/``.  Together with the current lock holders this forms a
+wait-for graph: an edge ``waiter → holder`` for every waited-on file.
+
+A role waits on at most one file at a time, so every node has at most
+one outgoing edge and a cycle through a new wait can be found by simply
+following edges from the holder — :func:`register_wait` does exactly that
+each time a wait is registered, instead of re-scanning the whole graph.
+
+When a cycle is found one lock in it is broken according to a policy:
+
+- ``youngest`` — release the most recently acquired lock in the cycle
+- ``priority`` — release the lock held by the role with the lowest
+  ``priority`` in ``.aether/roles.json`` (ties go to the youngest lock)
+
+The forced release and a ``deadlock`` event are written to the lock
+event log so the victim role and coordinators are told what happened.
+The release is conditional on the lock being the one seen in the cycle;
+if it changed (another waiter broke the same cycle first), nothing is
+released.
+
+Wait records carry the waiter's pid, host and timeout.  A record whose
+process is gone (on this host) or whose timeout has passed is dead: it
+is dropped on sight rather than closing phantom cycles.
+"""
+
+import json
+import os
+import socket
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import quote
+
+from aether.utils import lockfile
+from aether.utils.lockevents import EventLog
+
+WAITS_DIR_NAME = Path(".aether") / "waits"
+ROLES_PATH = Path(".aether") / "roles.json"
+
+POLICIES = ("youngest", "priority")
+DEFAULT_POLICY = "youngest"
+
+# Slack past a waiter's timeout before its record counts as abandoned
+WAIT_GRACE_SECONDS = 5
+
+_HOST = socket.gethostname()
+
+
+def _waits_dir(project_root: Path) -> Path:
+    return project_root / WAITS_DIR_NAME
+
+
+def _wait_path(project_root: Path, role: str) -> Path:
+    return _waits_dir(project_root) / f"{quote(role, safe='')}.json"
+
+
+def clear_wait(role: str, project_root: Optional[Path] = None) -> None:
+    """Forget any wait registered by *role* (call after acquiring or giving up)."""
+    _wait_path(project_root or Path.cwd(), role).unlink(missing_ok=True)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by someone else
+    return True
+
+
+def _wait_alive(wait: dict) -> bool:
+    """Return False for a wait left behind by a waiter that died or gave up."""
+    pid = wait.get("pid")
+    if pid is None:
+        return False  # Written before waits were tracked; can't be verified
+    if wait.get("host") == _HOST and not _pid_alive(pid):
+        return False
+    timeout = wait.get("timeout")
+    if timeout is not None and time.time() - wait["since"] > timeout + WAIT_GRACE_SECONDS:
+        return False
+    return True
+
+
+def list_waits(project_root: Optional[Path] = None) -> List[dict]:
+    """Return every live wait record, deleting dead ones."""
+    d = _waits_dir(project_root or Path.cwd())
+    if not d.exists():
+        return []
+    waits = []
+    for wf in d.glob("*.json"):
+        try:
+            wait = json.loads(wf.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        if _wait_alive(wait):
+            waits.append(wait)
+        else:
+            wf.unlink(missing_ok=True)
+    return waits
+
+
+def _role_priorities(project_root: Path) -> Dict[str, int]:
+    try:
+        roles = json.loads((project_root / ROLES_PATH).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+    return {name: int(meta.get("priority", 0)) for name, meta in roles.items()}
+
+
+def _acquired_ts(info: dict) -> float:
+    return datetime.fromisoformat(info["acquired"]).timestamp()
+
+
+def _choose_victim(cycle: List[dict], policy: str, project_root: Path) -> dict:
+    """Pick the edge of *cycle* whose lock should be broken."""
+    if policy == "priority":
+        priorities = _role_priorities(project_root)
+        return min(
+            cycle,
+            key=lambda e: (priorities.get(e["holder"], 0), -_acquired_ts(e["lock"])),
+        )
+    return max(cycle, key=lambda e: _acquired_ts(e["lock"]))
+
+
+def find_cycle_from(
+    role: str,
+    project_root: Optional[Path] = None,
+    backend: Optional[lockfile.LockBackend] = None,
+) -> Optional[List[dict]]:
+    """Follow wait edges starting at *role*; return the cycle back to it, if any.
+
+    Each edge is ``{"waiter", "file", "holder", "lock"}``.
+    """
+    root = project_root or Path.cwd()
+    be = backend or lockfile.get_backend(root)
+    waits = {w["role"]: w for w in list_waits(root)}
+
+    path: List[dict] = []
+    visited = set()
+    current = role
+    while current in waits and current not in visited:
+        visited.add(current)
+        wait = waits[current]
+        info = be.is_locked(wait["file"])
+        if info is None or info["role"] == current:
+            return None  # The file is free; this wait resolves on its own
+        path.append({"waiter": current, "file": wait["file"], "holder": info["role"], "lock": info})
+        current = info["role"]
+        if current == role:
+            return path
+    return None
+
+
+def register_wait(
+    filepath: str,
+    role: str,
+    project_root: Optional[Path] = None,
+    backend: Optional[lockfile.LockBackend] = None,
+    policy: str = DEFAULT_POLICY,
+    timeout: Optional[float] = None,
+) -> Optional[dict]:
+    """Record that *role* is waiting for *filepath* and break any deadlock.
+
+    *timeout* is how long the waiter will wait in total; its record is
+    ignored once that has passed.  Returns None when no cycle was formed
+    (or the lock to break changed before we got to it), otherwise a report dict with the ``cycle`` (roles in wait order), the
+    ``victim`` role and the ``released`` file.
+    """
+    if policy not in POLICIES:
+        raise ValueError(f"unknown deadlock policy {policy!r} (choose from {', '.join(POLICIES)})")
+
+    root = project_root or Path.cwd()
+    be = backend or lockfile.get_backend(root)
+    wp = _wait_path(root, role)
+    wp.parent.mkdir(parents=True, exist_ok=True)
+
+    previous = None
+    if wp.exists():
+        try:
+            previous = json.loads(wp.read_text())
+        except json.JSONDecodeError:
+            pass
+    # Keep the start of an ongoing wait; a leftover from another process starts afresh
+    ongoing = (
+        previous
+        and previous.get("file") == filepath
+        and previous.get("pid") == os.getpid()
+        and previous.get("host") == _HOST
+    )
+    since = previous["since"] if ongoing else time.time()
+    wp.write_text(json.dumps({
+        "role": role,
+        "file": filepath,
+        "since": since,
+        "timeout": timeout,
+        "pid": os.getpid(),
+        "host": _HOST,
+    }))
+
+    cycle = find_cycle_from(role, root, be)
+    if cycle is None:
+        return None
+
+    victim = _choose_victim(cycle, policy, root)
+    # Only the lock we saw: another waiter in the cycle may have broken it
+    # already, and the file since been locked by a role outside the cycle
+    if be.release(victim["file"], expected=victim["lock"]) is None:
+        return None
+    report = {
+        "cycle": [edge["waiter"] for edge in cycle],
+        "victim": victim["holder"],
+        "released": victim["file"],
+        "policy": policy,
+    }
+    (be.events or EventLog(root)).emit(
+        "deadlock", victim["lock"], cycle=report["cycle"], policy=policy
+    )
+    return report
+
+
+def wait_for_graph(
+    project_root: Optional[Path] = None,
+    backend: Optional[lockfile.LockBackend] = None,
+) -> dict:
+    """Return the current wait-for graph.
+
+    ``{"edges": [{"waiter", "file", "holder"}], "cycles": [[role, ...]]}``
+    """
+    root = project_root or Path.cwd()
+    be = backend or lockfile.get_backend(root)
+
+    edges = []
+    next_role: Dict[str, str] = {}
+    for wait in sorted(list_waits(root), key=lambda w: w["role"]):
+        info = be.is_locked(wait["file"])
+        if info is None or info["role"] == wait["role"]:
+            continue
+        edges.append({"waiter": wait["role"], "file": wait["file"], "holder": info["role"]})
+        next_role[wait["role"]] = info["role"]
+
+    # Out-degree is at most one, so each cycle is found by walking forward
+    cycles = []
+    done: set = set()
+    for start in next_role:
+        if start in done:
+            continue
+        walk: List[str] = []
+        node = start
+        while node in next_role and node not in done and node not in walk:
+            walk.append(node)
+            node = next_role[node]
+        if node in walk:
+            cycles.append(walk[walk.index(node):])
+        done.update(walk)
+    return {"edges": edges, "cycles": cycles}
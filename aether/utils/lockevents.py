@@ -0,0 +1,378 @@
+"""Append-only lock event log for coordinator notifications.
+
+Every lock transition (``acquire``, ``release``, ``expire``, ``steal``,
+``lost``), every refused acquisition (``conflict``), wait given up
+(``abandon``) or broken deadlock (``deadlock``) is appended as one JSON
+line to ``.aether/events/locks.jsonl``.  The file is
+rotated to ``locks.jsonl.1`` … ``locks.jsonl.N`` once it grows past
+``max_bytes``, so disk use stays bounded.
+
+Coordinators react to lock changes with :func:`follow`, which tails the
+log and wakes on inotify events where available (polling elsewhere)
+instead of rescanning the lock directory::
+
+    for event in lockevents.follow():
+        if event["event"] == "release":
+            notify(event["role"], event["file"])
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import socket
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+
+EVENTS_DIR_NAME = Path(".aether") / "events"
+LOG_NAME = "locks.jsonl"
+
+# Rotate after 1 MiB and keep five old generations (~6 MiB worst case)
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_BACKUPS = 5
+
+EVENT_TYPES = ("acquire", "release", "expire", "steal", "lost", "conflict", "abandon", "deadlock")
+
+_HOST = socket.gethostname()
+
+
+def events_dir(project_root: Optional[Path] = None) -> Path:
+    return (project_root or Path.cwd()) / EVENTS_DIR_NAME
+
+
+class EventLog:
+    """Writer for the rotated lock event log of one project."""
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+    ):
+        self.dir = events_dir(project_root)
+        self.path = self.dir / LOG_NAME
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def emit(self, event: str, info: dict, **extra) -> dict:
+        """Append *event* for the lock described by *info* and return the record."""
+        record = {
+            "ts": time.time(),
+            "event": event,
+            "file": info.get("file"),
+            "role": info.get("role"),
+            "cli": info.get("cli"),
+            "acquired": info.get("acquired"),
+            "host": _HOST,
+            "pid": os.getpid(),
+        }
+        if info.get("token") is not None:
+            record["token"] = info["token"]
+        record.update(extra)
+
+        self.dir.mkdir(parents=True, exist_ok=True)
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode()
+        # A single O_APPEND write keeps concurrent writers from interleaving
+        fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, line)
+            size = os.fstat(fd).st_size
+        finally:
+            os.close(fd)
+
+        if size > self.max_bytes:
+            self._rotate()
+        return record
+
+    def _rotate(self) -> None:
+        guard = os.open(self.dir / f"{LOG_NAME}.lock", os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(guard, fcntl.LOCK_EX)
+            # Another writer may have rotated while we waited
+            try:
+                if self.path.stat().st_size <= self.max_bytes:
+                    return
+            except FileNotFoundError:
+                return
+            for n in range(self.backups - 1, 0, -1):
+                src = self.dir / f"{LOG_NAME}.{n}"
+                if src.exists():
+                    os.replace(src, self.dir / f"{LOG_NAME}.{n + 1}")
+            if self.backups > 0:
+                os.replace(self.path, self.dir / f"{LOG_NAME}.1")
+            else:
+                self.path.unlink()
+        finally:
+            os.close(guard)
+
+
+def _parse(line: bytes) -> Optional[dict]:
+    try:
+        return json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None  # Torn or foreign line
+
+
+def read_events(
+    project_root: Optional[Path] = None,
+    include_rotated: bool = True,
+) -> Iterator[dict]:
+    """Yield logged events oldest-first, optionally including rotated files."""
+    d = events_dir(project_root)
+    paths = _rotated(d) if include_rotated else []
+    paths.append(d / LOG_NAME)
+
+    for path in paths:
+        try:
+            with open(path, "rb") as f:
+                for line in f:
+                    record = _parse(line)
+                    if record is not None:
+                        yield record
+        except FileNotFoundError:
+            continue
+
+
+def _rotated(d: Path) -> list:
+    """Return rotated generations, oldest (highest number) first."""
+    return sorted(
+        d.glob(f"{LOG_NAME}.[0-9]*"),
+        key=lambda p: int(p.suffix[1:]),
+        reverse=True,
+    )
+
+
+def _newer_generations(d: Path, ino: int) -> list:
+    """Return rotated files written after the generation with inode *ino*."""
+    gens = _rotated(d)
+    for i, path in enumerate(gens):
+        try:
+            if path.stat().st_ino == ino:
+                return gens[i + 1:]
+        except FileNotFoundError:
+            continue
+    return gens  # Ours aged out entirely; everything left is newer
+
+
+def _read_complete(path: Path, offset: int) -> tuple:
+    """Return (records, new_offset) for whole lines of *path* after *offset*."""
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    records = [r for r in map(_parse, data[:end].splitlines()) if r is not None]
+    return records, offset + end
+
+
+def _first_line(path: Path) -> Optional[str]:
+    """Return the first complete line of *path*, or None if it has none yet."""
+    with open(path, "rb") as f:
+        line = f.readline(4096)
+    return line.decode("utf-8", "replace") if line.endswith(b"\n") else None
+
+
+def _is_generation(path: Path, cursor: dict) -> bool:
+    """Return True if *path* is the file *cursor* was taken in.
+
+    The inode alone isn't enough: once a generation is rotated away its
+    inode is free, and filesystems hand it straight to the next new log.
+    """
+    if path.stat().st_ino != cursor["ino"]:
+        return False
+    head = cursor.get("head")
+    return head is None or _first_line(path) == head
+
+
+def read_since(
+    project_root: Optional[Path] = None,
+    cursor: Optional[dict] = None,
+) -> tuple:
+    """Return ``(events, cursor)`` for everything logged after *cursor*.
+
+    The cursor records the file (inode and first line) and byte offset
+    reached in the log, so incremental consumers only read what was
+    appended since their last call, including generations rotated out in
+    between.  Pass ``None`` to read the whole retained history.
+
+    If the generation the cursor points into has already been rotated
+    away, reading resumes at the oldest retained file and the events in
+    between are lost; the cursor's ``gaps`` count records each time that
+    happened so consumers can say their totals are incomplete.
+    """
+    d = events_dir(project_root)
+    files = _rotated(d) + [d / LOG_NAME]
+
+    start, offset = 0, 0
+    gaps = (cursor or {}).get("gaps", 0)
+    if cursor is not None and cursor.get("ino") is not None:
+        for i, path in enumerate(files):
+            try:
+                if _is_generation(path, cursor):
+                    start, offset = i, cursor["offset"]
+                    break
+            except FileNotFoundError:
+                continue
+        else:
+            gaps += 1
+
+    events: list = []
+    new_cursor = cursor
+    if gaps != (cursor or {}).get("gaps", 0):
+        # Counted once: with nothing left to read, resume from the oldest file
+        new_cursor = {"ino": None, "offset": 0, "head": None, "gaps": gaps}
+    for i, path in enumerate(files[start:], start):
+        try:
+            records, end = _read_complete(path, offset if i == start else 0)
+            ino = path.stat().st_ino
+            head = _first_line(path) if end else None
+        except FileNotFoundError:
+            continue
+        events.extend(records)
+        new_cursor = {"ino": ino, "offset": end, "head": head, "gaps": gaps}
+    return events, new_cursor
+
+
+# ── File watching ────────────────────────────────────────────────────────────
+
+_IN_MODIFY = 0x00000002
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+
+
+class _DirWatcher:
+    """Block until something in a directory changes.
+
+    Uses inotify through libc on Linux so wakeups are immediate; falls
+    back to sleeping *poll_interval* seconds elsewhere.
+    """
+
+    def __init__(self, directory: Path, poll_interval: float = 0.25):
+        self.poll_interval = poll_interval
+        self.fd = -1
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            return
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+        mask = _IN_MODIFY | _IN_MOVED_TO | _IN_CREATE
+        if libc.inotify_add_watch(fd, str(directory).encode(), mask) < 0:
+            os.close(fd)
+            return
+        self.fd = fd
+
+    def wait(self, timeout: Optional[float]) -> None:
+        if self.fd < 0:
+            time.sleep(self.poll_interval if timeout is None else min(timeout, self.poll_interval))
+            return
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.fd, 65536):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+def follow(
+    project_root: Optional[Path] = None,
+    from_start: bool = False,
+    idle_timeout: Optional[float] = None,
+    stop: Optional[Callable[[], bool]] = None,
+    poll_interval: float = 0.25,
+) -> Iterator[dict]:
+    """Yield lock events as they are appended, like ``tail -F``.
+
+    Starts at the end of the active log unless *from_start* is set.
+    Survives rotation by draining the old file before reopening the new
+    one.  Stops after *idle_timeout* seconds without events, or when
+    *stop()* returns True; otherwise runs until the caller breaks out.
+    """
+    d = events_dir(project_root)
+    d.mkdir(parents=True, exist_ok=True)
+    path = d / LOG_NAME
+    watcher = _DirWatcher(d, poll_interval)
+
+    f = None
+    buf = b""
+    try:
+        path.touch(exist_ok=True)
+        f = open(path, "rb")
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        last_event = time.monotonic()
+
+        while True:
+            chunk = f.read()
+            if chunk:
+                buf += chunk
+                *lines, buf = buf.split(b"\n")
+                for line in lines:
+                    record = _parse(line)
+                    if record is not None:
+                        yield record
+                last_event = time.monotonic()
+                continue
+
+            # EOF: reopen if the log was rotated underneath us
+            try:
+                rotated = os.stat(path).st_ino != os.fstat(f.fileno()).st_ino
+            except FileNotFoundError:
+                rotated = False
+            if rotated:
+                # Finish our file first: lines may have been appended
+                # between the empty read above and the rotation
+                buf += f.read()
+                for line in buf.split(b"\n"):
+                    record = _parse(line)
+                    if record is not None:
+                        yield record
+                # Then catch up on any generations rotated out since our file
+                old_ino = os.fstat(f.fileno()).st_ino
+                f.close()
+                for missed in _newer_generations(d, old_ino):
+                    try:
+                        with open(missed, "rb") as g:
+                            for line in g:
+                                record = _parse(line)
+                                if record is not None:
+                                    yield record
+                    except FileNotFoundError:
+                        continue
+                f = open(path, "rb")
+                buf = b""
+                continue
+
+            if stop is not None and stop():
+                return
+            timeout = None
+            if idle_timeout is not None:
+                timeout = idle_timeout - (time.monotonic() - last_event)
+                if timeout <= 0:
+                    return
+            if stop is not None:
+                # Wake periodically so stop() gets re-checked
+                timeout = poll_interval if timeout is None else min(timeout, poll_interval)
+            watcher.wait(timeout)
+    finally:
+        watcher.close()
+        if f is not None:
+            f.close()
@@ -1,139 +1,461 @@
 """File lock system for multi-agent coordination.
 
 Lock files are stored as JSON under .aether/locks/ relative to the
-project root.  The encoded path uses URL-percent-style encoding so that
-any file path maps to a safe filename.
+project root, sharded by the SHA-256 of the locked path::
+
+    .aether/locks/3f/a2/3fa2…c9.lock     {"file": "src/app.py", "role": …}
+
+Names are fixed-length whatever the path depth, and no directory holds
+more than 256 entries, which keeps lookups fast on network
+filesystems.  The original path is stored inside the file.  Locks in
+the older flat layout (percent-encoded path as the filename) are still
+honoured, and moved into their shard the first time they are touched.
+
+A lock is created by hard-linking a fully written private file into
+place, which fails if the lock exists, so racing creators can never both
+win.  Removing a lock (release, expiry, steal) renames it aside and
+checks it is still the one that was read; a lock re-acquired in the
+meantime is linked back.  There is no atomic compare-and-delete on a
+filesystem, so one window remains: a creator that runs between the
+rename and the link-back takes the path, and the lock that was linked
+back loses.  That needs a removal racing both a release and a fresh
+acquire, and it is never silent: the displaced lock is logged as a
+``lost`` event naming its holder.
+
+Storage is pluggable: the module-level functions delegate to a
+:class:`LockBackend`.  The default :class:`FileLockBackend` keeps the
+layout above; setting ``AETHER_LOCK_URL=redis://host:port/db`` switches
+to :class:`aether.utils.redis_lock.RedisLockBackend` so roles spread over
+several hosts share one lock table.
 """
 
+import hashlib
 import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from urllib.parse import quote
 
+from aether.utils.lockevents import EventLog
+
 
 # Default stale-lock threshold in seconds (30 minutes)
 DEFAULT_STALE_SECONDS = 30 * 60
 
+# Environment variable selecting a non-file backend
+LOCK_URL_ENV = "AETHER_LOCK_URL"
+
 _LOCK_DIR_NAME = Path(".aether") / "locks"
 
+# Network backends keyed by (URL, project root), so repeated calls reuse
+# one connection
+_NETWORK_BACKENDS: dict = {}
+
+
+# Threads used by list_locks() to scan first-level shards
+_LIST_WORKERS = 8
+
+# Create attempts per acquire() when the lock keeps changing underneath us
+_CREATE_ATTEMPTS = 5
+
 
 def _lock_path(project_root: Path, filepath: str) -> Path:
-    """Return the .lock file path for *filepath* inside *project_root*."""
+    """Return the sharded .lock file path for *filepath* inside *project_root*."""
+    digest = hashlib.sha256(filepath.encode()).hexdigest()
+    return project_root / _LOCK_DIR_NAME / digest[:2] / digest[2:4] / f"{digest}.lock"
+
+
+def _legacy_lock_path(project_root: Path, filepath: str) -> Path:
+    """Return the pre-sharding flat .lock path for *filepath*."""
     encoded = quote(filepath, safe="")
     return project_root / _LOCK_DIR_NAME / f"{encoded}.lock"
 
 
-def _lock_dir(project_root: Path) -> Path:
-    d = project_root / _LOCK_DIR_NAME
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+def _migrate_legacy(project_root: Path, filepath: str, lp: Path) -> None:
+    """Move a flat-layout lock for *filepath* into its shard, if there is one."""
+    legacy = _legacy_lock_path(project_root, filepath)
+    if lp.exists() or not legacy.exists():
+        return
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        os.link(legacy, lp)  # Never clobbers a lock taken in the new layout meanwhile
+    except (FileNotFoundError, FileExistsError):
+        return  # Released, migrated or superseded by another process first
+    legacy.unlink(missing_ok=True)
 
 
-def acquire(
-    filepath: str,
-    role: str,
-    cli_tool: Optional[str] = None,
-    project_root: Optional[Path] = None,
-) -> bool:
-    """Attempt to acquire a lock on *filepath* for *role*.
+def _read_lock(lp: Path) -> Tuple[Optional[dict], bytes]:
+    """Return ``(info, raw bytes)`` for *lp*, or ``(None, b"")`` if it doesn't exist."""
+    try:
+        raw = lp.read_bytes()
+    except FileNotFoundError:
+        return None, b""
+    return json.loads(raw), raw
 
-    Returns True if the lock was acquired, False if already held.
-    Auto-expires stale locks before checking.
-    """
-    root = project_root or Path.cwd()
-    lp = _lock_path(root, filepath)
-    _lock_dir(root)
-
-    # Auto-expire stale lock
-    if lp.exists():
-        info = json.loads(lp.read_text())
-        acquired_ts = datetime.fromisoformat(info["acquired"])
-        age = (datetime.now(timezone.utc) - acquired_ts).total_seconds()
-        stale_after = info.get("stale_after", DEFAULT_STALE_SECONDS)
-        if age > stale_after:
-            lp.unlink()
-        else:
-            return False  # Lock is still valid
 
-    payload = {
+def _scratch(lp: Path, suffix: str) -> Path:
+    return lp.with_name(f"{lp.name}.{os.getpid()}.{threading.get_ident()}.{suffix}")
+
+
+def _create_lock(lp: Path, payload: dict) -> bool:
+    """Create *lp* holding *payload* unless a lock exists; return True if we did.
+
+    The payload is written to a private file and hard-linked into place:
+    ``link`` fails if the target exists, so exactly one of several racing
+    creators wins, and readers never see a partially written lock.
+    """
+    lp.parent.mkdir(parents=True, exist_ok=True)
+    tmp = _scratch(lp, "tmp")
+    tmp.write_text(json.dumps(payload, indent=2))
+    try:
+        os.link(tmp, lp)
+        return True
+    except FileExistsError:
+        return False
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _remove_lock(lp: Path, raw: bytes) -> Tuple[bool, Optional[dict]]:
+    """Remove *lp* only if it still holds *raw*.
+
+    Returns ``(removed, lost)``.  The lock is renamed aside atomically,
+    then compared.  If another process replaced it since we read it (a
+    racing expiry or release followed by a fresh acquire), their lock is
+    linked back untouched — unless yet another lock was created in the
+    meantime, in which case theirs can't be restored and is returned as
+    *lost*.
+    """
+    aside = _scratch(lp, "del")
+    try:
+        os.rename(lp, aside)
+    except FileNotFoundError:
+        return False, None
+    try:
+        displaced = aside.read_bytes()
+        if displaced == raw:
+            return True, None
+        try:
+            os.link(aside, lp)
+        except FileExistsError:
+            try:
+                return False, json.loads(displaced)
+            except json.JSONDecodeError:
+                return False, None
+        return False, None
+    finally:
+        aside.unlink(missing_ok=True)
+
+
+def _new_payload(filepath: str, role: str, cli_tool: Optional[str]) -> dict:
+    return {
         "role": role,
         "cli": cli_tool,
         "file": filepath,
         "acquired": datetime.now(timezone.utc).isoformat(),
         "stale_after": DEFAULT_STALE_SECONDS,
     }
-    lp.write_text(json.dumps(payload, indent=2))
-    return True
 
 
-def release(
-    filepath: str,
-    project_root: Optional[Path] = None,
-) -> Optional[dict]:
-    """Release the lock on *filepath*.
+def same_lock(info: dict, expected: dict) -> bool:
+    """Return True if *info* describes the very acquisition *expected* came from."""
+    return all(info.get(k) == expected.get(k) for k in ("role", "acquired", "token"))
 
-    Returns the lock metadata (useful for coordinator cross-role
-    notifications), or None if no lock existed.
+
+def _age_seconds(info: dict) -> float:
+    acquired_ts = datetime.fromisoformat(info["acquired"])
+    return (datetime.now(timezone.utc) - acquired_ts).total_seconds()
+
+
+def _is_stale(info: dict, age: float) -> bool:
+    return age > info.get("stale_after", DEFAULT_STALE_SECONDS)
+
+
+class LockBackend(ABC):
+    """Interface implemented by every lock store.
+
+    Lock info dicts always carry ``role``, ``cli``, ``file``, ``acquired``
+    and ``stale_after``; backends that support fencing add an integer
+    ``token`` that increases with every successful acquisition.
+    ``acquire`` returns the new lock's info (token included), or None if
+    the lock is held.  ``release`` with *expected* (lock info read
+    earlier) only removes that same acquisition, so a caller acting on
+    what it observed never removes a lock taken since.
+
+    When *events* is set, every transition is appended to that
+    :class:`~aether.utils.lockevents.EventLog`.
     """
-    root = project_root or Path.cwd()
-    lp = _lock_path(root, filepath)
 
-    if not lp.exists():
+    name = "base"
+    events: Optional[EventLog] = None
+
+    @abstractmethod
+    def acquire(
+        self,
+        filepath: str,
+        role: str,
+        cli_tool: Optional[str] = None,
+        force: bool = False,
+    ) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def release(
+        self,
+        filepath: str,
+        token: Optional[int] = None,
+        expected: Optional[dict] = None,
+    ) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def is_locked(self, filepath: str) -> Optional[dict]:
+        ...
+
+    @abstractmethod
+    def list_locks(self) -> list:
+        ...
+
+    def close(self) -> None:
+        """Release any resources (sockets, handles) held by the backend."""
+
+    def _emit(self, event: str, info: dict, **extra) -> None:
+        if self.events is not None:
+            self.events.emit(event, info, **extra)
+
+
+class FileLockBackend(LockBackend):
+    """Locks stored as JSON files under ``<project_root>/.aether/locks/``."""
+
+    name = "file"
+
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        events: Optional[EventLog] = None,
+    ):
+        self.root = project_root or Path.cwd()
+        self.events = events
+
+    def acquire(
+        self,
+        filepath: str,
+        role: str,
+        cli_tool: Optional[str] = None,
+        force: bool = False,
+    ) -> Optional[dict]:
+        lp = _lock_path(self.root, filepath)
+        _migrate_legacy(self.root, filepath, lp)
+
+        previous = None
+        for _ in range(_CREATE_ATTEMPTS):
+            payload = _new_payload(filepath, role, cli_tool)
+            if _create_lock(lp, payload):
+                if previous is not None:
+                    self._emit(
+                        "steal",
+                        payload,
+                        previous_role=previous["role"],
+                        previous_acquired=previous["acquired"],
+                    )
+                else:
+                    self._emit("acquire", payload)
+                return payload
+
+            info, raw = _read_lock(lp)
+            if info is None:
+                continue  # Released since our create failed
+            if _is_stale(info, _age_seconds(info)):
+                # Auto-expire; only the process that removes it reports it
+                if self._remove(lp, raw):
+                    self._emit("expire", info)
+            elif force:
+                if self._remove(lp, raw):
+                    previous = info
+            else:
+                self._emit("conflict", info, waiter=role)
+                return None  # Lock is still valid
         return None
 
-    info = json.loads(lp.read_text())
-    lp.unlink()
-    return info
+    def release(
+        self,
+        filepath: str,
+        token: Optional[int] = None,
+        expected: Optional[dict] = None,
+    ) -> Optional[dict]:
+        lp = _lock_path(self.root, filepath)
+        _migrate_legacy(self.root, filepath, lp)
+
+        info, raw = _read_lock(lp)
+        if info is None:
+            return None
+        if token is not None and info.get("token", token) != token:
+            return None
+        if expected is not None and not same_lock(info, expected):
+            return None
+        if not self._remove(lp, raw):
+            return None  # Released and re-acquired by someone else meanwhile
+
+        self._emit("release", info)
+        return info
+
+    def is_locked(self, filepath: str) -> Optional[dict]:
+        lp = _lock_path(self.root, filepath)
+        _migrate_legacy(self.root, filepath, lp)
+
+        info, raw = _read_lock(lp)
+        if info is None:
+            return None
+
+        age = _age_seconds(info)
+        if _is_stale(info, age):
+            if self._remove(lp, raw):
+                self._emit("expire", info)
+            return None
+
+        info["age_seconds"] = int(age)
+        return info
+
+    def _remove(self, lp: Path, raw: bytes) -> bool:
+        removed, lost = _remove_lock(lp, raw)
+        if lost is not None:
+            self._emit("lost", lost, holder=(_read_lock(lp)[0] or {}).get("role"))
+        return removed
+
+    def list_locks(self) -> list:
+        lock_dir = self.root / _LOCK_DIR_NAME
+
+        try:
+            entries = list(os.scandir(lock_dir))
+        except FileNotFoundError:
+            return []
+
+        # Flat-layout files sit at the top level; shards are two-hex-char dirs
+        legacy = [Path(e.path) for e in entries if e.name.endswith(".lock") and e.is_file()]
+        shards = [e.path for e in entries if len(e.name) == 2 and e.is_dir()]
+
+        locks = self._read_locks(legacy)
+        if len(shards) > 1:
+            with ThreadPoolExecutor(max_workers=min(_LIST_WORKERS, len(shards))) as pool:
+                for found in pool.map(self._scan_shard, shards):
+                    locks.extend(found)
+        else:
+            for shard in shards:
+                locks.extend(self._scan_shard(shard))
+        return locks
+
+    def _scan_shard(self, shard: str) -> list:
+        paths = []
+        try:
+            subdirs = [e.path for e in os.scandir(shard) if e.is_dir()]
+        except FileNotFoundError:
+            return []
+        for sub in subdirs:
+            try:
+                paths.extend(Path(e.path) for e in os.scandir(sub) if e.name.endswith(".lock"))
+            except FileNotFoundError:
+                continue
+        return self._read_locks(paths)
+
+    def _read_locks(self, paths: list) -> list:
+        locks = []
+        for lf in paths:
+            try:
+                info, raw = _read_lock(lf)
+                if info is None:
+                    continue
+                age = _age_seconds(info)
+
+                if _is_stale(info, age):
+                    if self._remove(lf, raw):
+                        self._emit("expire", info)
+                    continue
+
+                info["age_seconds"] = int(age)
+                locks.append(info)
+            except (json.JSONDecodeError, KeyError):
+                continue
+        return locks
 
 
-def is_locked(
-    filepath: str,
+def get_backend(
     project_root: Optional[Path] = None,
-) -> Optional[dict]:
-    """Return lock info dict if *filepath* is locked (and not stale), else None."""
+    url: Optional[str] = None,
+) -> LockBackend:
+    """Return the lock backend selected by *url* or ``$AETHER_LOCK_URL``.
+
+    ``redis://host:port/db`` selects the network backend; anything else
+    (including unset) falls back to the file backend rooted at
+    *project_root*.  Either way, events go to *project_root*'s log.
+    """
     root = project_root or Path.cwd()
-    lp = _lock_path(root, filepath)
+    url = url or os.getenv(LOCK_URL_ENV)
+    if url and url.startswith("redis://"):
+        key = (url, root.resolve())
+        if key not in _NETWORK_BACKENDS:
+            from aether.utils.redis_lock import RedisLockBackend
 
-    if not lp.exists():
-        return None
+            _NETWORK_BACKENDS[key] = RedisLockBackend.from_url(url, events=EventLog(root))
+        return _NETWORK_BACKENDS[key]
+    return FileLockBackend(root, events=EventLog(root))
 
-    info = json.loads(lp.read_text())
-    acquired_ts = datetime.fromisoformat(info["acquired"])
-    age = (datetime.now(timezone.utc) - acquired_ts).total_seconds()
-    stale_after = info.get("stale_after", DEFAULT_STALE_SECONDS)
 
-    if age > stale_after:
-        lp.unlink()
-        return None
+def acquire(
+    filepath: str,
+    role: str,
+    cli_tool: Optional[str] = None,
+    project_root: Optional[Path] = None,
+    backend: Optional[LockBackend] = None,
+    force: bool = False,
+) -> Optional[dict]:
+    """Attempt to acquire a lock on *filepath* for *role*.
 
-    info["age_seconds"] = int(age)
-    return info
+    Returns the new lock's info if it was acquired (including its
+    fencing ``token`` on backends that issue one), None if already held.
+    Auto-expires stale locks before checking.  With *force*, a live lock
+    held by another role is taken over (logged as a ``steal``).
+    """
+    be = backend or get_backend(project_root)
+    return be.acquire(filepath, role, cli_tool, force=force)
 
 
-def list_locks(project_root: Optional[Path] = None) -> list:
-    """Return a list of all active (non-stale) lock info dicts."""
-    root = project_root or Path.cwd()
-    lock_dir = root / _LOCK_DIR_NAME
+def release(
+    filepath: str,
+    project_root: Optional[Path] = None,
+    token: Optional[int] = None,
+    backend: Optional[LockBackend] = None,
+    expected: Optional[dict] = None,
+) -> Optional[dict]:
+    """Release the lock on *filepath*.
 
-    if not lock_dir.exists():
-        return []
+    Returns the lock metadata (useful for coordinator cross-role
+    notifications), or None if no lock existed.  When *token* is given
+    and the backend supports fencing, the lock is only released if it is
+    still held under that token.  When *expected* is given, only if it
+    is still the acquisition that info was read from.
+    """
+    be = backend or get_backend(project_root)
+    return be.release(filepath, token=token, expected=expected)
 
-    locks = []
-    for lf in lock_dir.glob("*.lock"):
-        try:
-            info = json.loads(lf.read_text())
-            acquired_ts = datetime.fromisoformat(info["acquired"])
-            age = (datetime.now(timezone.utc) - acquired_ts).total_seconds()
-            stale_after = info.get("stale_after", DEFAULT_STALE_SECONDS)
 
-            if age > stale_after:
-                lf.unlink()
-                continue
+def is_locked(
+    filepath: str,
+    project_root: Optional[Path] = None,
+    backend: Optional[LockBackend] = None,
+) -> Optional[dict]:
+    """Return lock info dict if *filepath* is locked (and not stale), else None."""
+    be = backend or get_backend(project_root)
+    return be.is_locked(filepath)
 
-            info["age_seconds"] = int(age)
-            locks.append(info)
-        except (json.JSONDecodeError, KeyError):
-            continue
 
-    return locks
+def list_locks(
+    project_root: Optional[Path] = None,
+    backend: Optional[LockBackend] = None,
+) -> list:
+    """Return a list of all active (non-stale) lock info dicts."""
+    be = backend or get_backend(project_root)
+    return be.list_locks()
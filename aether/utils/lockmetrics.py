@@ -0,0 +1,251 @@
+"""Lock contention metrics derived from the lock event log.
+
+Rather than adding a write to every lock operation, metrics are folded
+incrementally out of :mod:`aether.utils.lockevents`: each call to
+:meth:`LockMetrics.update` reads only the events appended since the
+stored cursor and updates per-file and per-role aggregates:
+
+- ``acquisitions``, ``conflicts``, ``steals``, ``expiries`` counters;
+  a role retrying a refused lock counts as one conflict until it gets the
+  lock or gives up
+- ``wait`` histogram — first refused attempt by a role until it gets the
+  lock or gives up (``abandon``)
+- ``hold`` histogram — acquisition until release, expiry or steal
+  (a lock ``lost`` to a racing removal counts as stolen)
+
+Aggregates live in ``.aether/metrics/locks.json``.  Histograms use fixed
+buckets so the store stays small no matter how many events are folded.
+
+Events are only folded when someone asks (``aether locks --stats``), so
+if the log rotates past events that were never read they are lost.
+Each such gap is counted (:attr:`LockMetrics.gaps`) and reported with
+the stats, since every counter undercounts from then on.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aether.utils import lockevents
+
+
+METRICS_PATH = Path(".aether") / "metrics" / "locks.json"
+
+# Upper bounds (seconds) of the wait/hold histogram buckets; +Inf is implicit
+BUCKETS = (0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 1800, 3600)
+
+_COUNTERS = ("acquisitions", "conflicts", "steals", "expiries")
+
+# Waits never resolved (the role gave up) are forgotten after a day
+PENDING_TTL_SECONDS = 24 * 60 * 60
+
+
+def _new_hist() -> dict:
+    return {"counts": [0] * (len(BUCKETS) + 1), "sum": 0.0, "count": 0}
+
+
+def _observe(hist: dict, value: float) -> None:
+    value = max(value, 0.0)
+    for i, bound in enumerate(BUCKETS):
+        if value <= bound:
+            break
+    else:
+        i = len(BUCKETS)
+    hist["counts"][i] += 1
+    hist["sum"] += value
+    hist["count"] += 1
+
+
+def hist_quantile(hist: dict, q: float) -> Optional[float]:
+    """Return the upper bound of the bucket holding quantile *q* (None if empty)."""
+    if not hist["count"]:
+        return None
+    target = q * hist["count"]
+    seen = 0
+    for i, n in enumerate(hist["counts"]):
+        seen += n
+        if seen >= target:
+            return BUCKETS[i] if i < len(BUCKETS) else float("inf")
+    return float("inf")
+
+
+def hist_mean(hist: dict) -> Optional[float]:
+    return hist["sum"] / hist["count"] if hist["count"] else None
+
+
+def _new_entry() -> dict:
+    entry: dict = {name: 0 for name in _COUNTERS}
+    entry["wait"] = _new_hist()
+    entry["hold"] = _new_hist()
+    return entry
+
+
+def _held_for(ts: float, acquired: Optional[str]) -> Optional[float]:
+    if not acquired:
+        return None
+    try:
+        return ts - datetime.fromisoformat(acquired).timestamp()
+    except ValueError:
+        return None
+
+
+class LockMetrics:
+    """Per-file and per-role lock aggregates for one project."""
+
+    def __init__(self, project_root: Optional[Path] = None):
+        self.root = project_root or Path.cwd()
+        self.path = self.root / METRICS_PATH
+        self.cursor: Optional[dict] = None
+        self.files: Dict[str, dict] = {}
+        self.roles: Dict[str, dict] = {}
+        # "role\0file" -> timestamp of the first refused attempt
+        self.pending: Dict[str, float] = {}
+
+    @classmethod
+    def load(cls, project_root: Optional[Path] = None) -> "LockMetrics":
+        metrics = cls(project_root)
+        try:
+            data = json.loads(metrics.path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return metrics
+        metrics.cursor = data.get("cursor")
+        metrics.files = data.get("files", {})
+        metrics.roles = data.get("roles", {})
+        metrics.pending = data.get("pending", {})
+        return metrics
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "cursor": self.cursor,
+            "files": self.files,
+            "roles": self.roles,
+            "pending": self.pending,
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, separators=(",", ":")))
+        os.replace(tmp, self.path)
+
+    @property
+    def gaps(self) -> int:
+        """Times unread events were rotated out of the log before being folded."""
+        return (self.cursor or {}).get("gaps", 0)
+
+    def update(self) -> int:
+        """Fold events appended since the last update; return how many."""
+        events, self.cursor = lockevents.read_since(self.root, self.cursor)
+        for event in events:
+            self.observe(event)
+        if events:
+            horizon = events[-1].get("ts", 0.0) - PENDING_TTL_SECONDS
+            self.pending = {k: v for k, v in self.pending.items() if v >= horizon}
+        return len(events)
+
+    def _entries(self, file: Optional[str], role: Optional[str]) -> List[dict]:
+        entries = []
+        if file:
+            entries.append(self.files.setdefault(file, _new_entry()))
+        if role:
+            entries.append(self.roles.setdefault(role, _new_entry()))
+        return entries
+
+    def observe(self, event: dict) -> None:
+        kind, ts = event.get("event"), event.get("ts", 0.0)
+        file, role = event.get("file"), event.get("role")
+
+        if kind == "conflict":
+            waiter = event.get("waiter")
+            key = f"{waiter}\0{file}"
+            if key in self.pending:
+                return  # A retry of a wait already counted
+            for entry in self._entries(file, waiter):
+                entry["conflicts"] += 1
+            self.pending[key] = ts
+            return
+
+        if kind == "abandon":
+            started = self.pending.pop(f"{role}\0{file}", None)
+            if started is not None:
+                for entry in self._entries(file, role):
+                    _observe(entry["wait"], ts - started)
+            return
+
+        if kind in ("acquire", "steal"):
+            started = self.pending.pop(f"{role}\0{file}", None)
+            for entry in self._entries(file, role):
+                entry["acquisitions"] += 1
+                if started is not None:
+                    _observe(entry["wait"], ts - started)
+            if kind == "steal":
+                previous = event.get("previous_role")
+                held = _held_for(ts, event.get("previous_acquired"))
+                for entry in self._entries(file, previous):
+                    entry["steals"] += 1
+                    if held is not None:
+                        _observe(entry["hold"], held)
+            return
+
+        if kind == "lost":
+            held = _held_for(ts, event.get("acquired"))
+            for entry in self._entries(file, role):
+                entry["steals"] += 1
+                if held is not None:
+                    _observe(entry["hold"], held)
+            return
+
+        if kind in ("release", "expire"):
+            held = _held_for(ts, event.get("acquired"))
+            for entry in self._entries(file, role):
+                if kind == "expire":
+                    entry["expiries"] += 1
+                if held is not None:
+                    _observe(entry["hold"], held)
+
+    def top_files(self, n: int = 10) -> List[tuple]:
+        """Return the *n* most contended ``(path, entry)`` pairs."""
+        ranked = sorted(
+            self.files.items(),
+            key=lambda kv: (kv[1]["conflicts"], kv[1]["wait"]["sum"], kv[1]["acquisitions"]),
+            reverse=True,
+        )
+        return ranked[:n]
+
+    def to_prometheus(self) -> str:
+        """Render all aggregates in the Prometheus text exposition format."""
+        lines: List[str] = [
+            "# TYPE aether_lock_event_gaps_total counter",
+            f"aether_lock_event_gaps_total {self.gaps}",
+        ]
+        for scope, label, table in (("file", "file", self.files), ("role", "role", self.roles)):
+            for name in _COUNTERS:
+                metric = f"aether_lock_{scope}_{name}_total"
+                lines.append(f"# TYPE {metric} counter")
+                for key, entry in sorted(table.items()):
+                    lines.append(f'{metric}{{{label}="{_escape(key)}"}} {entry[name]}')
+            for name in ("wait", "hold"):
+                metric = f"aether_lock_{scope}_{name}_seconds"
+                lines.append(f"# TYPE {metric} histogram")
+                for key, entry in sorted(table.items()):
+                    hist = entry[name]
+                    labels = f'{label}="{_escape(key)}"'
+                    cumulative = 0
+                    for bound, count in zip(BUCKETS + ("+Inf",), hist["counts"]):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                    lines.append(f"{metric}_sum{{{labels}}} {hist['sum']}")
+                    lines.append(f"{metric}_count{{{labels}}} {hist['count']}")
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: Path) -> None:
+        """Atomically write :meth:`to_prometheus` to *path* (textfile collector)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(self.to_prometheus())
+        os.replace(tmp, path)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
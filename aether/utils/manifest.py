@@ -0,0 +1,209 @@
+"""Template manifest for generated projects, used by ``aether init --update``.
+
+``init`` records every file it generates in ``.aether/manifest.json``::
+
+    {"version": 1, "project_name": "My Bot", "agent_name": "my_bot",
+     "files": {"project.dana": {"template": "project.dana",
+                                "template_sha": "…", "sha": "…"}}}
+
+``template_sha`` hashes the raw template and ``sha`` the rendered text
+as written; a copy of that rendered text is kept under ``.aether/base/``
+as the merge base.  On update, a file whose template hash is unchanged
+is skipped without reading it, so syncing many projects costs one
+manifest read each.  A changed template is written straight over files
+the user hasn't touched, and three-way merged into files they have.
+"""
+
+import hashlib
+import json
+import os
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+MANIFEST_PATH = Path(".aether") / "manifest.json"
+BASE_DIR = Path(".aether") / "base"
+MANIFEST_VERSION = 1
+
+CONFLICT_START = "<<<<<<< yours"
+CONFLICT_MID = "======="
+CONFLICT_END = ">>>>>>> template"
+
+# Template digests keyed by absolute path -> ((mtime_ns, size), sha)
+_TEMPLATE_CACHE: Dict[str, Tuple[Tuple[int, int], str]] = {}
+
+
+def digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def template_digest(path: Path) -> str:
+    """Return the sha256 of template *path*, cached until it changes."""
+    key = os.path.abspath(path)
+    st = os.stat(key)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached and cached[0] == stamp:
+        return cached[1]
+    sha = hashlib.sha256(Path(key).read_bytes()).hexdigest()
+    _TEMPLATE_CACHE[key] = (stamp, sha)
+    return sha
+
+
+def load(project_dir: Path) -> Optional[dict]:
+    try:
+        return json.loads((project_dir / MANIFEST_PATH).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def new_manifest(project_name: str, agent_name: str) -> dict:
+    return {
+        "version": MANIFEST_VERSION,
+        "project_name": project_name,
+        "agent_name": agent_name,
+        "files": {},
+    }
+
+
+def save(project_dir: Path, manifest: dict) -> None:
+    _write(project_dir / MANIFEST_PATH, json.dumps(manifest, indent=2, sort_keys=True))
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(text)
+    os.replace(tmp, path)
+
+
+def record(project_dir: Path, manifest: dict, dest: str, template: str, template_sha: str, rendered: str) -> None:
+    """Note that *dest* now corresponds to *rendered* from *template*."""
+    manifest["files"][dest] = {"template": template, "template_sha": template_sha, "sha": digest(rendered)}
+    _write(project_dir / BASE_DIR / dest, rendered)
+
+
+def sync_file(
+    project_dir: Path,
+    manifest: dict,
+    dest: str,
+    template: str,
+    template_sha: str,
+    rendered: str,
+) -> str:
+    """Bring *dest* up to date with its template; return what happened.
+
+    One of ``unchanged``, ``created``, ``updated``, ``merged``,
+    ``conflict``, ``deleted`` (removed locally, left alone) or ``adopted``
+    (no manifest entry yet; the current template becomes the base).
+    """
+    entry = manifest["files"].get(dest)
+    if entry and entry["template_sha"] == template_sha:
+        return "unchanged"
+
+    path = project_dir / dest
+    try:
+        current = path.read_text()
+    except FileNotFoundError:
+        if entry:
+            return "deleted"
+        _write(path, rendered)
+        record(project_dir, manifest, dest, template, template_sha, rendered)
+        return "created"
+
+    if entry is None:
+        # Generated before manifests existed: we can't tell what the user changed
+        record(project_dir, manifest, dest, template, template_sha, rendered)
+        return "adopted"
+
+    status = "updated"
+    if digest(current) != entry["sha"] and current != rendered:
+        try:
+            base = (project_dir / BASE_DIR / dest).read_text()
+        except FileNotFoundError:
+            base = ""
+        merged, conflicts = merge3(current, base, rendered)
+        rendered_out, status = merged, ("conflict" if conflicts else "merged")
+    else:
+        rendered_out = rendered
+    _write(path, rendered_out)
+    record(project_dir, manifest, dest, template, template_sha, rendered)
+    return status
+
+
+# ── three-way merge ───────────────────────────────────────────────────────────
+
+
+def _hunks(base: List[str], other: List[str]) -> List[Tuple[int, int, List[str]]]:
+    """Return ``(base_start, base_end, replacement)`` for each change base→other."""
+    matcher = SequenceMatcher(None, base, other, autojunk=False)
+    return [
+        (i1, i2, other[j1:j2])
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes()
+        if tag != "equal"
+    ]
+
+
+def _apply(base: List[str], hunks: List[Tuple[int, int, List[str]]], lo: int, hi: int) -> List[str]:
+    """Return base[lo:hi] with *hunks* (all inside that range) applied."""
+    out, pos = [], lo
+    for start, end, lines in hunks:
+        out.extend(base[pos:start])
+        out.extend(lines)
+        pos = end
+    out.extend(base[pos:hi])
+    return out
+
+
+def merge3(ours: str, base: str, theirs: str) -> Tuple[str, int]:
+    """Line-based three-way merge; return (text, number of conflicts).
+
+    Changes on only one side are applied; overlapping changes that
+    differ are wrapped in ``<<<<<<< yours`` / ``>>>>>>> template`` markers.
+    """
+    base_l = base.splitlines(keepends=True)
+    ours_l = ours.splitlines(keepends=True)
+    theirs_l = theirs.splitlines(keepends=True)
+    for lines in (base_l, ours_l, theirs_l):
+        if lines and not lines[-1].endswith("\n"):
+            lines[-1] += "\n"
+
+    changes = sorted(
+        [(s, e, lines, 0) for s, e, lines in _hunks(base_l, ours_l)]
+        + [(s, e, lines, 1) for s, e, lines in _hunks(base_l, theirs_l)],
+        key=lambda h: (h[0], h[1]),
+    )
+
+    out: List[str] = []
+    conflicts = pos = i = 0
+    while i < len(changes):
+        # Group changes whose base ranges overlap (or are insertions at the same point)
+        lo, hi = changes[i][0], changes[i][1]
+        group = [changes[i]]
+        i += 1
+        while i < len(changes) and (changes[i][0] < hi or changes[i][0] == lo == hi or changes[i][0] == hi == changes[i][1]):
+            hi = max(hi, changes[i][1])
+            group.append(changes[i])
+            i += 1
+
+        out.extend(base_l[pos:lo])
+        pos = hi
+        mine = [(s, e, lines) for s, e, lines, side in group if side == 0]
+        other = [(s, e, lines) for s, e, lines, side in group if side == 1]
+        if not other:
+            out.extend(_apply(base_l, mine, lo, hi))
+        elif not mine:
+            out.extend(_apply(base_l, other, lo, hi))
+        else:
+            a, b = _apply(base_l, mine, lo, hi), _apply(base_l, other, lo, hi)
+            if a == b:
+                out.extend(a)
+            else:
+                conflicts += 1
+                out.append(CONFLICT_START + "\n")
+                out.extend(a)
+                out.append(CONFLICT_MID + "\n")
+                out.extend(b)
+                out.append(CONFLICT_END + "\n")
+    out.extend(base_l[pos:])
+    return "".join(out), conflicts
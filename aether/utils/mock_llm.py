@@ -0,0 +1,148 @@
+"""Local stand-in for an OpenAI-compatible streaming chat endpoint.
+
+Answers ``POST …/chat/completions`` with ``"stream": true`` the way
+hosted providers do: an HTTP/1.1 chunked ``text/event-stream`` of
+``data: {"choices": [{"delta": {"content": …}}]}`` events, ending with
+``data: [DONE]``.  Latency is configurable per model, so
+``aether config --probe`` can be tested and demonstrated offline::
+
+    with MockLLMServer(keys={"sk-test"}, ttft={"slow-model": 0.3}) as server:
+        ...  # aether config --probe --base-url {server.url}
+
+Run standalone with ``python -m aether.utils.mock_llm --port 8901``.
+"""
+
+import argparse
+import http.server
+import json
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):  # Keep test and benchmark output quiet
+        pass
+
+    def _json(self, status: int, payload: dict) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _chunk(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def do_POST(self):
+        cfg = self.server.config
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b"{}")
+        except json.JSONDecodeError:
+            return self._json(400, {"error": {"message": "invalid JSON"}})
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._json(404, {"error": {"message": f"unknown path {self.path}"}})
+        key = self.headers.get("Authorization", "").removeprefix("Bearer ").strip()
+        if cfg["keys"] is not None and key not in cfg["keys"]:
+            return self._json(401, {"error": {"message": "Incorrect API key provided"}})
+
+        model = request.get("model", "")
+        tokens = min(int(request.get("max_tokens") or cfg["tokens"]), cfg["tokens"])
+        time.sleep(cfg["ttft"].get(model, cfg["default_ttft"]))
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i in range(tokens):
+            if i:
+                time.sleep(cfg["token_delay"])
+            event = {"model": model, "choices": [{"index": 0, "delta": {"content": f" {i + 1}"}}]}
+            self._chunk(b"data: " + json.dumps(event).encode() + b"\n\n")
+        usage = {"model": model, "choices": [], "usage": {"completion_tokens": tokens}}
+        self._chunk(b"data: " + json.dumps(usage).encode() + b"\n\n")
+        self._chunk(b"data: [DONE]\n\n")
+        self._chunk(b"")
+
+
+class _Server(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+
+class MockLLMServer:
+    """A streaming chat-completions endpoint on a background thread, bound to 127.0.0.1."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        keys: Optional[Set[str]] = None,
+        ttft: Optional[Dict[str, float]] = None,
+        default_ttft: float = 0.02,
+        token_delay: float = 0.002,
+        tokens: int = 20,
+    ):
+        self._server = _Server((host, port), _Handler)
+        self._server.config = {
+            "keys": keys,
+            "ttft": ttft or {},
+            "default_ttft": default_ttft,
+            "token_delay": token_delay,
+            "tokens": tokens,
+        }
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "MockLLMServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "MockLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Mock OpenAI-compatible streaming endpoint")
+    parser.add_argument("--port", type=int, default=8901)
+    parser.add_argument("--ttft", type=float, default=0.2, help="Seconds before the first token")
+    parser.add_argument("--token-delay", type=float, default=0.01)
+    parser.add_argument("--tokens", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    server = MockLLMServer(port=args.port, default_ttft=args.ttft,
+                           token_delay=args.token_delay, tokens=args.tokens)
+    print(f"Serving mock chat completions on {server.url}  (Ctrl-C to stop)")
+    try:
+        server._server.serve_forever(0.05)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+
+
+if __name__ == "__main__":
+    main()
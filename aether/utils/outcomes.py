@@ -0,0 +1,155 @@
+"""Collect role outcomes from captured pane logs.
+
+Briefs ask each role to print its final outcome between two marker
+lines::
+
+    <<<OUTCOME
+    ...
+    OUTCOME>>>
+
+:class:`OutcomeCollector` scans the ring-buffered logs written by
+:mod:`aether.utils.panelog`, starting from a saved ``(seq, offset)``
+cursor per role, so every run only reads bytes appended since the last
+one.  Completed blocks are appended to a single JSON document,
+``.aether/outcomes/<session>.json``.
+"""
+
+import json
+import os
+import re
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from aether.utils import panelog
+
+OUTCOME_START = "<<<OUTCOME"
+OUTCOME_END = "OUTCOME>>>"
+
+OUTCOMES_DIR_NAME = Path(".aether") / "outcomes"
+
+# Bound what a single outcome or an unterminated line may hold in memory
+MAX_OUTCOME_CHARS = 256 * 1024
+MAX_LINE_BYTES = 64 * 1024
+
+_ANSI_RE = re.compile(r"\x1b\[[0-?]*[ -/]*[@-~]|\x1b\][^\x07\x1b]*(?:\x07|\x1b\\)|\x1b[@-Z\\-_]")
+
+
+def _clean(line: str) -> str:
+    """Strip terminal escapes and carriage-return overdraws from *line*."""
+    line = _ANSI_RE.sub("", line).rstrip("\r")
+    return line.rsplit("\r", 1)[-1]
+
+
+def outcomes_path(session: str, project_root: Optional[Path] = None) -> Path:
+    return (project_root or Path.cwd()) / OUTCOMES_DIR_NAME / f"{session}.json"
+
+
+class OutcomeCollector:
+    """Incrementally extract outcome blocks from one session's pane logs."""
+
+    def __init__(self, log_dir: Path, session: str, project_root: Optional[Path] = None):
+        self.log_dir = Path(log_dir)
+        self.session = session
+        self.doc_path = outcomes_path(session, project_root)
+        self.state_path = self.log_dir / ".collect.json"
+
+        self.state: Dict[str, dict] = {}
+        self.doc: dict = {"session": session, "updated": None, "roles": {}}
+        try:
+            self.state = json.loads(self.state_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        try:
+            self.doc = json.loads(self.doc_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+
+    def collect(self) -> List[dict]:
+        """Scan new pane output for every role; return newly completed outcomes."""
+        found: List[dict] = []
+        for role in panelog.list_roles(self.log_dir):
+            found.extend(self._collect_role(role))
+        if found:
+            for outcome in found:
+                self.doc["roles"].setdefault(outcome["role"], []).append(outcome)
+            self.doc["updated"] = datetime.now(timezone.utc).isoformat()
+        return found
+
+    def _collect_role(self, role: str) -> List[dict]:
+        st = self.state.setdefault(
+            role, {"seq": 0, "offset": 0, "carry": "", "in_block": False, "block": [], "gaps": 0}
+        )
+        segments = panelog.list_segments(self.log_dir, role)
+        if not segments:
+            return []
+
+        oldest = segments[0][0]
+        if st["seq"] < oldest:
+            # The ring overwrote output we never read; resume at the oldest segment
+            st.update(seq=oldest, offset=0, carry="", in_block=False, block=[])
+            st["gaps"] += 1
+
+        carry = st["carry"].encode("utf-8", "surrogateescape")
+        found: List[dict] = []
+        for seq, path in segments:
+            if seq < st["seq"]:
+                continue
+            offset = st["offset"] if seq == st["seq"] else 0
+            try:
+                with open(path, "rb") as f:
+                    f.seek(offset)
+                    data = f.read()
+            except FileNotFoundError:
+                continue
+            st["seq"], st["offset"] = seq, offset + len(data)
+
+            data = carry + data
+            *lines, carry = data.split(b"\n")
+            if len(carry) > MAX_LINE_BYTES:
+                carry = b""  # A runaway line (progress bar, spinner); drop it
+            for raw in lines:
+                outcome = self._feed(st, role, _clean(raw.decode("utf-8", "replace")))
+                if outcome:
+                    found.append(outcome)
+
+        st["carry"] = carry.decode("utf-8", "surrogateescape")
+        return found
+
+    @staticmethod
+    def _feed(st: dict, role: str, line: str) -> Optional[dict]:
+        marker = line.strip()
+        if not st["in_block"]:
+            if marker == OUTCOME_START:
+                st["in_block"], st["block"], st["size"] = True, [], 0
+            return None
+        if marker == OUTCOME_END:
+            st["in_block"] = False
+            text = "\n".join(st.pop("block")).strip()
+            outcome = {"role": role, "ts": time.time(), "text": text}
+            if st.pop("size", 0) > MAX_OUTCOME_CHARS:
+                outcome["truncated"] = True
+            st["block"] = []
+            return outcome
+        st["size"] = st.get("size", 0) + len(line) + 1
+        if st["size"] <= MAX_OUTCOME_CHARS:
+            st["block"].append(line)
+        return None
+
+    def save(self) -> None:
+        for path, data in ((self.state_path, self.state), (self.doc_path, self.doc)):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_text(json.dumps(data, indent=2))
+            os.replace(tmp, path)
+
+    def to_markdown(self) -> str:
+        lines = [f"# Outcomes — {self.session}", ""]
+        for role, outcomes in sorted(self.doc["roles"].items()):
+            lines.append(f"## {role}")
+            lines.append("")
+            for outcome in outcomes:
+                lines.append(outcome["text"])
+                lines.append("")
+        return "\n".join(lines)
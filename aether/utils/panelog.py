@@ -0,0 +1,136 @@
+"""Ring-buffered pane log writer, fed by ``tmux pipe-pane``.
+
+tmux pipes everything a pane prints into::
+
+    python -m aether.utils.panelog <log_dir> <role>
+
+which copies stdin into numbered segment files ``<role>.<seq>.log``.
+Once a segment reaches ``segment_bytes`` the next one is started and the
+oldest beyond ``segments`` are deleted, so each role uses at most
+``segments × segment_bytes`` of disk and a fixed-size read buffer of
+memory however long the pane runs.  Sequence numbers only ever grow,
+which lets readers keep a ``(seq, offset)`` cursor across rotations.
+"""
+
+import argparse
+import os
+import re
+import sys
+from pathlib import Path
+from typing import List, Tuple
+
+# Four 1 MiB segments per role by default
+DEFAULT_SEGMENT_BYTES = 1024 * 1024
+DEFAULT_SEGMENTS = 4
+
+_READ_SIZE = 64 * 1024
+
+
+def _segment_re(role: str) -> "re.Pattern[str]":
+    return re.compile(rf"^{re.escape(role)}\.(\d+)\.log$")
+
+
+def segment_path(log_dir: Path, role: str, seq: int) -> Path:
+    return Path(log_dir) / f"{role}.{seq:06d}.log"
+
+
+def list_segments(log_dir: Path, role: str) -> List[Tuple[int, Path]]:
+    """Return ``[(seq, path)]`` for *role*, oldest first."""
+    pattern = _segment_re(role)
+    found = []
+    try:
+        entries = os.listdir(log_dir)
+    except FileNotFoundError:
+        return []
+    for name in entries:
+        m = pattern.match(name)
+        if m:
+            found.append((int(m.group(1)), Path(log_dir) / name))
+    return sorted(found)
+
+
+def list_roles(log_dir: Path) -> List[str]:
+    """Return the roles that have at least one segment in *log_dir*."""
+    roles = set()
+    try:
+        entries = os.listdir(log_dir)
+    except FileNotFoundError:
+        return []
+    for name in entries:
+        m = re.match(r"^(.+)\.(\d+)\.log$", name)
+        if m:
+            roles.add(m.group(1))
+    return sorted(roles)
+
+
+class RingLog:
+    """Append bytes to a bounded ring of segment files."""
+
+    def __init__(
+        self,
+        log_dir: Path,
+        role: str,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        segments: int = DEFAULT_SEGMENTS,
+    ):
+        self.dir = Path(log_dir)
+        self.role = role
+        self.segment_bytes = segment_bytes
+        self.segments = max(segments, 1)
+        self.dir.mkdir(parents=True, exist_ok=True)
+
+        existing = list_segments(self.dir, role)
+        self.seq = existing[-1][0] if existing else 0
+        self._open(self.seq)
+
+    def _open(self, seq: int) -> None:
+        self.seq = seq
+        self._f = open(segment_path(self.dir, self.role, seq), "ab", buffering=0)
+        self._size = self._f.tell()
+
+    def _rotate(self) -> None:
+        self._f.close()
+        self._open(self.seq + 1)
+        for seq, path in list_segments(self.dir, self.role):
+            if seq <= self.seq - self.segments:
+                path.unlink(missing_ok=True)
+
+    def write(self, data: bytes) -> None:
+        while data:
+            if self._size >= self.segment_bytes:
+                self._rotate()
+            room = self.segment_bytes - self._size
+            chunk, data = data[:room], data[room:]
+            self._f.write(chunk)
+            self._size += len(chunk)
+
+    def close(self) -> None:
+        self._f.close()
+
+
+def pump(stream, ring: RingLog) -> None:
+    """Copy *stream* into *ring* until EOF."""
+    while True:
+        data = stream.read1(_READ_SIZE) if hasattr(stream, "read1") else stream.read(_READ_SIZE)
+        if not data:
+            return
+        ring.write(data)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Ring-buffered pane log writer")
+    parser.add_argument("log_dir", type=Path)
+    parser.add_argument("role")
+    parser.add_argument("--segment-bytes", type=int, default=DEFAULT_SEGMENT_BYTES)
+    parser.add_argument("--segments", type=int, default=DEFAULT_SEGMENTS)
+    args = parser.parse_args(argv)
+
+    ring = RingLog(args.log_dir, args.role, args.segment_bytes, args.segments)
+    try:
+        pump(sys.stdin.buffer, ring)
+    finally:
+        ring.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Concurrent key validation and latency probing for LLM providers.
+
+Each configured provider's models are sent one small streaming chat
+completion over its OpenAI-compatible endpoint.  For every model we
+record:
+
+* ``status`` — ``ok``, ``auth`` (key rejected), ``error`` or ``timeout``
+* ``ttft_ms`` — request start (including connect/TLS) to first content token
+* ``tokens_per_s`` — streamed tokens over the time after the first one
+
+Probes run concurrently on one asyncio loop, capped by a global
+concurrency limit and a per-provider request rate, each with its own
+timeout.  Successful results are cached in ``.aether/cache/probe.json``
+(keyed by a hash of the API key, never the key itself) so repeated runs
+and agents choosing a model don't hit the providers again until the
+cache is older than its TTL.  Failures are never cached: a fixed key or
+a recovered provider shows up on the next run.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import ssl
+import time
+from pathlib import Path
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+CACHE_PATH = Path(".aether") / "cache" / "probe.json"
+DEFAULT_TTL_SECONDS = 10 * 60
+
+DEFAULT_TIMEOUT = 20.0
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE = 2.0  # requests per second, per provider
+
+PROBE_PROMPT = "Count from 1 to 20, separated by spaces."
+PROBE_MAX_TOKENS = 48
+
+_MAX_ERROR_BODY = 64 * 1024
+
+
+class _RateLimiter:
+    """Space out request starts to at most *rate* per second."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next - now
+            self._next = max(now, self._next) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str]]:
+    status_line = await reader.readline()
+    parts = status_line.decode("latin-1").split(" ", 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise ConnectionError(f"malformed response: {status_line[:80]!r}")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return int(parts[1]), headers
+
+
+async def _body(reader: asyncio.StreamReader, headers: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Yield the response body, decoding chunked transfer encoding."""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        while True:
+            size = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if size == 0:
+                return
+            yield await reader.readexactly(size)
+            await reader.readline()
+    elif "content-length" in headers:
+        yield await reader.readexactly(int(headers["content-length"]))
+    else:
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            yield data
+
+
+async def _events(body: AsyncIterator[bytes]) -> AsyncIterator[dict]:
+    """Yield the JSON payload of each server-sent ``data:`` event."""
+    buf = b""
+    async for data in body:
+        buf += data
+        *lines, buf = buf.split(b"\n")
+        for line in lines:
+            line = line.strip()
+            if not line.startswith(b"data:"):
+                continue
+            payload = line[5:].strip()
+            if payload == b"[DONE]":
+                return
+            try:
+                yield json.loads(payload)
+            except json.JSONDecodeError:
+                continue
+
+
+def _error_message(raw: bytes) -> str:
+    try:
+        err = json.loads(raw).get("error")
+        if isinstance(err, dict):
+            return str(err.get("message") or err)
+        if err:
+            return str(err)
+    except (json.JSONDecodeError, AttributeError):
+        pass
+    return raw.decode("utf-8", "replace").strip()[:200]
+
+
+def key_id(api_key: str) -> str:
+    """Return a short, non-reversible identifier for *api_key*."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+async def probe_model(
+    provider: str,
+    model: str,
+    api_model: str,
+    api_base: str,
+    api_key: str,
+) -> dict:
+    """Stream one completion for *api_model* and measure it (no timeout applied here)."""
+    result = {
+        "provider": provider, "model": model, "api_base": api_base, "key_id": key_id(api_key),
+        "status": "error", "http_status": None, "error": None,
+        "ttft_ms": None, "total_ms": None, "tokens": 0, "tokens_per_s": None,
+        "probed_at": time.time(),
+    }
+    url = urlsplit(api_base.rstrip("/") + "/chat/completions")
+    secure = url.scheme == "https"
+    body = json.dumps({
+        "model": api_model,
+        "messages": [{"role": "user", "content": PROBE_PROMPT}],
+        "max_tokens": PROBE_MAX_TOKENS,
+        "stream": True,
+    }).encode()
+    request = (
+        f"POST {url.path} HTTP/1.1\r\n"
+        f"Host: {url.netloc}\r\n"
+        f"Authorization: Bearer {api_key}\r\n"
+        f"Content-Type: application/json\r\n"
+        f"Accept: text/event-stream\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: close\r\n\r\n"
+    ).encode() + body
+
+    start = time.perf_counter()
+    reader, writer = await asyncio.open_connection(
+        url.hostname, url.port or (443 if secure else 80),
+        ssl=ssl.create_default_context() if secure else None,
+    )
+    try:
+        writer.write(request)
+        await writer.drain()
+        status, headers = await _read_headers(reader)
+        result["http_status"] = status
+        if status != 200:
+            raw = b""
+            async for data in _body(reader, headers):
+                raw += data
+                if len(raw) > _MAX_ERROR_BODY:
+                    break
+            result["status"] = "auth" if status in (401, 403) else "error"
+            result["error"] = _error_message(raw) or f"HTTP {status}"
+            return result
+
+        first = None
+        chunks = 0
+        usage_tokens = None
+        async for event in _events(_body(reader, headers)):
+            if event.get("error"):
+                result["error"] = _error_message(json.dumps(event).encode())
+                return result
+            for choice in event.get("choices") or []:
+                if (choice.get("delta") or {}).get("content"):
+                    chunks += 1
+                    if first is None:
+                        first = time.perf_counter()
+            usage = event.get("usage") or {}
+            if usage.get("completion_tokens"):
+                usage_tokens = usage["completion_tokens"]
+        end = time.perf_counter()
+    finally:
+        writer.close()
+
+    if first is None:
+        result["error"] = "stream ended without any content"
+        return result
+    tokens = usage_tokens or chunks
+    result.update(
+        status="ok",
+        ttft_ms=(first - start) * 1000,
+        total_ms=(end - start) * 1000,
+        tokens=tokens,
+        tokens_per_s=(tokens - 1) / (end - first) if tokens > 1 and end > first else None,
+    )
+    return result
+
+
+async def probe_all(
+    targets: List[dict],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+) -> List[dict]:
+    """Probe every target concurrently; *targets* items carry probe_model's arguments."""
+    gate = asyncio.Semaphore(max(concurrency, 1))
+    limiters: Dict[str, _RateLimiter] = {}
+
+    async def one(target: dict) -> dict:
+        limiter = limiters.setdefault(target["provider"], _RateLimiter(rate))
+        # Pace first: a probe held back by its provider's rate shouldn't
+        # sit on a slot another provider could use
+        await limiter.wait()
+        async with gate:
+            try:
+                return await asyncio.wait_for(probe_model(**target), timeout)
+            except asyncio.TimeoutError:
+                error, status = f"no complete response within {timeout:g}s", "timeout"
+            except (OSError, ConnectionError, asyncio.IncompleteReadError, ValueError) as exc:
+                error, status = f"{type(exc).__name__}: {exc}", "error"
+            return {
+                "provider": target["provider"], "model": target["model"],
+                "api_base": target["api_base"], "key_id": key_id(target["api_key"]),
+                "status": status, "http_status": None,
+                "error": error, "ttft_ms": None, "total_ms": None, "tokens": 0,
+                "tokens_per_s": None, "probed_at": time.time(),
+            }
+
+    return list(await asyncio.gather(*(one(t) for t in targets)))
+
+
+def _cache_key(result: dict) -> str:
+    kid = result.get("key_id") or key_id(result["api_key"])
+    return f"{result['provider']}\0{result['model']}\0{result['api_base']}\0{kid}"
+
+
+def load_cache(project_root: Optional[Path] = None) -> Dict[str, dict]:
+    path = (project_root or Path.cwd()) / CACHE_PATH
+    try:
+        results = json.loads(path.read_text())["results"]
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        return {}
+    return {_cache_key(r): r for r in results}
+
+
+def save_cache(results: List[dict], project_root: Optional[Path] = None) -> None:
+    """Merge the successful *results* into the cache; failures are not kept."""
+    path = (project_root or Path.cwd()) / CACHE_PATH
+    merged = load_cache(project_root)
+    for r in results:
+        if r["status"] == "ok":
+            merged[_cache_key(r)] = r
+        else:
+            merged.pop(_cache_key(r), None)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"updated": time.time(), "results": list(merged.values())}, indent=2))
+    os.replace(tmp, path)
+
+
+def probe(
+    targets: List[dict],
+    timeout: float = DEFAULT_TIMEOUT,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate: float = DEFAULT_RATE,
+    ttl: float = DEFAULT_TTL_SECONDS,
+    project_root: Optional[Path] = None,
+) -> List[dict]:
+    """Return results for *targets*, probing only those without a fresh cached result.
+
+    Only successes are cached, per API key; cached results are returned
+    with ``"cached": True``.  Pass ``ttl=0``
+    to probe everything.
+    """
+    cache = load_cache(project_root)
+    now = time.time()
+    results: Dict[int, dict] = {}
+    pending = []
+    for i, target in enumerate(targets):
+        hit = cache.get(_cache_key(target))
+        if hit and now - hit.get("probed_at", 0) < ttl:
+            results[i] = {**hit, "cached": True}
+        else:
+            pending.append(i)
+
+    if pending:
+        fresh = asyncio.run(probe_all([targets[i] for i in pending], timeout, concurrency, rate))
+        save_cache(fresh, project_root)
+        for i, result in zip(pending, fresh):
+            results[i] = {**result, "cached": False}
+    return [results[i] for i in range(len(targets))]
+
+
+def fastest(results: List[dict]) -> Optional[dict]:
+    """Return the working result with the lowest time-to-first-token."""
+    ok = [r for r in results if r["status"] == "ok" and r["ttft_ms"] is not None]
+    return min(ok, key=lambda r: r["ttft_ms"]) if ok else None
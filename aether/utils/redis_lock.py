@@ -0,0 +1,258 @@
+"""Network lock backend speaking the Redis protocol (RESP2).
+
+Selected with ``AETHER_LOCK_URL=redis://[:password@]host:port/db``.  Locks
+are plain string keys written with ``SET NX PX`` so the server expires
+stale locks on its own, and every acquisition draws a fencing token from
+a shared ``INCR`` counter.  A role that later writes through a shared
+resource can pass its token along; anything holding a smaller token is
+known to be stale.  Expiry happens server-side, so no ``expire`` events
+are logged for this backend.
+
+Only a handful of core commands are used (no Lua scripting), so the
+backend works against Redis, Valkey, KeyDB and the in-process stand-in in
+:mod:`aether.utils.redis_stub`.  No client library is required.
+"""
+
+import json
+import socket
+import threading
+from typing import Any, Optional
+from urllib.parse import parse_qs, unquote, urlparse
+
+from aether.utils.lockevents import EventLog
+from aether.utils.lockfile import LockBackend, _age_seconds, _new_payload, same_lock
+
+
+class RespError(Exception):
+    """An error reply (``-ERR ...``) returned by the server."""
+
+
+def _encode(args) -> bytes:
+    out = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        if not isinstance(arg, bytes):
+            arg = str(arg).encode()
+        out.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+    return b"".join(out)
+
+
+def _read_reply(f) -> Any:
+    line = f.readline()
+    if not line:
+        raise ConnectionError("connection closed by server")
+    kind, rest = line[:1], line[1:-2]
+    if kind == b"+":
+        return rest.decode()
+    if kind == b"-":
+        raise RespError(rest.decode())
+    if kind == b":":
+        return int(rest)
+    if kind == b"$":
+        n = int(rest)
+        if n < 0:
+            return None
+        data = f.read(n + 2)
+        return data[:-2]
+    if kind == b"*":
+        n = int(rest)
+        if n < 0:
+            return None
+        return [_read_reply(f) for _ in range(n)]
+    raise RespError(f"unexpected reply type {kind!r}")
+
+
+class RespClient:
+    """Minimal blocking RESP2 client over a single TCP connection."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 6379,
+        db: int = 0,
+        password: Optional[str] = None,
+        timeout: float = 5.0,
+    ):
+        self.host, self.port, self.db = host, port, db
+        self.password = password
+        self.timeout = timeout
+        # Re-entrant so a WATCH/MULTI/EXEC sequence can hold the connection
+        self.lock = threading.RLock()
+        self._sock: Optional[socket.socket] = None
+        self._file = None
+
+    def _connect(self) -> None:
+        self._sock = socket.create_connection((self.host, self.port), self.timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._file = self._sock.makefile("rb")
+        if self.password:
+            self._roundtrip(("AUTH", self.password))
+        if self.db:
+            self._roundtrip(("SELECT", self.db))
+
+    def _roundtrip(self, args) -> Any:
+        self._sock.sendall(_encode(args))
+        return _read_reply(self._file)
+
+    def execute(self, *args) -> Any:
+        """Send one command and return its decoded reply."""
+        with self.lock:
+            if self._sock is None:
+                self._connect()
+            try:
+                return self._roundtrip(args)
+            except (ConnectionError, OSError):
+                self.close()
+                raise
+
+    def close(self) -> None:
+        with self.lock:
+            if self._sock is not None:
+                try:
+                    self._sock.close()
+                finally:
+                    self._sock = None
+                    self._file = None
+
+
+class RedisLockBackend(LockBackend):
+    """Locks stored as ``<namespace>:lock:<path>`` keys on a Redis server."""
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: RespClient,
+        namespace: str = "aether",
+        events: Optional[EventLog] = None,
+    ):
+        self.client = client
+        self.namespace = namespace
+        self.events = events
+        self._prefix = f"{namespace}:lock:"
+        self._fence_key = f"{namespace}:fence"
+
+    @classmethod
+    def from_url(cls, url: str, events: Optional[EventLog] = None) -> "RedisLockBackend":
+        """Build a backend from ``redis://[:password@]host:port/db?namespace=x``."""
+        parsed = urlparse(url)
+        db = int(parsed.path.lstrip("/") or 0)
+        namespace = parse_qs(parsed.query).get("namespace", ["aether"])[0]
+        client = RespClient(
+            host=parsed.hostname or "127.0.0.1",
+            port=parsed.port or 6379,
+            db=db,
+            password=unquote(parsed.password) if parsed.password else None,
+        )
+        return cls(client, namespace=namespace, events=events)
+
+    def _key(self, filepath: str) -> str:
+        return self._prefix + filepath
+
+    def acquire(
+        self,
+        filepath: str,
+        role: str,
+        cli_tool: Optional[str] = None,
+        force: bool = False,
+    ) -> Optional[dict]:
+        key = self._key(filepath)
+        payload = _new_payload(filepath, role, cli_tool)
+        payload["token"] = self.client.execute("INCR", self._fence_key)
+        ttl_ms = int(payload["stale_after"] * 1000)
+
+        if force:
+            client = self.client
+            with client.lock:
+                while True:
+                    # WATCH, not our local lock, keeps other hosts from
+                    # slipping a lock in between reading and replacing it
+                    client.execute("WATCH", key)
+                    previous = client.execute("GET", key)
+                    client.execute("MULTI")
+                    client.execute("SET", key, json.dumps(payload), "PX", ttl_ms)
+                    if client.execute("EXEC") is not None:
+                        break
+            if previous is not None:
+                previous = json.loads(previous)
+                self._emit(
+                    "steal",
+                    payload,
+                    previous_role=previous["role"],
+                    previous_acquired=previous["acquired"],
+                )
+                return payload
+        elif self.client.execute("SET", key, json.dumps(payload), "NX", "PX", ttl_ms) != "OK":
+            if self.events is not None:
+                holder = self.client.execute("GET", key)
+                if holder is not None:
+                    self._emit("conflict", json.loads(holder), waiter=role)
+            return None
+
+        self._emit("acquire", payload)
+        return payload
+
+    def release(
+        self,
+        filepath: str,
+        token: Optional[int] = None,
+        expected: Optional[dict] = None,
+    ) -> Optional[dict]:
+        key = self._key(filepath)
+        client = self.client
+        with client.lock:
+            while True:
+                client.execute("WATCH", key)
+                raw = client.execute("GET", key)
+                if raw is None:
+                    client.execute("UNWATCH")
+                    return None
+                info = json.loads(raw)
+                if token is not None and info.get("token") != token:
+                    # Fenced out: someone re-acquired after our lock expired
+                    client.execute("UNWATCH")
+                    return None
+                if expected is not None and not same_lock(info, expected):
+                    client.execute("UNWATCH")
+                    return None
+                client.execute("MULTI")
+                client.execute("DEL", key)
+                if client.execute("EXEC") is not None:
+                    self._emit("release", info)
+                    return info
+                # The key changed between GET and EXEC; look again
+
+    def is_locked(self, filepath: str) -> Optional[dict]:
+        raw = self.client.execute("GET", self._key(filepath))
+        if raw is None:
+            return None
+        info = json.loads(raw)
+        info["age_seconds"] = int(_age_seconds(info))
+        return info
+
+    def list_locks(self) -> list:
+        keys = []
+        cursor = "0"
+        while True:
+            cursor, batch = self.client.execute(
+                "SCAN", cursor, "MATCH", self._prefix + "*", "COUNT", 1000
+            )
+            keys.extend(batch)
+            cursor = cursor.decode() if isinstance(cursor, bytes) else str(cursor)
+            if cursor == "0":
+                break
+
+        locks = []
+        for start in range(0, len(keys), 500):
+            for raw in self.client.execute("MGET", *keys[start:start + 500]):
+                if raw is None:
+                    continue  # Expired between SCAN and MGET
+                try:
+                    info = json.loads(raw)
+                    info["age_seconds"] = int(_age_seconds(info))
+                except (json.JSONDecodeError, KeyError):
+                    continue
+                locks.append(info)
+        return locks
+
+    def close(self) -> None:
+        self.client.close()
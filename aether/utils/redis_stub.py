@@ -0,0 +1,253 @@
+"""In-process stand-in for a Redis server, for tests and benchmarks.
+
+Implements just enough of RESP2 for :mod:`aether.utils.redis_lock`:
+``PING AUTH SELECT GET SET(NX/XX/PX/EX) DEL INCR MGET SCAN WATCH UNWATCH
+MULTI EXEC DISCARD FLUSHALL DBSIZE QUIT``.  Everything lives in one dict
+guarded by a single lock, which gives the same atomicity guarantees the
+lock backend relies on from a real server.
+
+Usage::
+
+    with StubRedisServer() as server:
+        backend = RedisLockBackend.from_url(server.url)
+"""
+
+import fnmatch
+import socketserver
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+class _Store:
+    def __init__(self):
+        self.lock = threading.Lock()
+        # key -> (value, expires_at monotonic seconds or None)
+        self.data: Dict[bytes, Tuple[bytes, Optional[float]]] = {}
+        # key -> version, bumped on every change (drives WATCH)
+        self.versions: Dict[bytes, int] = {}
+
+    def _touch(self, key: bytes) -> None:
+        self.versions[key] = self.versions.get(key, 0) + 1
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.monotonic():
+            del self.data[key]
+            self._touch(key)
+            return None
+        return value
+
+    def set(self, key: bytes, value: bytes, expires: Optional[float]) -> None:
+        self.data[key] = (value, expires)
+        self._touch(key)
+
+    def delete(self, key: bytes) -> int:
+        if self.get(key) is None:
+            return 0
+        del self.data[key]
+        self._touch(key)
+        return 1
+
+
+def _ok() -> bytes:
+    return b"+OK\r\n"
+
+
+def _err(msg: str) -> bytes:
+    return f"-ERR {msg}\r\n".encode()
+
+
+def _int(n: int) -> bytes:
+    return b":%d\r\n" % n
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _array(items: List[bytes]) -> bytes:
+    return b"*%d\r\n" % len(items) + b"".join(items)
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def setup(self):
+        super().setup()
+        self.watched: Dict[bytes, int] = {}
+        self.queue: Optional[List[List[bytes]]] = None
+
+    def _read_command(self) -> Optional[List[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        if not line.startswith(b"*"):
+            return line.split()  # Inline command (e.g. from telnet)
+        args = []
+        for _ in range(int(line[1:-2])):
+            size = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(size + 2)[:-2])
+        return args
+
+    def handle(self):
+        store: _Store = self.server.store
+        while True:
+            try:
+                args = self._read_command()
+            except (ConnectionError, ValueError):
+                return
+            if not args:
+                return
+            name = args[0].upper()
+            if name == b"QUIT":
+                self.wfile.write(_ok())
+                return
+
+            if self.queue is not None and name not in (b"EXEC", b"DISCARD", b"MULTI", b"WATCH"):
+                self.queue.append(args)
+                self.wfile.write(b"+QUEUED\r\n")
+                continue
+
+            with store.lock:
+                reply = self._dispatch(store, name, args[1:])
+            self.wfile.write(reply)
+
+    def _dispatch(self, store: _Store, name: bytes, args: List[bytes]) -> bytes:
+        if name == b"MULTI":
+            if self.queue is not None:
+                return _err("MULTI calls can not be nested")
+            self.queue = []
+            return _ok()
+        if name == b"DISCARD":
+            self.queue = None
+            self.watched.clear()
+            return _ok()
+        if name == b"EXEC":
+            if self.queue is None:
+                return _err("EXEC without MULTI")
+            queued, self.queue = self.queue, None
+            dirty = any(store.versions.get(k, 0) != v for k, v in self.watched.items())
+            self.watched.clear()
+            if dirty:
+                return b"*-1\r\n"
+            return _array([self._execute(store, a[0].upper(), a[1:]) for a in queued])
+        if name == b"WATCH":
+            if self.queue is not None:
+                return _err("WATCH inside MULTI is not allowed")
+            for key in args:
+                store.get(key)  # Apply lazy expiry before snapshotting
+                self.watched[key] = store.versions.get(key, 0)
+            return _ok()
+        if name == b"UNWATCH":
+            self.watched.clear()
+            return _ok()
+        return self._execute(store, name, args)
+
+    def _execute(self, store: _Store, name: bytes, args: List[bytes]) -> bytes:
+        try:
+            if name == b"PING":
+                return b"+PONG\r\n"
+            if name in (b"AUTH", b"SELECT"):
+                return _ok()
+            if name == b"GET":
+                return _bulk(store.get(args[0]))
+            if name == b"MGET":
+                return _array([_bulk(store.get(k)) for k in args])
+            if name == b"SET":
+                return self._set(store, args)
+            if name == b"DEL":
+                return _int(sum(store.delete(k) for k in args))
+            if name == b"INCR":
+                value = int(store.get(args[0]) or 0) + 1
+                entry = store.data.get(args[0])
+                store.set(args[0], str(value).encode(), entry[1] if entry else None)
+                return _int(value)
+            if name == b"SCAN":
+                return self._scan(store, args)
+            if name == b"DBSIZE":
+                return _int(sum(1 for k in list(store.data) if store.get(k) is not None))
+            if name == b"FLUSHALL":
+                for key in list(store.data):
+                    store.delete(key)
+                return _ok()
+        except (IndexError, ValueError):
+            return _err(f"wrong arguments for '{name.decode().lower()}' command")
+        return _err(f"unknown command '{name.decode()}'")
+
+    @staticmethod
+    def _set(store: _Store, args: List[bytes]) -> bytes:
+        key, value = args[0], args[1]
+        opts = [a.upper() for a in args[2:]]
+        expires = None
+        if b"PX" in opts:
+            expires = time.monotonic() + int(args[2 + opts.index(b"PX") + 1]) / 1000
+        elif b"EX" in opts:
+            expires = time.monotonic() + int(args[2 + opts.index(b"EX") + 1])
+        exists = store.get(key) is not None
+        if (b"NX" in opts and exists) or (b"XX" in opts and not exists):
+            return _bulk(None)
+        store.set(key, value, expires)
+        return _ok()
+
+    @staticmethod
+    def _scan(store: _Store, args: List[bytes]) -> bytes:
+        cursor = int(args[0])
+        opts = [a.upper() for a in args[1:]]
+        pattern = "*"
+        count = 10
+        if b"MATCH" in opts:
+            pattern = args[1 + opts.index(b"MATCH") + 1].decode()
+        if b"COUNT" in opts:
+            count = int(args[1 + opts.index(b"COUNT") + 1])
+        keys = sorted(store.data)
+        page = keys[cursor:cursor + count]
+        nxt = cursor + count if cursor + count < len(keys) else 0
+        hits = [
+            _bulk(k) for k in page
+            if fnmatch.fnmatchcase(k.decode(), pattern) and store.get(k) is not None
+        ]
+        return _array([_bulk(str(nxt).encode()), _array(hits)])
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubRedisServer:
+    """A RESP server on a background thread, bound to 127.0.0.1."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._server = _Server((host, port), _Handler)
+        self._server.store = _Store()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        return self._server.server_address[:2]
+
+    @property
+    def url(self) -> str:
+        host, port = self.address
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "StubRedisServer":
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubRedisServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
@@ -0,0 +1,172 @@
+"""Result cache for ``aether run --memo``.
+
+A run is fingerprinted by:
+
+* the target file and every ``.na``/``.dana`` file it imports,
+  transitively (by content hash),
+* the model-selection environment — ``DANA_*`` and ``*_MODEL`` keys from
+  the process environment and ``.env``, never keys that look like
+  secrets,
+* the arguments passed through to ``dana``.
+
+Successful runs store their stdout under ``.aether/cache/run/<fp>.run``
+(a JSON header line, then the raw output).  A later run with the same
+fingerprint replays it instead of executing.  Entries are evicted least
+recently used first once the store exceeds ``$AETHER_RUN_CACHE_BYTES``
+(default 64 MiB).
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+CACHE_DIR_NAME = Path(".aether") / "cache" / "run"
+
+MAX_BYTES_ENV = "AETHER_RUN_CACHE_BYTES"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+# Outputs larger than this are never cached
+MAX_ENTRY_BYTES = 8 * 1024 * 1024
+
+_FINGERPRINT_VERSION = "1"
+
+_IMPORT_RE = re.compile(r"^\s*(?:from\s+(\.*[\w.]*)\s+import|import\s+([\w.]+))", re.MULTILINE)
+_SECRET_RE = re.compile(r"KEY|TOKEN|SECRET|PASSWORD|PASS", re.IGNORECASE)
+_SOURCE_SUFFIXES = (".na", ".dana")
+
+
+def _cache_dir(project_root: Optional[Path] = None) -> Path:
+    return (project_root or Path.cwd()) / CACHE_DIR_NAME
+
+
+def max_bytes() -> int:
+    try:
+        return int(os.getenv(MAX_BYTES_ENV, DEFAULT_MAX_BYTES))
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def _resolve(module: str, importer: Path, project_root: Path) -> Optional[Path]:
+    """Map a Dana module name to a source file, or None for non-local modules."""
+    stripped = module.lstrip(".")
+    if not stripped:
+        return None
+    rel = Path(*stripped.split("."))
+    bases = [importer.parent] if module.startswith(".") else [importer.parent, project_root]
+    for base in bases:
+        for suffix in _SOURCE_SUFFIXES:
+            candidate = base / rel.with_suffix(suffix)
+            if candidate.is_file():
+                return candidate
+    return None
+
+
+def dependencies(target: Path, project_root: Optional[Path] = None) -> List[Path]:
+    """Return *target* and the local files it imports, transitively, sorted."""
+    root = (project_root or Path.cwd()).resolve()
+    seen = {target.resolve()}
+    pending = [target.resolve()]
+    while pending:
+        path = pending.pop()
+        try:
+            text = path.read_text(errors="replace")
+        except OSError:
+            continue
+        for m in _IMPORT_RE.finditer(text):
+            dep = _resolve(m.group(1) or m.group(2), path, root)
+            if dep is not None and dep.resolve() not in seen:
+                seen.add(dep.resolve())
+                pending.append(dep.resolve())
+    return sorted(seen)
+
+
+def model_env(env: Dict[str, str]) -> Dict[str, str]:
+    """Return the model-selection keys of *env*, excluding anything secret-looking."""
+    return {
+        k: v for k, v in sorted(env.items())
+        if (k.startswith("DANA_") or k.endswith("_MODEL")) and not _SECRET_RE.search(k)
+    }
+
+
+def fingerprint(
+    target: Path,
+    args: List[str],
+    env: Dict[str, str],
+    project_root: Optional[Path] = None,
+) -> str:
+    root = (project_root or Path.cwd()).resolve()
+    h = hashlib.sha256(_FINGERPRINT_VERSION.encode())
+    h.update(json.dumps(str(target)).encode())
+    for dep in dependencies(target, root):
+        try:
+            name = str(dep.relative_to(root))
+        except ValueError:
+            name = str(dep)
+        h.update(f"\0file\0{name}\0".encode())
+        h.update(hashlib.sha256(dep.read_bytes()).digest())
+    h.update(b"\0env\0" + json.dumps(model_env(env), sort_keys=True).encode())
+    h.update(b"\0args\0" + json.dumps(list(args)).encode())
+    return h.hexdigest()
+
+
+def lookup(fp: str, project_root: Optional[Path] = None) -> Optional[dict]:
+    """Return ``{exit_code, created, stdout}`` for *fp*, marking it recently used."""
+    path = _cache_dir(project_root) / f"{fp}.run"
+    try:
+        with open(path, "rb") as f:
+            meta = json.loads(f.readline())
+            meta["stdout"] = f.read()
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    try:
+        os.utime(path)
+    except FileNotFoundError:
+        pass
+    return meta
+
+
+def store(
+    fp: str,
+    exit_code: int,
+    stdout: bytes,
+    project_root: Optional[Path] = None,
+    limit: Optional[int] = None,
+) -> bool:
+    """Save a run's output under *fp*; return False if it was too large to keep."""
+    if len(stdout) > MAX_ENTRY_BYTES:
+        return False
+    d = _cache_dir(project_root)
+    d.mkdir(parents=True, exist_ok=True)
+    header = json.dumps({"exit_code": exit_code, "created": time.time()}).encode()
+    path = d / f"{fp}.run"
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_bytes(header + b"\n" + stdout)
+    os.replace(tmp, path)
+    evict(project_root, max_bytes() if limit is None else limit)
+    return True
+
+
+def evict(project_root: Optional[Path] = None, limit: int = DEFAULT_MAX_BYTES) -> List[str]:
+    """Delete least recently used entries until the store fits in *limit* bytes."""
+    d = _cache_dir(project_root)
+    entries = []
+    try:
+        for e in os.scandir(d):
+            if e.name.endswith(".run"):
+                st = e.stat()
+                entries.append((st.st_mtime, st.st_size, e.path))
+    except FileNotFoundError:
+        return []
+    total = sum(size for _, size, _ in entries)
+    removed = []
+    for _, size, path in sorted(entries):
+        if total <= limit:
+            break
+        Path(path).unlink(missing_ok=True)
+        total -= size
+        removed.append(Path(path).stem)
+    return removed
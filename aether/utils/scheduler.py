@@ -0,0 +1,233 @@
+"""Dispatch role briefs across the pool of installed CLI tools.
+
+Every CLI found by :func:`aether.utils.tmux.detect_cli_tools` is a slot
+in a capacity pool with a concurrency cap and an optional start-rate
+limit (``.aether/clis.json``)::
+
+    {"claude": {"concurrency": 2, "rate_per_min": 6}}
+
+Unlisted CLIs (or a ``null`` concurrency) get no concurrency cap and no
+rate limit: interactive sessions only "finish" when a person closes
+them, so a cap of one would leave every later role on that CLI idle.  Briefs are
+queued in submission order and each is started on the first CLI in its
+candidate list that has room — the role's own ``cli`` first, then its
+``alternates`` (every other installed CLI unless ``roles.json`` narrows
+it).  A failed dispatch is retried on an untried alternate.  Each job
+records how long it sat in the queue so coordinators can size the pool.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, List, Optional
+
+CLIS_PATH = Path(".aether") / "clis.json"
+
+# None = unlimited
+DEFAULT_CONCURRENCY: Optional[int] = None
+
+
+def load_limits(path: Optional[Path] = None) -> Dict[str, dict]:
+    """Read per-CLI limits from *path* (default ``.aether/clis.json``)."""
+    try:
+        return json.loads((path or CLIS_PATH).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def role_candidates(meta: dict, available: Dict[str, str]) -> List[str]:
+    """Return the CLIs a role may run on, preferred first, limited to *available*."""
+    primary = meta.get("cli")
+    if not primary:
+        return []
+    alternates = meta.get("alternates")
+    if alternates is None:
+        alternates = sorted(available)
+    ordered = [primary] + [c for c in alternates if c != primary]
+    return [c for c in ordered if c in available]
+
+
+class Job:
+    """One role brief waiting for, or running on, a CLI."""
+
+    def __init__(self, role: str, brief: str, candidates: List[str]):
+        self.role = role
+        self.brief = brief
+        self.candidates = candidates
+        self.tried: List[str] = []
+        self.cli: Optional[str] = None
+        self.status = "queued"  # queued | running | done | failed
+        self.error: Optional[str] = None
+        self.submitted = time.monotonic()
+        self.started: Optional[float] = None
+        self.finished: Optional[float] = None
+
+    @property
+    def wait_seconds(self) -> Optional[float]:
+        """Time from submission to first dispatch."""
+        return None if self.started is None else self.started - self.submitted
+
+    def remaining(self) -> List[str]:
+        return [c for c in self.candidates if c not in self.tried]
+
+
+class CliPool:
+    """Concurrency and start-rate accounting for each available CLI."""
+
+    def __init__(self, available: Dict[str, str], limits: Optional[Dict[str, dict]] = None):
+        limits = limits or {}
+        self.clis = sorted(available)
+        self.concurrency: Dict[str, Optional[int]] = {}
+        for c in self.clis:
+            cap = limits.get(c, {}).get("concurrency", DEFAULT_CONCURRENCY)
+            self.concurrency[c] = None if cap is None else int(cap)
+        self.rate = {c: limits.get(c, {}).get("rate_per_min") for c in self.clis}
+        self.running = {c: 0 for c in self.clis}
+        self._starts: Dict[str, Deque[float]] = {c: deque() for c in self.clis}
+
+    def ready_in(self, cli: str, now: float) -> Optional[float]:
+        """Seconds until *cli* can start another job (0 = now, None = only after a finish)."""
+        if not self.has_room(cli, self.running[cli]):
+            return None
+        rate = self.rate[cli]
+        if not rate:
+            return 0.0
+        starts = self._starts[cli]
+        while starts and now - starts[0] >= 60:
+            starts.popleft()
+        if len(starts) < rate:
+            return 0.0
+        return 60 - (now - starts[0])
+
+    def has_room(self, cli: str, running: int) -> bool:
+        cap = self.concurrency[cli]
+        return cap is None or running < cap
+
+    def start(self, cli: str, now: float) -> None:
+        self.running[cli] += 1
+        self._starts[cli].append(now)
+
+    def finish(self, cli: str) -> None:
+        self.running[cli] -= 1
+
+
+class Scheduler:
+    """FIFO queue of :class:`Job` dispatched onto a :class:`CliPool`."""
+
+    def __init__(self, pool: CliPool):
+        self.pool = pool
+        self.jobs: List[Job] = []
+        self._queue: Deque[Job] = deque()
+        self._cond = threading.Condition()
+        self._active = 0
+        self._dispatched = threading.Event()
+
+    def submit(self, role: str, brief: str, candidates: List[str]) -> Job:
+        job = Job(role, brief, candidates)
+        with self._cond:
+            self.jobs.append(job)
+            if candidates:
+                self._queue.append(job)
+            else:
+                job.status = "failed"
+                job.error = "no compatible CLI installed"
+            self._cond.notify_all()
+        return job
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._queue)
+
+    def active(self) -> int:
+        """Return how many jobs are running right now."""
+        with self._cond:
+            return self._active
+
+    def wait_dispatched(self, timeout: Optional[float] = None) -> bool:
+        """Block until :meth:`run` has started every job that can start now."""
+        return self._dispatched.wait(timeout)
+
+    def _pick(self, now: float) -> tuple:
+        """Return (job, cli, 0) to start now, or (None, None, delay) to wait."""
+        soonest: Optional[float] = None
+        for job in self._queue:
+            for cli in job.remaining():
+                delay = self.pool.ready_in(cli, now)
+                if delay == 0:
+                    return job, cli, 0.0
+                if delay is not None and (soonest is None or delay < soonest):
+                    soonest = delay
+        return None, None, soonest
+
+    def plan(self) -> Dict[str, Optional[str]]:
+        """Return {role: cli} for jobs that would start immediately, without running them."""
+        now = time.monotonic()
+        running = dict(self.pool.running)
+        plan: Dict[str, Optional[str]] = {}
+        with self._cond:
+            for job in self._queue:
+                plan[job.role] = None
+                for cli in job.remaining():
+                    if self.pool.has_room(cli, running[cli]) and self.pool.ready_in(cli, now) == 0:
+                        running[cli] += 1
+                        plan[job.role] = cli
+                        break
+        return plan
+
+    def run(self, dispatch: Callable[[Job, str], bool]) -> List[Job]:
+        """Dispatch every queued job, blocking until all are done or failed.
+
+        *dispatch(job, cli)* runs the brief and returns True on success;
+        it is called on a worker thread per job, so it may block.
+        """
+        with self._cond:
+            while self._queue or self._active:
+                job, cli, delay = self._pick(time.monotonic())
+                if job is None:
+                    self._dispatched.set()
+                    if not self._active and delay is None:
+                        # Nothing running and nothing can ever start: give up
+                        for stuck in self._queue:
+                            stuck.status = "failed"
+                            stuck.error = "no compatible CLI has capacity"
+                        self._queue.clear()
+                        break
+                    self._cond.wait(timeout=delay)
+                    continue
+
+                self._queue.remove(job)
+                job.tried.append(cli)
+                job.cli = cli
+                job.status = "running"
+                if job.started is None:
+                    job.started = time.monotonic()
+                self.pool.start(cli, time.monotonic())
+                self._active += 1
+                threading.Thread(target=self._work, args=(job, cli, dispatch), daemon=True).start()
+        self._dispatched.set()
+        return self.jobs
+
+    def _work(self, job: Job, cli: str, dispatch: Callable[[Job, str], bool]) -> None:
+        try:
+            ok = dispatch(job, cli)
+            error = None if ok else f"{cli} exited with an error"
+        except Exception as exc:  # Dispatch failures must not kill the scheduler
+            ok, error = False, f"{cli}: {exc}"
+
+        with self._cond:
+            self.pool.finish(cli)
+            self._active -= 1
+            if ok:
+                job.status = "done"
+                job.finished = time.monotonic()
+            elif job.remaining():
+                job.status = "queued"
+                job.error = error
+                self._queue.appendleft(job)  # Retry on an alternate first
+            else:
+                job.status = "failed"
+                job.error = error
+                job.finished = time.monotonic()
+            self._cond.notify_all()
@@ -0,0 +1,189 @@
+"""Registry of coordinator tmux sessions launched from a project.
+
+Each ``coordinate --launch`` gets its own session, named after the task
+(``aether-<slug>-<hash>``), and records it in
+``.aether/sessions/<name>.json`` with every pane's tmux id and shell
+PID.  ``aether sessions`` lists, kills and garbage-collects these
+records.
+
+When the session was launched by an ``aether coordinate`` process (not
+in-process by ``aether serve``), that process's PID and start time are
+recorded too.  ``kill`` only signals it while the session is alive and
+the PID still belongs to that same coordinator, never a reused PID.
+
+To keep a shared build host from being oversubscribed, new sessions are
+refused once the panes of all live aether sessions on the tmux server
+would exceed ``$AETHER_MAX_PANES`` (default 32).
+"""
+
+import hashlib
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional
+
+from aether.utils import tmux as _tmux
+
+SESSIONS_DIR_NAME = Path(".aether") / "sessions"
+SESSION_PREFIX = "aether-"
+
+MAX_PANES_ENV = "AETHER_MAX_PANES"
+DEFAULT_MAX_PANES = 32
+
+
+def session_name(task: str) -> str:
+    """Return a stable, tmux-safe session name for *task* in this project."""
+    slug = re.sub(r"[^a-z0-9]+", "-", task.lower()).strip("-")[:24].strip("-")
+    digest = hashlib.sha1(f"{Path.cwd().resolve()}\0{task}".encode()).hexdigest()[:6]
+    return f"{SESSION_PREFIX}{slug or 'task'}-{digest}"
+
+
+def max_panes() -> int:
+    try:
+        return int(os.getenv(MAX_PANES_ENV, DEFAULT_MAX_PANES))
+    except ValueError:
+        return DEFAULT_MAX_PANES
+
+
+def _sessions_dir(project_root: Optional[Path] = None) -> Path:
+    return (project_root or Path.cwd()) / SESSIONS_DIR_NAME
+
+
+def _record_path(name: str, project_root: Optional[Path] = None) -> Path:
+    return _sessions_dir(project_root) / f"{name}.json"
+
+
+def _is_coordinator(argv: List[str]) -> bool:
+    """Return True if *argv* is an ``aether coordinate`` command line."""
+    return "coordinate" in argv and any("aether" in arg for arg in argv)
+
+
+def _process_start(pid: int) -> Optional[str]:
+    """Return an opaque start-time stamp for *pid*, or None if it isn't running."""
+    if os.path.isdir("/proc/self"):
+        try:
+            with open(f"/proc/{pid}/stat") as f:
+                # Field 22 (starttime); the comm field before it may contain spaces
+                return f.read().rsplit(")", 1)[1].split()[19]
+        except (OSError, IndexError):
+            return None
+    result = subprocess.run(["ps", "-o", "lstart=", "-p", str(pid)], capture_output=True, text=True)
+    return result.stdout.strip() or None
+
+
+def _process_argv(pid: int) -> List[str]:
+    if os.path.isdir("/proc/self"):
+        try:
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                return [a.decode(errors="replace") for a in f.read().split(b"\0") if a]
+        except OSError:
+            return []
+    result = subprocess.run(["ps", "-o", "command=", "-p", str(pid)], capture_output=True, text=True)
+    return result.stdout.split()
+
+
+def _owns_coordinator(record: dict) -> bool:
+    """Return True if the record's PID is still the coordinator that registered it."""
+    pid, started = record.get("pid"), record.get("pid_started")
+    if not pid or not started or pid == os.getpid():
+        return False
+    return _process_start(pid) == started and _is_coordinator(_process_argv(pid))
+
+
+def register(
+    name: str,
+    task: str,
+    project_root: Optional[Path] = None,
+) -> dict:
+    """Record session *name* with its current panes (and our PID if we are its coordinator)."""
+    # Inside `aether serve` our PID is the server's: never record it
+    pid = os.getpid() if _is_coordinator(sys.argv) else None
+    record = {
+        "name": name,
+        "task": task,
+        "pid": pid,
+        "pid_started": _process_start(pid) if pid else None,
+        "created": time.time(),
+        "panes": _tmux.list_panes(name),
+    }
+    path = _record_path(name, project_root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(record, indent=2))
+    os.replace(tmp, path)
+    return record
+
+
+def load(name: str, project_root: Optional[Path] = None) -> Optional[dict]:
+    try:
+        return json.loads(_record_path(name, project_root).read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def list_sessions(project_root: Optional[Path] = None) -> List[dict]:
+    """Return all recorded sessions, newest first, each with an ``alive`` flag."""
+    d = _sessions_dir(project_root)
+    if not d.exists():
+        return []
+    live = set(_tmux.list_sessions())
+    records = []
+    for rf in d.glob("*.json"):
+        try:
+            record = json.loads(rf.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            continue
+        record["alive"] = record.get("name") in live
+        records.append(record)
+    return sorted(records, key=lambda r: r.get("created", 0), reverse=True)
+
+
+def latest(project_root: Optional[Path] = None) -> Optional[str]:
+    """Return the name of the most recently launched session, if any."""
+    records = list_sessions(project_root)
+    return records[0]["name"] if records else None
+
+
+def remove(name: str, project_root: Optional[Path] = None) -> None:
+    _record_path(name, project_root).unlink(missing_ok=True)
+
+
+def kill(name: str, project_root: Optional[Path] = None) -> Optional[dict]:
+    """Kill session *name*, its coordinator process, and drop its record.
+
+    The coordinator is only signalled if the session was still running
+    and its recorded PID still belongs to that coordinator.
+    """
+    record = load(name, project_root)
+    alive = _tmux.session_exists(name)
+    _tmux.kill_session(name)
+    if record and alive and _owns_coordinator(record):
+        try:
+            os.kill(record["pid"], signal.SIGTERM)
+        except (ProcessLookupError, PermissionError):
+            pass
+    remove(name, project_root)
+    return record
+
+
+def gc(project_root: Optional[Path] = None) -> List[str]:
+    """Drop records whose tmux session no longer exists; return their names."""
+    dead = [r["name"] for r in list_sessions(project_root) if not r["alive"]]
+    for name in dead:
+        remove(name, project_root)
+    return dead
+
+
+def panes_in_use(project_root: Optional[Path] = None) -> int:
+    """Count panes of live aether sessions on the tmux server."""
+    registered = {r["name"] for r in list_sessions(project_root)}
+    counts = _tmux.pane_counts()
+    return sum(
+        n for s, n in counts.items()
+        if s.startswith(SESSION_PREFIX) or s in registered
+    )
@@ -1,8 +1,13 @@
 """Tmux orchestration utilities for aether coordinate --launch."""
 
+import shlex
 import shutil
 import subprocess
-from typing import Dict
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+from aether.utils import panelog
 
 
 def detect_cli_tools() -> Dict[str, str]:
@@ -11,17 +16,59 @@ def detect_cli_tools() -> Dict[str, str]:
     return {name: path for name in candidates if (path := shutil.which(name))}
 
 
+def session_exists(name: str) -> bool:
+    """Return True if a tmux session called *name* is running."""
+    return subprocess.run(
+        ["tmux", "has-session", "-t", f"={name}"],
+        capture_output=True,
+    ).returncode == 0
+
+
+def list_sessions() -> List[str]:
+    """Return the names of all sessions on the tmux server."""
+    result = subprocess.run(
+        ["tmux", "list-sessions", "-F", "#{session_name}"],
+        capture_output=True,
+        text=True,
+    )
+    return result.stdout.split() if result.returncode == 0 else []
+
+
+def list_panes(session: str) -> List[dict]:
+    """Return ``{"window", "pane_id", "pid"}`` for every pane in *session*."""
+    result = subprocess.run(
+        ["tmux", "list-panes", "-s", "-t", f"={session}", "-F",
+         "#{window_name}\t#{pane_id}\t#{pane_pid}"],
+        capture_output=True,
+        text=True,
+    )
+    panes = []
+    for line in result.stdout.splitlines():
+        window, pane_id, pid = line.split("\t")
+        panes.append({"window": window, "pane_id": pane_id, "pid": int(pid)})
+    return panes
+
+
+def pane_counts() -> Dict[str, int]:
+    """Return ``{session_name: pane_count}`` across the tmux server."""
+    result = subprocess.run(
+        ["tmux", "list-panes", "-a", "-F", "#{session_name}"],
+        capture_output=True,
+        text=True,
+    )
+    counts: Dict[str, int] = {}
+    if result.returncode == 0:
+        for name in result.stdout.split():
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
 def create_session(name: str) -> bool:
     """Create a new tmux session (or reuse if it already exists).
 
     Returns True if the session was freshly created, False if reused.
     """
-    exists = subprocess.run(
-        ["tmux", "has-session", "-t", name],
-        capture_output=True,
-    ).returncode == 0
-
-    if not exists:
+    if not session_exists(name):
         subprocess.run(
             ["tmux", "new-session", "-d", "-s", name],
             check=True,
@@ -64,6 +111,62 @@ def send_prompt(pane: str, cli_tool: str, prompt: str) -> None:
     )
 
 
+def send_prompt_and_signal(
+    pane: str,
+    cli_tool: str,
+    prompt: str,
+    channel: str,
+    status_path: Path,
+) -> None:
+    """Like :func:`send_prompt`, but signal *channel* when the CLI exits.
+
+    The exit status is written to *status_path* before ``tmux wait-for -S``
+    fires, so a caller blocked in :func:`wait_for` can read it.
+    """
+    safe_prompt = prompt.replace("'", "'\\''")
+    status = shlex.quote(str(Path(status_path).resolve()))
+    command = (
+        f"{cli_tool} '{safe_prompt}'; echo $? > {status}; "
+        f"tmux wait-for -S {shlex.quote(channel)}"
+    )
+    subprocess.run(
+        ["tmux", "send-keys", "-t", pane, command, "Enter"],
+        check=True,
+    )
+
+
+def wait_for(channel: str) -> None:
+    """Block until something runs ``tmux wait-for -S`` on *channel*."""
+    subprocess.run(["tmux", "wait-for", channel], check=True)
+
+
+def pipe_pane_to_log(
+    pane: str,
+    log_dir: Path,
+    role: str,
+    segment_bytes: int = panelog.DEFAULT_SEGMENT_BYTES,
+    segments: int = panelog.DEFAULT_SEGMENTS,
+) -> None:
+    """Stream everything *pane* prints into ring-buffered logs for *role*.
+
+    Uses ``tmux pipe-pane`` to feed :mod:`aether.utils.panelog`, which
+    keeps at most *segments* × *segment_bytes* on disk.
+    """
+    command = " ".join(
+        shlex.quote(part)
+        for part in (
+            sys.executable, "-m", "aether.utils.panelog",
+            str(Path(log_dir).resolve()), role,
+            "--segment-bytes", str(segment_bytes),
+            "--segments", str(segments),
+        )
+    )
+    subprocess.run(
+        ["tmux", "pipe-pane", "-o", "-t", pane, command],
+        check=True,
+    )
+
+
 def broadcast(session: str, message: str) -> None:
     """Send *message* as plain text to every window in *session*."""
     result = subprocess.run(
@@ -81,13 +184,13 @@ def broadcast(session: str, message: str) -> None:
 
 def attach_session(name: str) -> None:
     """Attach the current terminal to *name* (blocks until detached)."""
-    subprocess.run(["tmux", "attach-session", "-t", name])
+    subprocess.run(["tmux", "attach-session", "-t", f"={name}"])
 
 
 def kill_session(name: str) -> None:
     """Kill the named tmux session if it exists."""
     subprocess.run(
-        ["tmux", "kill-session", "-t", name],
+        ["tmux", "kill-session", "-t", f"={name}"],
         capture_output=True,
     )
 
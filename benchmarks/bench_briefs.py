@@ -0,0 +1,52 @@
+"""Brief rendering throughput for large task × role sets.
+
+Compares the compiled templates of :class:`aether.utils.briefs.RoleSet`
+against formatting each brief from its template string on every call.
+"""
+
+import time
+
+from harness import metric
+
+from aether.utils.briefs import DEFAULT_BRIEF, RoleSet
+from aether.utils.outcomes import OUTCOME_END, OUTCOME_START
+
+
+def _roles(n: int) -> dict:
+    roles = {f"role{i:03d}": {"description": f"Worker number {i}."} for i in range(n)}
+    for i, meta in enumerate(roles.values()):
+        if i % 2:
+            meta["brief"] = ["[{ROLE}] {task}", "", "Focus: {focus}. {outcome_start} … {outcome_end}"]
+            meta["vars"] = {"focus": f"area {i}"}
+    return roles
+
+
+def run(quick: bool = False) -> dict:
+    tasks = [f"task number {i}" for i in range(200 if quick else 2000)]
+    roles = _roles(100)
+
+    t0 = time.perf_counter()
+    role_set = RoleSet(roles)
+    compile_ms = (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    count = sum(1 for _ in role_set.render_many(tasks))
+    compiled = count / (time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    for task in tasks:
+        for role, meta in roles.items():
+            template = meta.get("brief") or DEFAULT_BRIEF
+            if isinstance(template, list):
+                template = "\n".join(template)
+            template.format(
+                task=task, role=role, ROLE=role.upper(), description=meta["description"],
+                outcome_start=OUTCOME_START, outcome_end=OUTCOME_END, **meta.get("vars", {}),
+            )
+    naive = count / (time.perf_counter() - t0)
+
+    return {
+        "briefs.compile_100_roles": metric(compile_ms, "ms"),
+        "briefs.render_many": metric(compiled, "briefs/s", better="higher"),
+        "briefs.str_format": metric(naive, "briefs/s", better="higher"),
+    }
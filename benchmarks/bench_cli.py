@@ -0,0 +1,31 @@
+"""Cold-start time of each ``aether`` subcommand.
+
+Each sample is a fresh ``python -m aether.cli <cmd> --help`` process, so
+it covers interpreter start-up, imports and the typer parse — the cost
+an orchestrator pays on every shell-out.
+"""
+
+import subprocess
+import sys
+
+from harness import median_ms, metric, percentile, subprocess_env, time_calls
+
+SUBCOMMANDS = [
+    "init", "agent", "run", "coordinate", "config",
+    "lock", "unlock", "locks", "collect", "sessions",
+]
+
+
+def run(quick: bool = False) -> dict:
+    repeat = 3 if quick else 10
+    env = subprocess_env()
+    results = {}
+    for cmd in SUBCOMMANDS:
+        argv = [sys.executable, "-m", "aether.cli", cmd, "--help"]
+        samples = time_calls(
+            lambda: subprocess.run(argv, env=env, capture_output=True, check=True), repeat
+        )
+        results[f"cli.cold_start.{cmd}"] = metric(
+            median_ms(samples), "ms", p90_ms=percentile(samples, 90) * 1000
+        )
+    return results
@@ -0,0 +1,98 @@
+"""``coordinate --launch`` end to end, against a fake tmux.
+
+A stand-in ``tmux`` script on ``$PATH`` accepts every subcommand the
+coordinator uses, and answers ``send-keys`` by writing a zero exit
+status for the brief it was given, so each role's dispatch completes
+immediately, and holds ``attach-session`` until every role's ``wait-for`` has
+returned.  The timing therefore covers our own overhead — roles
+parsing, scheduling, one tmux invocation per pane operation, session
+registration — not the CLIs or a real tmux server.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from harness import metric, subprocess_env
+
+ROLE_COUNTS = [5, 25, 100]
+QUICK_ROLE_COUNTS = [5, 25]
+FAKE_CLIS = ["claude", "gemini", "opencode"]
+
+FAKE_TMUX = r"""#!/bin/sh
+echo "$1" >> "$AETHER_BENCH_TMUX_LOG"
+case "$1" in
+  has-session) exit 1 ;;
+  send-keys)
+    status=$(printf '%s' "$4" | sed -n 's/.*; echo \$? > \(.*\); tmux wait-for.*/\1/p')
+    [ -n "$status" ] && eval "echo 0 > $status"
+    ;;
+  attach-session)
+    # Stay "attached" until every role has been dispatched (or ~10s pass)
+    i=0
+    while [ "$(grep -c '^wait-for' "$AETHER_BENCH_TMUX_LOG")" -lt "$AETHER_BENCH_ROLES" ] && [ $i -lt 1000 ]; do
+      sleep 0.01; i=$((i + 1))
+    done
+    sleep 0.02
+    ;;
+esac
+exit 0
+"""
+
+
+def _fake_bin(root: Path) -> Path:
+    bin_dir = root / "bin"
+    bin_dir.mkdir()
+    for name, body in [("tmux", FAKE_TMUX)] + [(c, "#!/bin/sh\nexit 0\n") for c in FAKE_CLIS]:
+        script = bin_dir / name
+        script.write_text(body)
+        script.chmod(0o755)
+    return bin_dir
+
+
+def bench_roles(n: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        bin_dir = _fake_bin(root)
+        project = root / "project"
+        (project / ".aether").mkdir(parents=True)
+        roles = {
+            f"role{i:03d}": {"description": f"Worker {i}", "cli": FAKE_CLIS[i % len(FAKE_CLIS)]}
+            for i in range(n)
+        }
+        (project / ".aether" / "roles.json").write_text(json.dumps(roles))
+        (project / ".aether" / "clis.json").write_text(
+            json.dumps({c: {"concurrency": 8} for c in FAKE_CLIS})
+        )
+
+        tmux_log = root / "tmux.log"
+        env = subprocess_env({
+            "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+            "AETHER_BENCH_TMUX_LOG": str(tmux_log),
+            "AETHER_BENCH_ROLES": str(n),
+        })
+        argv = [sys.executable, "-m", "aether.cli", "coordinate", "benchmark task",
+                "--launch", "--max-panes", str(n + 10)]
+        t0 = time.perf_counter()
+        proc = subprocess.run(argv, cwd=project, env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - t0
+        if proc.returncode != 0:
+            raise RuntimeError(f"coordinate --launch failed:\n{proc.stdout}{proc.stderr}")
+        done = sum(1 for line in proc.stdout.splitlines() if line.split()[2:3] == ["done"])
+        calls = len(tmux_log.read_text().splitlines())
+
+    return {
+        f"coordinate.launch.r{n}": metric(elapsed * 1000, "ms", roles=n, dispatched=done, tmux_calls=calls),
+        f"coordinate.launch.r{n}.per_role": metric(elapsed * 1000 / n, "ms"),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for n in QUICK_ROLE_COUNTS if quick else ROLE_COUNTS:
+        results.update(bench_roles(n))
+    return results
@@ -0,0 +1,107 @@
+"""Compare lock backend throughput and latency.
+
+Runs acquire / is_locked / release cycles against the file backend and
+the Redis-protocol backend (pointed at the in-process stand-in unless
+``--redis-url`` is given) and reports ops/s plus p50/p99 latency.
+
+Usage:
+    python benchmarks/bench_lock_backends.py [--ops 2000] [--redis-url redis://...] [--json]
+"""
+
+import argparse
+import json
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from aether.utils import lockfile
+from aether.utils.redis_lock import RedisLockBackend
+from aether.utils.redis_stub import StubRedisServer
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def bench_backend(backend: lockfile.LockBackend, ops: int) -> dict:
+    """Time *ops* acquire+is_locked+release cycles on distinct paths."""
+    latencies = {"acquire": [], "is_locked": [], "release": []}
+    start = time.perf_counter()
+    for i in range(ops):
+        path = f"src/module_{i}.py"
+        for op, call in (
+            ("acquire", lambda: backend.acquire(path, role="bench")),
+            ("is_locked", lambda: backend.is_locked(path)),
+            ("release", lambda: backend.release(path)),
+        ):
+            t0 = time.perf_counter()
+            call()
+            latencies[op].append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - start
+
+    result = {"backend": backend.name, "ops": ops, "cycles_per_s": ops / elapsed}
+    for op, samples in latencies.items():
+        result[op] = {
+            "p50_us": _percentile(samples, 50) * 1e6,
+            "p99_us": _percentile(samples, 99) * 1e6,
+            "mean_us": statistics.fmean(samples) * 1e6,
+        }
+    return result
+
+
+def run(quick: bool = False) -> dict:
+    """Suite entry point for ``benchmarks/run.py``: cycles/s per backend."""
+    ops = 200 if quick else 2000
+    with tempfile.TemporaryDirectory() as tmpdir:
+        file_result = bench_backend(lockfile.FileLockBackend(Path(tmpdir)), ops)
+    with StubRedisServer() as server:
+        backend = RedisLockBackend.from_url(server.url)
+        redis_result = bench_backend(backend, ops)
+        backend.close()
+    return {
+        f"backends.{name}.cycles": {"value": r["cycles_per_s"], "unit": "cycles/s", "better": "higher"}
+        for name, r in (("file", file_result), ("redis_stub", redis_result))
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ops", type=int, default=2000)
+    parser.add_argument("--redis-url", help="Benchmark a real server instead of the stand-in")
+    parser.add_argument("--json", action="store_true", help="Emit JSON instead of a table")
+    args = parser.parse_args()
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        results.append(bench_backend(lockfile.FileLockBackend(Path(tmpdir)), args.ops))
+
+    if args.redis_url:
+        backend = RedisLockBackend.from_url(args.redis_url)
+        results.append(bench_backend(backend, args.ops))
+        backend.close()
+    else:
+        with StubRedisServer() as server:
+            backend = RedisLockBackend.from_url(server.url)
+            result = bench_backend(backend, args.ops)
+            result["backend"] = "redis (stand-in)"
+            results.append(result)
+            backend.close()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'BACKEND':<18}  {'CYCLES/S':>10}  {'OP':<10}  {'P50 µs':>9}  {'P99 µs':>9}")
+    print("-" * 64)
+    for r in results:
+        for op in ("acquire", "is_locked", "release"):
+            print(
+                f"{r['backend']:<18}  {r['cycles_per_s']:>10.0f}  {op:<10}  "
+                f"{r[op]['p50_us']:>9.1f}  {r[op]['p99_us']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
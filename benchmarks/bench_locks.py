@@ -0,0 +1,131 @@
+"""Lock subsystem throughput at different lock-table sizes, and under contention.
+
+For each size N the lock directory is pre-populated with N held locks,
+then we time acquire/release cycles on fresh paths and a full
+``list_locks()`` scan — the operations whose cost grows with the table.
+
+The contention benchmark starts several processes hammering the same few
+paths and reports successful acquisitions per second and the conflict
+rate.  A second phase has the same processes race for a set of paths
+nobody releases; every path must be granted exactly once, so any grant
+beyond that is a double grant.
+"""
+
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from harness import median_ms, metric, time_calls
+
+from aether.utils import lockfile
+
+SIZES = [10, 1_000, 100_000]
+QUICK_SIZES = [10, 1_000]
+
+
+def _populate(backend: lockfile.LockBackend, n: int) -> None:
+    for i in range(n):
+        backend.acquire(f"held/pkg_{i // 1000}/mod_{i}.py", role="holder")
+
+
+def bench_size(n: int, cycles: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        backend = lockfile.FileLockBackend(Path(tmpdir))
+        _populate(backend, n)
+
+        start = time.perf_counter()
+        for i in range(cycles):
+            path = f"bench/mod_{i}.py"
+            backend.acquire(path, role="bench")
+            backend.release(path)
+        cycles_per_s = cycles / (time.perf_counter() - start)
+
+        scans = time_calls(backend.list_locks, 3 if n >= 10_000 else 10)
+    return {
+        f"locks.n{n}.acquire_release": metric(cycles_per_s, "cycles/s", better="higher"),
+        f"locks.n{n}.list_locks": metric(median_ms(scans), "ms"),
+    }
+
+
+def _contend(root: str, hot: int, seconds: float, barrier, out) -> None:
+    backend = lockfile.FileLockBackend(Path(root))
+    role = f"worker-{multiprocessing.current_process().pid}"
+    barrier.wait()
+    acquired = conflicts = errors = i = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        path = f"hot/mod_{i % hot}.py"
+        i += 1
+        try:
+            if backend.acquire(path, role=role):
+                acquired += 1
+                backend.release(path)
+            else:
+                conflicts += 1
+        except (OSError, ValueError):
+            # Torn read of a lock file another worker is writing or removing
+            errors += 1
+    out.put((acquired, conflicts, errors))
+
+
+def _race(root: str, paths: int, barrier, out) -> None:
+    backend = lockfile.FileLockBackend(Path(root))
+    role = f"racer-{multiprocessing.current_process().pid}"
+    barrier.wait()
+    out.put(sum(1 for i in range(paths) if backend.acquire(f"race/mod_{i}.py", role=role)))
+
+
+def bench_double_grants(workers: int, paths: int) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        barrier = ctx.Barrier(workers)
+        out = ctx.Queue()
+        procs = [
+            ctx.Process(target=_race, args=(tmpdir, paths, barrier, out))
+            for _ in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        grants = sum(out.get() for _ in procs)
+        for p in procs:
+            p.join()
+    return {
+        f"locks.contention.w{workers}.double_grants": metric(grants - paths, "grants", paths=paths),
+    }
+
+
+def bench_contention(workers: int, hot: int, seconds: float) -> dict:
+    ctx = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        barrier = ctx.Barrier(workers)
+        out = ctx.Queue()
+        procs = [
+            ctx.Process(target=_contend, args=(tmpdir, hot, seconds, barrier, out))
+            for _ in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        totals = [out.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    acquired = sum(t[0] for t in totals)
+    conflicts = sum(t[1] for t in totals)
+    errors = sum(t[2] for t in totals)
+    attempts = max(acquired + conflicts + errors, 1)
+    key = f"locks.contention.w{workers}"
+    return {
+        f"{key}.acquisitions": metric(acquired / seconds, "acq/s", better="higher"),
+        f"{key}.conflict_rate": metric(conflicts / attempts, "ratio", workers=workers, hot_paths=hot),
+        f"{key}.error_rate": metric(errors / attempts, "ratio"),
+    }
+
+
+def run(quick: bool = False) -> dict:
+    results = {}
+    for n in QUICK_SIZES if quick else SIZES:
+        results.update(bench_size(n, 200 if quick else 2000))
+    results.update(bench_contention(workers=4, hot=4, seconds=1.0 if quick else 3.0))
+    results.update(bench_double_grants(workers=4, paths=300))
+    return results
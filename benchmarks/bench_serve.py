@@ -0,0 +1,74 @@
+"""Request latency through ``aether serve`` vs. a fresh ``aether`` process per call.
+
+Starts a server on a temporary Unix socket and times lock+unlock pairs
+and a ``coordinate`` print-mode call both ways: via the keep-alive
+client, and via ``python -m aether.cli ...`` subprocesses.
+"""
+
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from harness import median_ms, metric, subprocess_env, time_calls
+
+from aether.client import AetherClient, ServerError
+
+
+def _wait_ready(sock: Path, timeout: float = 10.0) -> AetherClient:
+    deadline = time.monotonic() + timeout
+    while True:
+        client = AetherClient(sock)
+        try:
+            client.health()
+            return client
+        except (ServerError, OSError):
+            client.close()
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.05)
+
+
+def run(quick: bool = False) -> dict:
+    repeat_cli = 3 if quick else 10
+    repeat_server = 50 if quick else 500
+    env = subprocess_env()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        sock = Path(tmpdir) / "aether.sock"
+        proc = subprocess.Popen(
+            [sys.executable, "-m", "aether.cli", "serve", "--socket", str(sock)],
+            cwd=tmpdir, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            client = _wait_ready(sock)
+
+            def lock_pair_server():
+                client.lock("src/bench.py", role="bench")
+                client.unlock("src/bench.py")
+
+            def lock_pair_cli():
+                for argv in (["lock", "src/bench.py", "--role", "bench"], ["unlock", "src/bench.py"]):
+                    subprocess.run([sys.executable, "-m", "aether.cli", *argv],
+                                   cwd=tmpdir, env=env, capture_output=True, check=True)
+
+            server_lock = time_calls(lock_pair_server, repeat_server)
+            cli_lock = time_calls(lock_pair_cli, repeat_cli)
+            server_coord = time_calls(lambda: client.command("coordinate", "bench task"), repeat_server // 5)
+            cli_coord = time_calls(
+                lambda: subprocess.run([sys.executable, "-m", "aether.cli", "coordinate", "bench task"],
+                                       cwd=tmpdir, env=env, capture_output=True, check=True),
+                repeat_cli,
+            )
+            client.close()
+        finally:
+            proc.terminate()
+            proc.wait(10)
+
+    return {
+        "serve.lock_unlock": metric(median_ms(server_lock), "ms"),
+        "serve.lock_unlock.cli": metric(median_ms(cli_lock), "ms"),
+        "serve.coordinate": metric(median_ms(server_coord), "ms"),
+        "serve.coordinate.cli": metric(median_ms(cli_coord), "ms"),
+    }
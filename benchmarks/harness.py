@@ -0,0 +1,102 @@
+"""Shared helpers for the benchmark suite: timing, result records, baselines.
+
+Every benchmark reports named metrics as::
+
+    {"value": 12.3, "unit": "ms", "better": "lower"}
+
+``better`` tells :func:`compare` which direction is a regression.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+# Always benchmark this checkout, not whatever aether is installed
+REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def metric(value: float, unit: str, better: str = "lower", **extra) -> dict:
+    return {"value": value, "unit": unit, "better": better, **extra}
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def time_calls(fn: Callable[[], object], repeat: int) -> List[float]:
+    """Return wall-clock seconds for *repeat* calls of *fn*."""
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def median_ms(samples: List[float]) -> float:
+    return statistics.median(samples) * 1000
+
+
+def subprocess_env(extra: Optional[dict] = None) -> dict:
+    """Environment for child ``python -m aether.cli`` runs of this checkout."""
+    path = os.environ.get("PYTHONPATH")
+    env = {**os.environ, "PYTHONPATH": f"{REPO_ROOT}{os.pathsep}{path}" if path else str(REPO_ROOT)}
+    return {**env, **(extra or {})}
+
+
+def environment() -> dict:
+    try:
+        rev = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=REPO_ROOT,
+        ).stdout.strip()
+    except OSError:
+        rev = ""
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "git": rev or None,
+    }
+
+
+def save(path: Path, results: Dict[str, dict]) -> None:
+    Path(path).write_text(json.dumps({"env": environment(), "results": results}, indent=2))
+
+
+def load(path: Path) -> Dict[str, dict]:
+    return json.loads(Path(path).read_text())["results"]
+
+
+def compare(current: Dict[str, dict], baseline: Dict[str, dict], threshold: float) -> List[dict]:
+    """Return one row per metric present in both runs, flagging regressions.
+
+    A metric regresses when it is worse than the baseline by more than
+    *threshold* (0.2 = 20%) in its ``better`` direction.  Correctness
+    counters such as error rates and double grants are 0 when healthy, so
+    from a 0 baseline any move in the worse direction is a regression.
+    """
+    rows = []
+    for name in sorted(set(current) & set(baseline)):
+        cur, base = current[name]["value"], baseline[name]["value"]
+        if base:
+            change = (cur - base) / base
+        else:
+            change = 0.0 if cur == base else math.copysign(math.inf, cur)
+        worse = change > threshold if current[name]["better"] == "lower" else change < -threshold
+        rows.append({"name": name, "baseline": base, "current": cur,
+                     "unit": current[name]["unit"], "change": change, "regression": worse})
+    return rows
@@ -0,0 +1,101 @@
+"""Run the benchmark suite and optionally compare against a saved baseline.
+
+Suites:
+    cli         cold start of every subcommand (fresh process each time)
+    locks       lock throughput at 10 / 1k / 100k held locks, plus
+                multi-process contention
+    backends    file vs Redis-protocol lock backend
+    briefs      compiled brief rendering for 2000 tasks × 100 roles
+    serve       request latency via ``aether serve`` vs. a process per call
+    coordinate  ``coordinate --launch`` with 5 / 25 / 100 roles on a fake tmux
+
+Usage:
+    python benchmarks/run.py [--suite cli,locks] [--quick] [--output results.json]
+    python benchmarks/run.py --baseline baseline.json [--threshold 0.2]
+
+With ``--baseline`` the exit status is 1 if any metric regressed by more
+than ``--threshold`` (default 20%), so CI can gate on it.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import harness
+
+SUITES = ["cli", "locks", "backends", "briefs", "serve", "coordinate"]
+
+
+def _load_suite(name: str):
+    if name == "cli":
+        import bench_cli as mod
+    elif name == "locks":
+        import bench_locks as mod
+    elif name == "backends":
+        import bench_lock_backends as mod
+    elif name == "briefs":
+        import bench_briefs as mod
+    elif name == "serve":
+        import bench_serve as mod
+    else:
+        import bench_coordinate as mod
+    return mod
+
+
+def _fmt(value: float) -> str:
+    return f"{value:.3f}" if abs(value) < 10 else f"{value:.1f}"
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--suite", default=",".join(SUITES),
+                        help=f"Comma-separated subset of: {', '.join(SUITES)}")
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes and fewer repeats")
+    parser.add_argument("--output", "-o", type=Path, help="Write results as JSON to this file")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON instead of a table")
+    parser.add_argument("--baseline", type=Path, help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Relative change that counts as a regression (default 0.2)")
+    args = parser.parse_args(argv)
+
+    names = [s.strip() for s in args.suite.split(",") if s.strip()]
+    unknown = [s for s in names if s not in SUITES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+
+    results = {}
+    for name in names:
+        print(f"… {name}", file=sys.stderr)
+        results.update(_load_suite(name).run(quick=args.quick))
+
+    if args.output:
+        harness.save(args.output, results)
+    if args.json:
+        print(json.dumps({"env": harness.environment(), "results": results}, indent=2))
+    else:
+        print(f"{'METRIC':<44}  {'VALUE':>12}  UNIT")
+        for key, m in results.items():
+            print(f"{key:<44}  {_fmt(m['value']):>12}  {m['unit']}")
+
+    if not args.baseline:
+        return 0
+
+    rows = harness.compare(results, harness.load(args.baseline), args.threshold)
+    print(f"\n{'METRIC':<44}  {'BASELINE':>12}  {'CURRENT':>12}  {'CHANGE':>8}")
+    for row in rows:
+        flag = "  ✗ regression" if row["regression"] else ""
+        print(
+            f"{row['name']:<44}  {_fmt(row['baseline']):>12}  {_fmt(row['current']):>12}  "
+            f"{row['change']:>+8.1%}{flag}"
+        )
+    regressions = [r for r in rows if r["regression"]]
+    if regressions:
+        print(f"\n✗ {len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+        return 1
+    print(f"\n✓ No regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -90,6 +90,56 @@ def test_init_placeholders_substituted():
             os.chdir(original)
 
 
+def test_init_update_merges_template_changes(monkeypatch):
+    import shutil
+
+    from aether.commands import init as init_cmd
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        templates = Path(tmpdir) / "templates"
+        shutil.copytree(init_cmd._TEMPLATES_DIR, templates)
+        monkeypatch.setattr(init_cmd, "_TEMPLATES_DIR", templates)
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            assert runner.invoke(app, ["init", "Bot"]).exit_code == 0
+            assert (Path("Bot") / ".aether" / "manifest.json").exists()
+
+            # Nothing changed upstream: every file is skipped by hash
+            result = runner.invoke(app, ["init", "Bot", "--update"])
+            assert result.exit_code == 0 and "3 unchanged" in result.output
+
+            # User edits the agent; upstream edits both the agent and project templates
+            agent = Path("Bot") / "agents" / "bot.na"
+            agent.write_text(agent.read_text() + "# my notes\n")
+            example = templates / "agents" / "example.na"
+            example.write_text("# upstream header\n" + example.read_text())
+            project = templates / "project.dana"
+            project.write_text(project.read_text() + "# upstream footer\n")
+
+            result = runner.invoke(app, ["init", "Bot", "--update"])
+            assert result.exit_code == 0, result.output
+            assert "Merged template changes into agents/bot.na" in result.output
+            assert "Updated project.dana" in result.output
+            text = agent.read_text()
+            assert text.startswith("# upstream header") and text.endswith("# my notes\n")
+
+            # Plain init no longer clobbers local edits
+            result = runner.invoke(app, ["init", "Bot"])
+            assert "agents/bot.na has local changes" in result.output
+            assert agent.read_text() == text
+
+            # Conflicting edits to the same line are marked
+            lines = text.splitlines(keepends=True)
+            agent.write_text("# my header\n" + "".join(lines[1:]))
+            example.write_text("# upstream header v2\n" + "".join(example.read_text().splitlines(keepends=True)[1:]))
+            result = runner.invoke(app, ["init", "Bot", "--update"])
+            assert result.exit_code == 1
+            assert "<<<<<<< yours\n# my header\n=======\n# upstream header v2\n>>>>>>> template" in agent.read_text()
+        finally:
+            os.chdir(original)
+
+
 # ── coordinate ───────────────────────────────────────────────────────────────
 
 
@@ -107,6 +157,47 @@ def test_coordinate_dana_intent():
     assert "intent" in result.output
 
 
+def test_coordinate_keeps_dispatching_after_detach(monkeypatch):
+    import json
+
+    from aether.utils import tmux
+
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        try:
+            Path(".aether").mkdir()
+            Path(".aether/roles.json").write_text(json.dumps({"analyst": {"cli": "claude"}}))
+            statuses = {}
+
+            def send(pane, cli_path, brief, channel, status):
+                statuses[channel] = (status, "1" if cli_path.endswith("claude") else "0")
+
+            def wait_for(channel):
+                time.sleep(0.2)  # The CLI runs for a while after the user detaches
+                path, code = statuses[channel]
+                path.write_text(code)
+
+            monkeypatch.setattr(tmux, "detect_cli_tools", lambda: {"claude": "/bin/claude", "gemini": "/bin/gemini"})
+            monkeypatch.setattr(tmux, "tmux_available", lambda: True)
+            monkeypatch.setattr(tmux, "session_exists", lambda name: False)
+            monkeypatch.setattr(tmux, "pane_counts", lambda: {})
+            monkeypatch.setattr(tmux, "list_panes", lambda session: [])
+            monkeypatch.setattr(tmux, "create_session", lambda name: True)
+            monkeypatch.setattr(tmux, "create_named_pane", lambda session, role, first=False: f"%{role}")
+            monkeypatch.setattr(tmux, "send_prompt_and_signal", send)
+            monkeypatch.setattr(tmux, "wait_for", wait_for)
+            monkeypatch.setattr(tmux, "attach_session", lambda name: None)  # Detached at once
+
+            result = runner.invoke(app, ["coordinate", "task", "--launch", "--no-capture"])
+            assert result.exit_code == 0, result.output
+            assert "0 brief(s) queued and 1 running" in result.output
+            row = [l for l in result.output.splitlines() if l.startswith("analyst")][0]
+            assert "gemini" in row and "done" in row and "claude, gemini" in row
+        finally:
+            os.chdir(original)
+
+
 # ── agent ─────────────────────────────────────────────────────────────────────
 
 
@@ -178,7 +269,7 @@ def test_lockfile_stale_expiry():
 
         # Manually patch the lock file to be in the past
         from datetime import datetime, timezone, timedelta
-        lp = list((root / ".aether" / "locks").glob("*.lock"))[0]
+        lp = list((root / ".aether" / "locks").rglob("*.lock"))[0]
         import json
         data = json.loads(lp.read_text())
         data["acquired"] = (
@@ -193,6 +284,29 @@ def test_lockfile_stale_expiry():
         assert lockfile.acquire(fp, role="new_role", project_root=root)
 
 
+def test_lockfile_removal_race_reports_the_lock_it_could_not_restore(monkeypatch):
+    from aether.utils import lockevents
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        be = lockfile.FileLockBackend(root, events=lockevents.EventLog(root))
+        be.acquire("f.py", role="r1")
+        lp = lockfile._lock_path(root, "f.py")
+        real_rename = os.rename
+
+        def rename_then_race(src, dst):
+            real_rename(src, dst)
+            if Path(src) == lp:  # r2 creates the lock before r1's can be linked back
+                lockfile.FileLockBackend(root).acquire("f.py", role="r2")
+
+        monkeypatch.setattr(lockfile.os, "rename", rename_then_race)
+        # A removal acting on an outdated read of the lock
+        assert be._remove(lp, b"outdated") is False
+        assert be.is_locked("f.py")["role"] == "r2"
+        lost = [e for e in lockevents.read_events(root) if e["event"] == "lost"]
+        assert lost[0]["role"] == "r1" and lost[0]["holder"] == "r2"
+
+
 def test_lockfile_list_locks():
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -202,3 +316,1103 @@ def test_lockfile_list_locks():
         assert len(locks) == 2
         roles = {l["role"] for l in locks}
         assert roles == {"r1", "r2"}
+
+
+def test_lockfile_sharded_layout_reads_legacy_locks():
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        deep = "/".join(["very_long_directory_name"] * 20) + "/module.py"
+        assert lockfile.acquire(deep, role="r1", project_root=root)
+
+        lock_dir = root / ".aether" / "locks"
+        (lp,) = lock_dir.rglob("*.lock")
+        assert lp.parent.parent.parent == lock_dir
+        assert len(lp.stem) == 64
+        assert json.loads(lp.read_text())["file"] == deep
+
+        # A lock left behind in the old flat layout is still honoured
+        legacy = lockfile._legacy_lock_path(root, "src/old.py")
+        legacy.write_text(json.dumps(lockfile._new_payload("src/old.py", "r2", None)))
+        assert {l["file"] for l in lockfile.list_locks(project_root=root)} == {deep, "src/old.py"}
+        assert not lockfile.acquire("src/old.py", role="r3", project_root=root)
+        assert not legacy.exists()  # Moved into its shard on first touch
+        assert lockfile.release("src/old.py", project_root=root)["role"] == "r2"
+        assert [l["file"] for l in lockfile.list_locks(project_root=root)] == [deep]
+
+
+def test_lockfile_racing_acquirers_get_exclusive_grants():
+    from concurrent.futures import ThreadPoolExecutor
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        paths = [f"race/mod_{i}.py" for i in range(200)]
+
+        def worker(n):
+            backend = lockfile.FileLockBackend(root)
+            return sum(1 for p in paths[n:] + paths[:n] if backend.acquire(p, role=f"w{n}"))
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            grants = sum(pool.map(worker, [0, 50, 100, 150]))
+        assert grants == len(paths)
+        assert not [p for p in (root / ".aether" / "locks").rglob("*") if p.suffix in (".tmp", ".del")]
+
+
+# ── env ───────────────────────────────────────────────────────────────────────
+
+
+def test_config_dedupes_env_keys(monkeypatch):
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            Path(".env").write_text(
+                "# keys\nOPENROUTER_API_KEY=old\n\nGROQ_API_KEY=g\nOPENROUTER_API_KEY=older\n"
+            )
+            for key in ("sk-1", "sk-2"):
+                result = runner.invoke(app, ["config", "-p", "openrouter", "-k", key])
+                assert result.exit_code == 0, result.output
+            lines = Path(".env").read_text().splitlines()
+            assert lines == ["# keys", "OPENROUTER_API_KEY=sk-2", "", "GROQ_API_KEY=g"]
+        finally:
+            os.chdir(original)
+
+
+def test_set_env_key_keeps_env_private(monkeypatch):
+    from aether.utils import set_env_key
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / ".env"
+        assert set_env_key("OPENAI_API_KEY", "sk-1", str(path))
+        assert path.stat().st_mode & 0o777 == 0o600
+
+        path.chmod(0o640)
+        assert not set_env_key("OPENAI_API_KEY", "sk-2", str(path))
+        assert path.stat().st_mode & 0o777 == 0o640
+        assert sorted(p.name for p in Path(tmpdir).iterdir()) == [".env"]
+
+
+def test_read_env_cached_until_modified(monkeypatch):
+    monkeypatch.delenv("DANA_MODEL", raising=False)
+    from aether.utils import child_env, read_env
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / ".env"
+        path.write_text("DANA_MODEL=openrouter:gpt-4o-mini\n")
+        first = read_env(str(path))
+        assert first == {"DANA_MODEL": "openrouter:gpt-4o-mini"}
+        assert read_env(str(path)) is first
+
+        path.write_text("DANA_MODEL=openai:gpt-4o\n")
+        os.utime(path, ns=(0, 1))
+        assert read_env(str(path))["DANA_MODEL"] == "openai:gpt-4o"
+
+        # The child gets the snapshot; the parent environment is untouched
+        assert child_env(str(path))["DANA_MODEL"] == "openai:gpt-4o"
+        assert "DANA_MODEL" not in os.environ
+
+
+def test_run_memo_replays_until_inputs_change(monkeypatch):
+    from aether.utils import runcache
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        bin_dir = root / "bin"
+        bin_dir.mkdir()
+        dana = bin_dir / "dana"
+        dana.write_text(f"#!/bin/sh\necho run >> {root}/calls\necho \"result $*\"\n")
+        dana.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+        monkeypatch.delenv("DANA_MODEL", raising=False)
+
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            Path("agents").mkdir()
+            Path("agents/helper.na").write_text("from agents.leaf import x\n")
+            Path("agents/leaf.na").write_text("x = 1\n")
+            Path("project.dana").write_text("from agents.helper import x\nfrom datetime import date\n")
+            assert [p.name for p in runcache.dependencies(Path("project.dana"))] == [
+                "helper.na", "leaf.na", "project.dana"
+            ]
+
+            def run(*args):
+                result = runner.invoke(app, ["run", "--memo", *args])
+                assert result.exit_code == 0, result.output
+                return result.output
+
+            run()
+            assert "replaying cached output" in run()
+            monkeypatch.setenv("OPENAI_API_KEY", "sk-secret")  # Secrets don't count
+            assert "replaying cached output" in run()
+            monkeypatch.setenv("DANA_MODEL", "openai:gpt-4o")
+            assert "replaying cached output" not in run()
+            Path("agents/leaf.na").write_text("x = 2\n")  # Transitive import changed
+            assert "replaying cached output" not in run()
+            assert "result project.dana a" in run("project.dana", "a")
+            assert len((root / "calls").read_text().splitlines()) == 4
+
+            # LRU eviction keeps the store within its byte budget
+            runcache.store("f" * 64, 0, b"x" * 200, limit=10_000)
+            assert runcache.lookup("f" * 64) is not None
+            runcache.evict(limit=0)
+            assert runcache.lookup("f" * 64) is None
+        finally:
+            os.chdir(original)
+
+
+# ── lock backends ─────────────────────────────────────────────────────────────
+
+
+def test_redis_backend_against_stub():
+    from aether.utils.redis_lock import RedisLockBackend
+    from aether.utils.redis_stub import StubRedisServer
+
+    with StubRedisServer() as server:
+        backend = RedisLockBackend.from_url(server.url)
+        try:
+            assert lockfile.acquire("src/a.py", role="frontend", backend=backend)
+            assert not lockfile.acquire("src/a.py", role="backend", backend=backend)
+            info = lockfile.is_locked("src/a.py", backend=backend)
+            assert info["role"] == "frontend"
+
+            assert lockfile.acquire("src/b.py", role="backend", backend=backend)
+            assert {i["file"] for i in lockfile.list_locks(backend=backend)} == {
+                "src/a.py",
+                "src/b.py",
+            }
+
+            released = lockfile.release("src/a.py", backend=backend)
+            assert released["role"] == "frontend"
+            assert lockfile.is_locked("src/a.py", backend=backend) is None
+        finally:
+            backend.close()
+
+
+def test_redis_backend_fencing_tokens():
+    from aether.utils.redis_lock import RedisLockBackend
+    from aether.utils.redis_stub import StubRedisServer
+
+    with StubRedisServer() as server:
+        backend = RedisLockBackend.from_url(server.url)
+        try:
+            first = backend.acquire("f.py", role="r1")["token"]
+            assert backend.is_locked("f.py")["token"] == first
+            backend.release("f.py")
+            second = backend.acquire("f.py", role="r2")["token"]
+            assert second > first
+
+            # A holder with an outdated token cannot release the new lock
+            assert backend.release("f.py", token=first) is None
+            assert backend.release("f.py", token=second)["role"] == "r2"
+
+            # Nor can a caller acting on lock info it read before a re-acquire
+            seen = backend.acquire("f.py", role="r1")
+            backend.release("f.py")
+            backend.acquire("f.py", role="r3")
+            assert backend.release("f.py", expected=seen) is None
+            assert backend.is_locked("f.py")["role"] == "r3"
+        finally:
+            backend.close()
+
+
+def test_redis_force_acquire_is_atomic_across_hosts():
+    from aether.utils import lockevents
+    from aether.utils.redis_lock import RedisLockBackend
+    from aether.utils.redis_stub import StubRedisServer
+
+    with StubRedisServer() as server, tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        ours = RedisLockBackend.from_url(server.url, events=lockevents.EventLog(root))
+        other_host = RedisLockBackend.from_url(server.url)
+        try:
+            ours.acquire("f.py", role="r1")
+            execute = ours.client.execute
+            raced = []
+
+            def execute_with_race(*args):
+                reply = execute(*args)
+                if args[0] == "GET" and not raced:
+                    raced.append(other_host.acquire("f.py", role="r3", force=True))
+                return reply
+
+            ours.client.execute = execute_with_race
+            ours.acquire("f.py", role="r2", force=True)
+            assert ours.is_locked("f.py")["role"] == "r2"
+            steal = [e for e in lockevents.read_events(root) if e["event"] == "steal"]
+            assert steal[-1]["previous_role"] == "r3"
+        finally:
+            ours.close()
+            other_host.close()
+
+
+def test_lock_cli_prints_and_checks_fencing_token(monkeypatch):
+    from aether.utils.redis_stub import StubRedisServer
+
+    original = Path.cwd()
+    with StubRedisServer() as server, tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        monkeypatch.setenv(lockfile.LOCK_URL_ENV, server.url)
+        try:
+            result = runner.invoke(app, ["lock", "f.py", "-r", "r1"])
+            assert result.exit_code == 0, result.output
+            token = int(result.output.split("token=")[1])
+
+            stale = runner.invoke(app, ["unlock", "f.py", "--token", str(token + 1)])
+            assert stale.exit_code == 1 and "Not released" in stale.output
+            assert runner.invoke(app, ["unlock", "f.py", "--token", str(token)]).exit_code == 0
+            assert lockfile.is_locked("f.py") is None
+        finally:
+            for backend in lockfile._NETWORK_BACKENDS.values():
+                backend.close()
+            lockfile._NETWORK_BACKENDS.clear()
+            os.chdir(original)
+
+
+def test_incomplete_backend_fails_at_construction():
+    class Partial(lockfile.LockBackend):
+        def acquire(self, filepath, role, cli_tool=None, force=False):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_get_backend_from_env(monkeypatch):
+    monkeypatch.delenv(lockfile.LOCK_URL_ENV, raising=False)
+    assert isinstance(lockfile.get_backend(Path(".")), lockfile.FileLockBackend)
+    assert lockfile.get_backend(url="redis://127.0.0.1:1/0").name == "redis"
+
+
+# ── lock events ───────────────────────────────────────────────────────────────
+
+
+def test_lock_events_logged():
+    from aether.utils import lockevents
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        lockfile.acquire("a.py", role="r1", project_root=root)
+        lockfile.acquire("a.py", role="r2", project_root=root, force=True)
+        lockfile.release("a.py", project_root=root)
+
+        events = list(lockevents.read_events(root))
+        assert [e["event"] for e in events] == ["acquire", "steal", "release"]
+        assert events[1]["role"] == "r2"
+        assert events[1]["previous_role"] == "r1"
+
+
+def test_lock_events_rotate_and_follow():
+    import threading
+
+    from aether.utils import lockevents
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        log = lockevents.EventLog(root, max_bytes=400, backups=2)
+
+        def writer():
+            time.sleep(0.05)
+            for i in range(10):
+                log.emit("acquire", {"file": f"f{i}.py", "role": "r"})
+
+        t = threading.Thread(target=writer)
+        t.start()
+        seen = [e["file"] for e in lockevents.follow(root, idle_timeout=0.5)]
+        t.join()
+
+        assert seen == [f"f{i}.py" for i in range(10)]
+        assert (root / ".aether" / "events" / "locks.jsonl.1").exists()
+        assert not (root / ".aether" / "events" / "locks.jsonl.3").exists()
+
+
+def test_follow_drains_file_before_rotation(monkeypatch):
+    from aether.utils import lockevents
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        log = lockevents.EventLog(root, max_bytes=1, backups=2)
+        real_stat = os.stat
+        armed = [True]
+
+        def stat(path, *args, **kwargs):
+            # Append and rotate in the gap between follow's empty read and its inode check
+            if armed[0] and Path(path) == log.path:
+                armed[0] = False
+                log.emit("acquire", {"file": "late.py", "role": "r"})
+                log.path.touch()
+            return real_stat(path, *args, **kwargs)
+
+        log.path.parent.mkdir(parents=True)
+        log.path.touch()
+        monkeypatch.setattr(lockevents.os, "stat", stat)
+        seen = [e["file"] for e in lockevents.follow(root, idle_timeout=0.3)]
+        assert seen == ["late.py"]
+
+
+# ── lock metrics ──────────────────────────────────────────────────────────────
+
+
+def test_lock_metrics_fold_incrementally():
+    from aether.utils.lockmetrics import LockMetrics
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        lockfile.acquire("hot.py", role="r1", project_root=root)
+        assert not lockfile.acquire("hot.py", role="r2", project_root=root)
+        lockfile.release("hot.py", project_root=root)
+        assert lockfile.acquire("hot.py", role="r2", project_root=root)
+
+        metrics = LockMetrics.load(root)
+        assert metrics.update() == 4
+        metrics.save()
+
+        hot = metrics.files["hot.py"]
+        assert hot["acquisitions"] == 2
+        assert hot["conflicts"] == 1
+        assert hot["hold"]["count"] == 1
+        assert metrics.roles["r2"]["wait"]["count"] == 1
+
+        # Reloading resumes from the cursor instead of re-reading the log
+        lockfile.release("hot.py", project_root=root)
+        metrics = LockMetrics.load(root)
+        assert metrics.update() == 1
+        assert metrics.files["hot.py"]["hold"]["count"] == 2
+        assert 'aether_lock_file_conflicts_total{file="hot.py"} 1' in metrics.to_prometheus()
+
+
+def test_lock_metrics_report_events_rotated_out_unread():
+    from aether.utils import lockevents
+    from aether.utils.lockmetrics import LockMetrics
+
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        try:
+            log = lockevents.EventLog(max_bytes=200, backups=1)
+            log.emit("acquire", {"file": "a.py", "role": "r"})
+            metrics = LockMetrics.load()
+            metrics.update()
+            metrics.save()
+            assert metrics.gaps == 0
+
+            for _ in range(10):  # Several rotations before the next fold
+                log.emit("acquire", {"file": "a.py", "role": "r"})
+            metrics = LockMetrics.load()
+            metrics.update()
+            assert metrics.gaps == 1
+            assert metrics.update() == 0 and metrics.gaps == 1  # Counted once
+            metrics.save()
+
+            assert "aether_lock_event_gaps_total 1" in metrics.to_prometheus()
+            result = runner.invoke(app, ["locks", "--stats"])
+            assert "rotated past unread events 1 time(s)" in result.output
+        finally:
+            os.chdir(original)
+
+
+def test_blocked_wait_counts_one_conflict_and_records_wait():
+    from aether.utils.lockmetrics import LockMetrics
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            lockfile.acquire("hot.py", role="r1")
+            result = runner.invoke(app, ["lock", "hot.py", "-r", "r2", "--wait", "1.5"])
+            assert result.exit_code == 1, result.output
+
+            metrics = LockMetrics.load()
+            metrics.update()
+            assert metrics.files["hot.py"]["conflicts"] == 1
+            wait = metrics.roles["r2"]["wait"]
+            assert wait["count"] == 1 and wait["sum"] >= 1.0
+            assert not metrics.pending
+        finally:
+            os.chdir(original)
+
+
+def test_locks_stats_command():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            runner.invoke(app, ["lock", "a.py", "--role", "r1"])
+            runner.invoke(app, ["lock", "a.py", "--role", "r2"])
+            result = runner.invoke(app, ["locks", "--stats", "--prom-file", "m.prom"])
+            assert result.exit_code == 0, result.output
+            assert "a.py" in result.output
+            assert "aether_lock_role_conflicts_total" in Path("m.prom").read_text()
+        finally:
+            os.chdir(original)
+
+
+# ── deadlock ──────────────────────────────────────────────────────────────────
+
+
+def test_deadlock_detected_and_broken():
+    from aether.utils import deadlock, lockevents
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        lockfile.acquire("a.py", role="r1", project_root=root)
+        time.sleep(0.01)
+        lockfile.acquire("b.py", role="r2", project_root=root)
+
+        assert deadlock.register_wait("b.py", "r1", project_root=root) is None
+        graph = deadlock.wait_for_graph(root)
+        assert graph["edges"] == [{"waiter": "r1", "file": "b.py", "holder": "r2"}]
+        assert graph["cycles"] == []
+
+        report = deadlock.register_wait("a.py", "r2", project_root=root)
+        assert report["cycle"] == ["r2", "r1"]
+        # Youngest lock in the cycle is r2's lock on b.py
+        assert report["victim"] == "r2"
+        assert report["released"] == "b.py"
+        assert lockfile.is_locked("b.py", project_root=root) is None
+        assert any(e["event"] == "deadlock" for e in lockevents.read_events(root))
+
+
+def test_deadlock_break_leaves_a_lock_taken_since(monkeypatch):
+    from aether.utils import deadlock
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        lockfile.acquire("a.py", role="r1", project_root=root)
+        time.sleep(0.01)
+        lockfile.acquire("b.py", role="r2", project_root=root)
+        deadlock.register_wait("b.py", "r1", project_root=root)
+
+        real_find = deadlock.find_cycle_from
+
+        def find_then_lose_race(*args):
+            cycle = real_find(*args)
+            # Another waiter broke the same cycle first and r3 took b.py straight after
+            lockfile.release("b.py", project_root=root)
+            lockfile.acquire("b.py", role="r3", project_root=root)
+            return cycle
+
+        monkeypatch.setattr(deadlock, "find_cycle_from", find_then_lose_race)
+        assert deadlock.register_wait("a.py", "r2", project_root=root) is None
+        assert lockfile.is_locked("b.py", project_root=root)["role"] == "r3"
+
+        held = lockfile.is_locked("b.py", project_root=root)
+        assert lockfile.release("b.py", project_root=root, expected=held)["role"] == "r3"
+
+
+def test_dead_wait_records_are_ignored():
+    import json
+    import subprocess
+    import sys
+
+    from aether.utils import deadlock
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        lockfile.acquire("a.py", role="r1", project_root=root)
+        lockfile.acquire("b.py", role="r2", project_root=root)
+
+        # r1's waiter was killed mid-wait and left its record behind
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        deadlock.register_wait("b.py", "r1", project_root=root, timeout=30)
+        wp = deadlock._wait_path(root, "r1")
+        wp.write_text(json.dumps({**json.loads(wp.read_text()), "pid": dead.pid}))
+
+        assert deadlock.register_wait("a.py", "r2", project_root=root, timeout=1) is None
+        assert lockfile.is_locked("b.py", project_root=root)["role"] == "r2"
+        assert not wp.exists()
+
+        # A live waiter whose timeout has long passed is ignored as well
+        deadlock.register_wait("b.py", "r1", project_root=root, timeout=1)
+        wp.write_text(json.dumps({**json.loads(wp.read_text()), "since": time.time() - 60}))
+        assert deadlock.wait_for_graph(root)["edges"] == [
+            {"waiter": "r2", "file": "a.py", "holder": "r1"}
+        ]
+
+
+def test_deadlock_priority_policy():
+    import json
+
+    from aether.utils import deadlock
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        (root / ".aether").mkdir()
+        (root / ".aether" / "roles.json").write_text(
+            json.dumps({"r1": {"priority": 1}, "r2": {"priority": 5}})
+        )
+        lockfile.acquire("a.py", role="r1", project_root=root)
+        lockfile.acquire("b.py", role="r2", project_root=root)
+        deadlock.register_wait("b.py", "r1", project_root=root)
+        report = deadlock.register_wait("a.py", "r2", project_root=root, policy="priority")
+        assert report["victim"] == "r1"
+        assert report["released"] == "a.py"
+
+
+def test_locks_graph_command():
+    from aether.utils import deadlock
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            lockfile.acquire("a.py", role="r1")
+            deadlock.register_wait("a.py", "r2")
+            result = runner.invoke(app, ["locks", "--graph"])
+            assert result.exit_code == 0, result.output
+            assert "r2 ──a.py──▶ r1" in result.output
+        finally:
+            os.chdir(original)
+
+
+# ── collect ───────────────────────────────────────────────────────────────────
+
+
+def test_panelog_ring_is_bounded():
+    from aether.utils import panelog
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        ring = panelog.RingLog(Path(tmpdir), "analyst", segment_bytes=100, segments=3)
+        for i in range(100):
+            ring.write(f"line {i}\n".encode())
+        ring.close()
+
+        segments = panelog.list_segments(Path(tmpdir), "analyst")
+        assert len(segments) == 3
+        assert sum(p.stat().st_size for _, p in segments) <= 300
+        assert segments[-1][1].read_text().endswith("line 99\n")
+
+
+def test_outcome_collector_incremental():
+    from aether.utils import panelog
+    from aether.utils.outcomes import OutcomeCollector
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        log_dir = root / ".aether" / "panes" / "s1"
+        ring = panelog.RingLog(log_dir, "critic", segment_bytes=32, segments=10)
+        # The echoed brief mentions the markers inline; only bare lines count
+        ring.write(b"$ claude 'print it between <<<OUTCOME and OUTCOME>>>'\n")
+        ring.write(b"thinking...\n\x1b[1m<<<OUTCOME\x1b[0m\r\nNo gaps found.\nShip it.\nOUT")
+
+        collector = OutcomeCollector(log_dir, "s1", project_root=root)
+        assert collector.collect() == []
+        collector.save()
+
+        ring.write(b"COME>>>\nbye\n")
+        ring.close()
+        collector = OutcomeCollector(log_dir, "s1", project_root=root)
+        found = collector.collect()
+        collector.save()
+        assert [o["text"] for o in found] == ["No gaps found.\nShip it."]
+
+        # Nothing new on a second pass
+        assert OutcomeCollector(log_dir, "s1", project_root=root).collect() == []
+        assert (root / ".aether" / "outcomes" / "s1.json").exists()
+
+
+def test_collect_command():
+    from aether.utils import panelog
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            ring = panelog.RingLog(Path(".aether/panes/dana-dev"), "analyst")
+            ring.write(b"<<<OUTCOME\nUse a feature flag.\nOUTCOME>>>\n")
+            ring.close()
+            result = runner.invoke(app, ["collect", "--format", "markdown"])
+            assert result.exit_code == 0, result.output
+            assert "## analyst" in result.output
+            assert "Use a feature flag." in result.output
+        finally:
+            os.chdir(original)
+
+
+# ── scheduler ─────────────────────────────────────────────────────────────────
+
+
+def test_scheduler_balances_and_retries():
+    import threading
+
+    from aether.utils.scheduler import CliPool, Scheduler, role_candidates
+
+    available = {"claude": "/bin/claude", "gemini": "/bin/gemini"}
+    pool = CliPool(available, {"claude": {"concurrency": 1}, "gemini": {"concurrency": 1}})
+    scheduler = Scheduler(pool)
+    for role in ("analyst", "critic", "integrator"):
+        scheduler.submit(role, f"brief for {role}", role_candidates({"cli": "claude"}, available))
+    pinned = scheduler.submit("pinned", "brief", role_candidates(
+        {"cli": "grok", "alternates": []}, available
+    ))
+    assert pinned.status == "failed"
+
+    # Two roles share claude: the second is balanced onto gemini
+    assert scheduler.plan() == {"analyst": "claude", "critic": "gemini", "integrator": None}
+
+    def dispatch(job, cli):
+        time.sleep(0.02)
+        return not (job.role == "critic" and cli == "gemini")
+
+    jobs = {j.role: j for j in scheduler.run(dispatch)}
+    assert all(jobs[r].status == "done" for r in ("analyst", "critic", "integrator"))
+    assert jobs["critic"].tried == ["gemini", "claude"]
+    assert jobs["integrator"].wait_seconds > 0
+
+    # Without a configured cap, roles sharing the only installed CLI all start
+    only_claude = {"claude": "/bin/claude"}
+    uncapped = Scheduler(CliPool(only_claude, {}))
+    for role in ("analyst", "critic"):
+        uncapped.submit(role, "brief", role_candidates({"cli": "claude"}, only_claude))
+    assert uncapped.plan() == {"analyst": "claude", "critic": "claude"}
+
+    # wait_dispatched returns once everything startable is running, not finished
+    gate = threading.Event()
+    background = Scheduler(CliPool(only_claude, {}))
+    for role in ("analyst", "critic"):
+        background.submit(role, "brief", role_candidates({"cli": "claude"}, only_claude))
+    threading.Thread(target=background.run, args=(lambda job, cli: gate.wait(5),), daemon=True).start()
+    assert background.wait_dispatched(2)
+    assert [j.status for j in background.jobs] == ["running", "running"]
+    gate.set()
+
+
+# ── briefs ────────────────────────────────────────────────────────────────────
+
+
+def test_brief_templates_compile_once_and_render_lazily():
+    from aether.commands.coordinate import _outcome_brief
+    from aether.utils.briefs import RoleSet
+
+    role_set = RoleSet({
+        "analyst": {"description": "Finds patterns."},
+        "critic": {
+            "description": "Reviews.",
+            "brief": ["[{ROLE}] Review: {task!r}", "", "Focus on {focus}."],
+            "vars": {"focus": "security"},
+        },
+    })
+    # Roles without a template keep the built-in outcome brief
+    assert role_set.brief("analyst", "t") == _outcome_brief("analyst", "Finds patterns.", "t")
+    assert "<<<OUTCOME" in role_set.brief("analyst", "t")
+    assert role_set.brief("critic", "x") == "[CRITIC] Review: 'x'\n\nFocus on security."
+    assert role_set.first_line("critic", "x") == "[CRITIC] Review: 'x'"
+
+    rendered = list(role_set.render_many(["a", "b"], roles=["critic"]))
+    assert [(t, r) for t, r, _ in rendered] == [("a", "critic"), ("b", "critic")]
+
+    with pytest.raises(ValueError, match="undefined field"):
+        RoleSet({"x": {"brief": "{nope} {task}"}})
+
+
+def test_roles_json_cached_until_modified():
+    from aether.utils.briefs import load_role_set
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "roles.json"
+        path.write_text('{"critic": {"brief": "v1 {task}"}}')
+        first = load_role_set(path)
+        assert load_role_set(path) is first
+
+        path.write_text('{"critic": {"brief": "version2 {task}"}}')
+        second = load_role_set(path)
+        assert second is not first
+        assert second.brief("critic", "t") == "version2 t"
+
+        path.write_text('{"critic": {"brief": "{task.attr}"}}')
+        result = runner.invoke(app, ["coordinate", "t", "--roles", str(path)])
+        assert result.exit_code == 1
+        assert "bad brief template" in result.output
+
+
+# ── sessions ──────────────────────────────────────────────────────────────────
+
+
+def test_session_names_are_namespaced_per_task():
+    from aether.utils import sessions
+
+    a = sessions.session_name("Add dark mode toggle")
+    assert a == sessions.session_name("Add dark mode toggle")
+    assert a != sessions.session_name("Add light mode toggle")
+    assert a.startswith("aether-add-dark-mode-toggle-")
+    assert "." not in a and ":" not in a
+
+
+def test_sessions_kill_only_signals_its_own_coordinator(monkeypatch):
+    import json
+    import subprocess
+    import sys
+
+    from aether.utils import sessions
+
+    monkeypatch.setattr(sessions._tmux, "kill_session", lambda name: None)
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        script = Path(tmpdir) / "aether_stub.py"
+        script.write_text("import time\ntime.sleep(30)\n")
+        bystander = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"])
+        coordinator = subprocess.Popen([sys.executable, str(script), "coordinate", "task"])
+        try:
+            def record(name, pid):
+                d = Path(".aether/sessions")
+                d.mkdir(parents=True, exist_ok=True)
+                (d / f"{name}.json").write_text(json.dumps({
+                    "name": name, "pid": pid, "pid_started": sessions._process_start(pid),
+                    "created": time.time(), "panes": [],
+                }))
+
+            # Registering from a process that isn't `aether coordinate` (e.g. serve) records no PID
+            monkeypatch.setattr(sessions._tmux, "list_panes", lambda name: [])
+            monkeypatch.setattr(sys, "argv", ["aether", "serve"])
+            assert sessions.register("aether-served-000000", "t")["pid"] is None
+
+            # Dead session: its PID may have been reused, so nothing is signalled
+            monkeypatch.setattr(sessions._tmux, "session_exists", lambda name: False)
+            record("aether-dead-000000", coordinator.pid)
+            sessions.kill("aether-dead-000000")
+            # Live session whose PID now belongs to an unrelated process
+            monkeypatch.setattr(sessions._tmux, "session_exists", lambda name: True)
+            record("aether-reused-000000", bystander.pid)
+            sessions.kill("aether-reused-000000")
+            time.sleep(0.1)
+            assert bystander.poll() is None and coordinator.poll() is None
+
+            record("aether-live-000000", coordinator.pid)
+            sessions.kill("aether-live-000000")
+            assert coordinator.wait(5) == -15
+        finally:
+            bystander.kill()
+            coordinator.kill()
+            bystander.wait()
+            coordinator.wait()
+            os.chdir(original)
+
+
+def test_tmux_session_targets_match_exactly(monkeypatch):
+    import subprocess
+
+    from aether.utils import tmux
+
+    calls = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        # Only "dev2" is running, so a prefix match on "dev" would find it
+        code = 0 if argv[1] == "has-session" and argv[-1] in ("dev2", "dev") else 1
+        return subprocess.CompletedProcess(argv, code, "", "")
+
+    monkeypatch.setattr(tmux.subprocess, "run", fake_run)
+    assert tmux.create_session("dev") is True
+    tmux.attach_session("dev")
+    tmux.kill_session("dev")
+    targets = [argv[argv.index("-t") + 1] for argv in calls if "-t" in argv]
+    assert targets == ["=dev", "=dev", "=dev"]
+    assert ["tmux", "new-session", "-d", "-s", "dev"] in calls
+
+
+def test_sessions_gc_drops_dead_records():
+    import json
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        original = Path.cwd()
+        os.chdir(tmpdir)
+        try:
+            d = Path(".aether/sessions")
+            d.mkdir(parents=True)
+            (d / "aether-gone-000000.json").write_text(
+                json.dumps({"name": "aether-gone-000000", "task": "gone", "pid": 0,
+                            "created": time.time(), "panes": []})
+            )
+            result = runner.invoke(app, ["sessions", "list"])
+            assert result.exit_code == 0, result.output
+            assert "dead" in result.output
+
+            result = runner.invoke(app, ["sessions", "gc"])
+            assert "Removed aether-gone-000000" in result.output
+            assert not list(d.glob("*.json"))
+        finally:
+            os.chdir(original)
+
+
+# ── serve ─────────────────────────────────────────────────────────────────────
+
+
+def test_serve_handles_lock_and_command_requests():
+    import asyncio
+    import threading
+
+    from aether.client import AetherClient, ServerError
+    from aether.server import AetherServer
+
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        server = AetherServer()
+        sock = Path(tmpdir) / "aether.sock"
+        try:
+            listener = asyncio.run_coroutine_threadsafe(server.start(sock), loop).result(5)
+            with AetherClient(sock) as client, AetherClient(sock) as other:
+                assert client.health()["ok"]
+                assert client.lock("src/a.py", role="analyst")["acquired"]
+                held = other.lock("src/a.py", role="critic")
+                assert not held["acquired"] and held["holder"]["role"] == "analyst"
+                assert [l["file"] for l in client.list_locks()] == ["src/a.py"]
+                assert other.unlock("src/a.py")["role"] == "analyst"
+                assert client.is_locked("src/a.py") is None
+
+                code, output = client.command("agent", "summarise news")
+                assert code == 0 and "✓ Created" in output
+                assert Path("agents/summarise_news.na").exists()
+                assert client.command("agent", "summarise news")[0] == 1
+
+                with pytest.raises(ServerError) as err:
+                    client.request("/lock", {"file": "x"})
+                assert err.value.status == 400
+            loop.call_soon_threadsafe(listener.close)
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(5)
+        finally:
+            server.close()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+            os.chdir(original)
+
+
+def test_serve_commands_leave_the_environment_alone(monkeypatch):
+    from aether.server import AetherServer
+    from aether.utils import child_env, set_env_key
+
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        server = AetherServer()
+        try:
+            assert server._invoke(["config", "-p", "openai", "-k", "first"])["exit_code"] == 0
+            Path("other.env").write_text("GROQ_API_KEY=loaded\n")
+            assert server._invoke(["config", "--env", "other.env"])["exit_code"] == 0
+            assert "OPENAI_API_KEY" not in os.environ and "GROQ_API_KEY" not in os.environ
+
+            # So a later edit to .env is what /run's children see
+            set_env_key("OPENAI_API_KEY", "second", ".env")
+            assert child_env(".env")["OPENAI_API_KEY"] == "second"
+        finally:
+            server.close()
+            os.chdir(original)
+
+
+def test_serve_lock_calls_never_wait_behind_commands():
+    import asyncio
+    import threading
+
+    from aether.client import AetherClient
+    from aether.server import COMMAND_WORKERS, AetherServer
+
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        server = AetherServer()
+        sock = Path(tmpdir) / "aether.sock"
+        release = threading.Event()
+        invoked = []
+
+        def slow_invoke(argv):
+            invoked.append(argv)
+            release.wait(10)
+            return {"exit_code": 0, "output": ""}
+
+        server._invoke = slow_invoke
+        try:
+            listener = asyncio.run_coroutine_threadsafe(server.start(sock), loop).result(5)
+            # More slow commands than the command pool has threads
+            slow = [
+                threading.Thread(target=lambda: AetherClient(sock).command("lock", "x", "--wait", "20"))
+                for _ in range(COMMAND_WORKERS + 2)
+            ]
+            for t in slow:
+                t.start()
+            time.sleep(0.2)
+            with AetherClient(sock, timeout=2) as client:
+                assert client.lock("src/other.py", role="analyst")["acquired"]
+            assert len(invoked) == COMMAND_WORKERS
+
+            release.set()
+            for t in slow:
+                t.join(5)
+
+            with AetherClient(sock, timeout=2) as client:
+                client.command("coordinate", "task", "--launch")
+            assert invoked[-1][-2:] == ["--no-attach", "--no-wait"]
+            loop.call_soon_threadsafe(listener.close)
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(5)
+        finally:
+            release.set()
+            server.close()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+            os.chdir(original)
+
+
+def test_serve_tcp_requires_token_and_refuses_browser_requests():
+    import asyncio
+    import http.client
+    import json
+    import stat
+    import threading
+
+    from aether.client import AetherClient, ServerError
+    from aether.server import AetherServer
+
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+        server = AetherServer()
+        try:
+            listener = asyncio.run_coroutine_threadsafe(server.start(port=0), loop).result(5)
+            port = listener.sockets[0].getsockname()[1]
+            token_file = Path(f".aether/serve-{port}.token")
+            assert stat.S_IMODE(token_file.stat().st_mode) == 0o600
+
+            with AetherClient(port=port) as client:
+                assert client.lock("src/a.py", role="analyst")["acquired"]
+            with AetherClient(port=port, token="wrong") as client, pytest.raises(ServerError) as err:
+                client.list_locks()
+            assert err.value.status == 401
+
+            def post(headers):
+                conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+                body = json.dumps({"argv": ["config", "-p", "openai", "-k", "attacker"]})
+                conn.request("POST", "/command", body=body, headers=headers)
+                status = conn.getresponse().status
+                conn.close()
+                return status
+
+            auth = {"Authorization": f"Bearer {token_file.read_text()}"}
+            json_type = {"Content-Type": "application/json"}
+            assert post({**auth, "Content-Type": "text/plain"}) == 415
+            assert post({**auth, **json_type, "Origin": "http://evil.example"}) == 403
+            assert post({**auth, **json_type, "Host": f"evil.example:{port}"}) == 403
+            assert post(json_type) == 401
+            assert not Path(".env").exists()
+
+            loop.call_soon_threadsafe(listener.close)
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.05), loop).result(5)
+        finally:
+            server.close()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(5)
+            loop.close()
+            os.chdir(original)
+        assert not token_file.exists()
+
+
+
+# ── probe ─────────────────────────────────────────────────────────────────────
+
+
+def test_config_probe_ranks_providers_and_caches(monkeypatch):
+    import json
+
+    from aether.commands.config import PROVIDER_INFO
+    from aether.utils.mock_llm import MockLLMServer
+
+    for info in PROVIDER_INFO.values():
+        monkeypatch.delenv(info["env"], raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "good")
+    monkeypatch.setenv("GROQ_API_KEY", "bad")
+
+    original = Path.cwd()
+    with tempfile.TemporaryDirectory() as tmpdir:
+        os.chdir(tmpdir)
+        try:
+            with MockLLMServer(keys={"good"}, ttft={"gpt-4o": 0.15}) as server:
+                result = runner.invoke(app, ["config", "--probe", "--base-url", server.url])
+                assert result.exit_code == 0, result.output
+                lines = result.output.splitlines()
+                assert any(l.startswith("openai") and "gpt-4o-mini" in l and "✓ ok" in l for l in lines)
+                assert any(l.startswith("groq") and "✗ invalid key" in l for l in lines)
+                assert any(l.startswith("anthropic") and "no key" in l for l in lines)
+                assert "✓ Fastest: openai:gpt-4o-mini" in result.output
+                assert Path(".aether/cache/probe.json").exists()
+
+                again = runner.invoke(app, ["config", "--probe", "--base-url", server.url])
+                assert again.exit_code == 0
+                assert again.output.count("(cached)") == 2  # The failure was re-probed
+                cached = json.loads(Path(".aether/cache/probe.json").read_text())["results"]
+                assert {r["provider"] for r in cached} == {"openai"}
+                assert all("api_key" not in r for r in cached)
+
+                # Fixing the key is picked up straight away
+                monkeypatch.setenv("GROQ_API_KEY", "good")
+                fixed = runner.invoke(app, ["config", "--probe", "--base-url", server.url])
+                groq = [l for l in fixed.output.splitlines() if l.startswith("groq")]
+                assert "✓ ok" in groq[0] and "(cached)" not in groq[0]
+
+            # Server gone: --refresh probes again and reports the failure
+            gone = runner.invoke(app, ["config", "--probe", "--refresh", "--timeout", "2",
+                                       "-p", "openai", "--base-url", server.url])
+            assert gone.exit_code == 1
+            assert "✗ error" in gone.output and "No provider answered" in gone.output
+        finally:
+            os.chdir(original)
+
+
+def test_probe_rate_limit_waits_outside_the_concurrency_gate():
+    import asyncio
+
+    from aether.utils.mock_llm import MockLLMServer
+    from aether.utils.probe import probe_all
+
+    with MockLLMServer(keys={"good"}) as server:
+        def target(provider, model):
+            return {"provider": provider, "model": model, "api_model": model,
+                    "api_base": server.url, "api_key": "good"}
+
+        targets = [target("slow", f"m{i}") for i in range(3)] + [target("fast", "m")]
+        start = time.time()
+        results = asyncio.run(probe_all(targets, timeout=5, concurrency=1, rate=1.0))
+        assert all(r["status"] == "ok" for r in results)
+        # "slow" is paced at one probe a second; "fast" doesn't queue behind that
+        assert results[-1]["probed_at"] - start < 0.8
+        assert results[2]["probed_at"] - start >= 1.9
+
+
+def test_serve_refuses_public_hosts_and_passes_run_args_through():
+    from aether.server import _parse_run_argv
+
+    result = runner.invoke(app, ["serve", "--host", "0.0.0.0", "--port", "0"])
+    assert result.exit_code == 1
+    assert "refusing to listen on 0.0.0.0" in result.output
+
+    assert _parse_run_argv(["--memo", "main.na", "--", "--memo", "x"]) == {
+        "file": "main.na", "args": ["--memo", "x"], "memo": True,
+    }
+    assert _parse_run_argv(["main.na", "--", "--memo"])["memo"] is False
+
+
+def test_cli_import_stays_light():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, aether.cli; "
+        "print(sorted(m for m in ('asyncio', 'ssl', 'aether.server', 'aether.utils.probe') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"